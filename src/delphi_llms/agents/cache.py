@@ -0,0 +1,161 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Self
+
+# Fields that do not change what the model generates are left out of the key.
+_NON_SEMANTIC_FIELDS = {"stream", "keep_alive"}
+
+
+class CacheMissError(LookupError):
+    pass
+
+
+def request_key(payload: dict) -> str:
+    material = {k: v for k, v in payload.items() if k not in _NON_SEMANTIC_FIELDS}
+    encoded = json.dumps(material, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite store of raw Ollama generate responses keyed by a hash of the request payload.
+
+    In ``read_only`` (replay) mode nothing is written and a miss raises ``CacheMissError``
+    instead of falling through to the network.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_entries: int | None = None,
+        max_age_seconds: float | None = None,
+        read_only: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only and not self.path.exists():
+            raise FileNotFoundError(f"Response cache not found: {self.path}")
+        if self.read_only:
+            uri = f"{self.path.resolve().as_uri()}?mode=ro"
+            return sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=30.0)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        conn.execute("pragma journal_mode=wal")
+        conn.execute(
+            """
+            create table if not exists responses (
+              key text primary key,
+              model text,
+              body text,
+              created_at real,
+              accessed_at real
+            )
+            """
+        )
+        conn.commit()
+        return conn
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"], state["_conn"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.max_age_seconds is not None and now - created_at > self.max_age_seconds
+
+    def get(self, payload: dict) -> dict | None:
+        key = request_key(payload)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "select body, created_at from responses where key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                self.misses += 1
+                if self.read_only:
+                    raise CacheMissError(f"No cached response for model '{payload.get('model')}'")
+                return None
+            self.hits += 1
+            if not self.read_only:
+                self._conn.execute("update responses set accessed_at = ? where key = ?", (now, key))
+                self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, payload: dict, body: dict) -> None:
+        if self.read_only:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "insert or replace into responses values (?, ?, ?, ?, ?)",
+                (request_key(payload), payload.get("model"), json.dumps(body), now, now),
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def evict(self) -> int:
+        if self.read_only:
+            return 0
+        removed = 0
+        with self._lock:
+            if self.max_age_seconds is not None:
+                cutoff = time.time() - self.max_age_seconds
+                removed += self._conn.execute(
+                    "delete from responses where created_at < ?", (cutoff,)
+                ).rowcount
+            if self.max_entries is not None:
+                removed += self._conn.execute(
+                    """
+                    delete from responses where key not in (
+                      select key from responses order by accessed_at desc limit ?
+                    )
+                    """,
+                    (self.max_entries,),
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+    def add_counts(self, *, hits: int = 0, misses: int = 0, stores: int = 0) -> None:
+        """Fold in lookups served by copies of this cache in worker processes."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.stores += stores
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        self.evict()
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
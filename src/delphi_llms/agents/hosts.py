@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass
+class OllamaHost:
+    url: str
+    max_concurrency: int | None = None
+    outstanding: int = 0
+    failures: int = 0
+    down_until: float = 0.0
+
+    def available(self, now: float) -> bool:
+        if now < self.down_until:
+            return False
+        return self.max_concurrency is None or self.outstanding < self.max_concurrency
+
+
+class NoHealthyHostError(RuntimeError):
+    pass
+
+
+def is_failover_error(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+class OllamaHostPool:
+    """Routes calls to the host with the fewest outstanding requests, within per-host caps.
+
+    A host that errors or times out is taken out of rotation for ``cooldown_seconds`` and the
+    call fails over to the next host; it rejoins automatically once the cooldown expires. The
+    last healthy host is never benched: its errors go straight back to the caller's retry
+    policy instead of stalling every call for the cooldown.
+    """
+
+    def __init__(self, hosts: list[OllamaHost], *, cooldown_seconds: float = 10.0) -> None:
+        if not hosts:
+            raise ValueError("hosts must not be empty")
+        self.hosts = hosts
+        self.cooldown_seconds = cooldown_seconds
+        self._condition = threading.Condition()
+
+    @property
+    def urls(self) -> list[str]:
+        return [host.url for host in self.hosts]
+
+    def _pick(self, excluded: set[str]) -> OllamaHost | None:
+        now = time.monotonic()
+        candidates = [h for h in self.hosts if h.url not in excluded and h.available(now)]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda host: host.outstanding)
+
+    def _try_acquire(self, excluded: set[str]) -> OllamaHost | None:
+        if all(host.url in excluded for host in self.hosts):
+            raise NoHealthyHostError("All Ollama hosts failed for this call")
+        host = self._pick(excluded)
+        if host is None:
+            # Saturated hosts free up within a call's time, so they are waited for. Once this
+            # call has failed somewhere and only benched hosts are left, waiting would stall
+            # it for the whole cooldown; the caller's retry backoff handles it instead.
+            now = time.monotonic()
+            untried = [h for h in self.hosts if h.url not in excluded]
+            if excluded and all(now < h.down_until for h in untried):
+                raise NoHealthyHostError("Every Ollama host left for this call is cooling down")
+            return None
+        host.outstanding += 1
+        return host
+
+    def acquire(self, excluded: set[str] | None = None) -> OllamaHost:
+        excluded = excluded or set()
+        with self._condition:
+            while True:
+                host = self._try_acquire(excluded)
+                if host is not None:
+                    return host
+                self._condition.wait(timeout=0.5)
+
+    async def acquire_async(self, excluded: set[str] | None = None) -> OllamaHost:
+        excluded = excluded or set()
+        while True:
+            with self._condition:
+                host = self._try_acquire(excluded)
+            if host is not None:
+                return host
+            await asyncio.sleep(0.01)
+
+    def release(self, host: OllamaHost, *, failed: bool = False) -> None:
+        with self._condition:
+            host.outstanding -= 1
+            if failed:
+                self._mark_down(host)
+            else:
+                host.failures = 0
+            self._condition.notify_all()
+
+    def mark_down(self, url: str) -> None:
+        with self._condition:
+            for host in self.hosts:
+                if host.url == url:
+                    self._mark_down(host)
+            self._condition.notify_all()
+
+    def _mark_down(self, host: OllamaHost) -> None:
+        host.failures += 1
+        now = time.monotonic()
+        if any(other is not host and now >= other.down_until for other in self.hosts):
+            host.down_until = now + self.cooldown_seconds
+
+    def call(self, fn: Callable, /, **kwargs):
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while True:
+            try:
+                host = self.acquire(tried)
+            except NoHealthyHostError:
+                if last_error is None:
+                    raise
+                raise last_error from None
+            try:
+                result = fn(ollama_host=host.url, **kwargs)
+            except Exception as exc:
+                failover = is_failover_error(exc)
+                self.release(host, failed=failover)
+                if not failover:
+                    raise
+                tried.add(host.url)
+                last_error = exc
+                continue
+            except BaseException:
+                self.release(host)
+                raise
+            self.release(host)
+            return result
+
+    async def call_async(self, fn: Callable[..., Awaitable], /, **kwargs):
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while True:
+            try:
+                host = await self.acquire_async(tried)
+            except NoHealthyHostError:
+                if last_error is None:
+                    raise
+                raise last_error from None
+            try:
+                result = await fn(ollama_host=host.url, **kwargs)
+            except Exception as exc:
+                failover = is_failover_error(exc)
+                self.release(host, failed=failover)
+                if not failover:
+                    raise
+                tried.add(host.url)
+                last_error = exc
+                continue
+            except BaseException:
+                self.release(host)
+                raise
+            self.release(host)
+            return result
@@ -0,0 +1,214 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+_ITEM_ID = re.compile(r"Item ID: ([^.\n]+)")
+_ROUND = re.compile(r"Round: (\d+)")
+
+
+@dataclass(frozen=True)
+class MockProfile:
+    models: tuple[str, ...] = ("qwen3-4b",)
+    latency: str = "fixed"
+    latency_ms: float = 50.0
+    jitter_ms: float = 0.0
+    sigma: float = 0.5
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    agreement: float = 0.8
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency must be one of: {', '.join(LATENCY_DISTRIBUTIONS)}")
+        for name in ("error_rate", "malformed_rate", "agreement"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+
+def _rng(*parts: object) -> random.Random:
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _rating_answer(rating: int, rng: random.Random) -> dict:
+    category = "include" if rating >= 7 else "exclude" if rating <= 3 else "maybe"
+    return {
+        "rating": rating,
+        "category": category,
+        "rationale": f"mock rationale {rng.randrange(10_000)}",
+        "confidence": round(rng.uniform(0.5, 1.0), 2),
+        "clarification_question": "Which population does this item apply to?",
+        "facilitator_answer": "The item applies to the population described in the study.",
+    }
+
+
+@dataclass
+class _MockState:
+    profile: MockProfile
+    attempts: dict[str, int] = field(default_factory=dict)
+    requests: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def attempt(self, key: str) -> int:
+        with self.lock:
+            self.requests += 1
+            self.attempts[key] = self.attempts.get(key, 0) + 1
+            return self.attempts[key]
+
+    def latency_seconds(self, rng: random.Random) -> float:
+        profile = self.profile
+        if profile.latency == "uniform":
+            value = rng.uniform(
+                profile.latency_ms - profile.jitter_ms, profile.latency_ms + profile.jitter_ms
+            )
+        elif profile.latency == "lognormal":
+            value = rng.lognormvariate(0.0, profile.sigma) * profile.latency_ms
+        else:
+            value = profile.latency_ms
+        return max(value, 0.0) / 1000.0
+
+    def generate(self, payload: dict) -> tuple[int, dict]:
+        profile = self.profile
+        model = payload.get("model")
+        if model not in profile.models:
+            return 404, {"error": f"model '{model}' not found"}
+        prompt = str(payload.get("prompt", ""))
+        if not prompt:
+            return 200, {"model": model, "response": "", "done": True, "done_reason": "load"}
+
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        attempt = self.attempt(key)
+        rng = _rng(profile.seed, key, attempt)
+        delay = self.latency_seconds(rng)
+        time.sleep(delay)
+        if rng.random() < profile.error_rate:
+            return 500, {"error": "mock failure"}
+        if rng.random() < profile.malformed_rate:
+            text = "{not json"
+        else:
+            item = _ITEM_ID.search(prompt)
+            round_number = _ROUND.search(prompt)
+            item_key = (
+                item.group(1) if item else prompt,
+                round_number.group(1) if round_number else None,
+            )
+            # Experts mostly agree on an item-level rating, so rounds can converge.
+            seed = payload.get("options", {}).get("seed")
+            answer_rng = _rng(profile.seed, model, item_key, seed)
+            shared = _rng(profile.seed, model, item_key)
+            source = shared if answer_rng.random() < profile.agreement else answer_rng
+            rating = source.randint(1, 9)
+            text = json.dumps(_rating_answer(rating, answer_rng))
+
+        prompt_tokens = max(len(prompt) // 4, 1)
+        eval_tokens = max(len(text) // 4, 1)
+        total_ns = int(delay * 1e9)
+        prompt_ns = total_ns * prompt_tokens // (prompt_tokens + eval_tokens)
+        return 200, {
+            "model": model,
+            "response": text,
+            "done": True,
+            "total_duration": total_ns,
+            "load_duration": 0,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": prompt_ns,
+            "eval_count": eval_tokens,
+            "eval_duration": total_ns - prompt_ns,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def _send(self, status: int, body: dict) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/api/tags":
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, {"models": [{"name": name} for name in self.server.state.profile.models]})
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/api/generate":
+            self._send(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send(400, {"error": "invalid request body"})
+            return
+        self._send(*self.server.state.generate(payload))
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 drops SYNs under a burst of connections, and the client
+    # then waits out a 1 s retransmit; load tests would be measuring the mock's backlog.
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], state: _MockState) -> None:
+        super().__init__(address, _Handler)
+        self.state = state
+
+
+class MockOllamaServer:
+    """Stand-in for Ollama's ``/api/tags`` and ``/api/generate`` with deterministic answers.
+
+    Answers depend only on the request and ``profile.seed``; latency, 500s and malformed output
+    are drawn per attempt, so a retried request can succeed.
+    """
+
+    def __init__(self, profile: MockProfile, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.profile = profile
+        self._server = _Server((host, port), _MockState(profile))
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        return self._server.state.requests
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> Self:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -1,11 +1,88 @@
 import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
 import httpx
 
+from delphi_llms.agents.cache import ResponseCache
+from delphi_llms.agents.prompts import DEFAULT_PROMPTS, PromptTemplate
+from delphi_llms.agents.retry import InvalidGenerationError
+from delphi_llms.instrumentation import ollama_call_metrics, record_call, requested_seed
 
-def list_ollama_models(*, ollama_host: str) -> list[str]:
+
+def _client_options(
+    *,
+    timeout: float,
+    connect_timeout: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> dict:
+    return {
+        "timeout": httpx.Timeout(timeout, connect=connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    }
+
+
+def create_ollama_client(
+    *,
+    timeout: float = 120.0,
+    connect_timeout: float = 10.0,
+    max_connections: int = 32,
+    max_keepalive_connections: int = 16,
+    keepalive_expiry: float = 60.0,
+) -> httpx.Client:
+    return httpx.Client(
+        **_client_options(
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+    )
+
+
+def create_async_ollama_client(
+    *,
+    timeout: float = 120.0,
+    connect_timeout: float = 10.0,
+    max_connections: int = 32,
+    max_keepalive_connections: int = 16,
+    keepalive_expiry: float = 60.0,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        **_client_options(
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+    )
+
+
+@dataclass(frozen=True)
+class GenerationSettings:
+    prompts: dict[str, PromptTemplate] = field(default_factory=lambda: dict(DEFAULT_PROMPTS))
+    keep_alive: str | int | None = None
+    num_ctx: int | None = None
+
+
+DEFAULT_GENERATION = GenerationSettings()
+
+
+def list_ollama_models(*, ollama_host: str, client: httpx.Client | None = None) -> list[str]:
     url = f"{ollama_host.rstrip('/')}/api/tags"
-    response = httpx.get(url, timeout=30.0)
+    if client is None:
+        response = httpx.get(url, timeout=30.0)
+    else:
+        response = client.get(url, timeout=30.0)
     response.raise_for_status()
     data = response.json()
     models = data.get("models") or []
@@ -18,45 +95,147 @@ def list_ollama_models(*, ollama_host: str) -> list[str]:
     return names
 
 
-def ensure_model_available(*, ollama_host: str, model: str) -> None:
-    names = list_ollama_models(ollama_host=ollama_host)
+def ensure_model_available(
+    *, ollama_host: str, model: str, client: httpx.Client | None = None
+) -> None:
+    names = list_ollama_models(ollama_host=ollama_host, client=client)
     if model in names:
         return
     if ":" not in model and f"{model}:latest" in names:
         return
     available = ", ".join(names) if names else "<none>"
     raise ValueError(
-        f"Model '{model}' not found in Ollama. Available: {available}. "
-        f"Run: ollama pull {model}"
+        f"Model '{model}' not found in Ollama. Available: {available}. Run: ollama pull {model}"
     )
 
 
-def call_ollama_expert(
+def prewarm_model(
     *,
-    model: str,
     ollama_host: str,
+    model: str,
+    keep_alive: str | int | None = None,
+    client: httpx.Client | None = None,
+) -> None:
+    # A generate request without a prompt only loads the model into memory.
+    payload: dict = {"model": model}
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
+    if client is None:
+        response = httpx.post(_generate_url(ollama_host), json=payload, timeout=300.0)
+    else:
+        response = client.post(_generate_url(ollama_host), json=payload, timeout=300.0)
+    _raise_for_status(response, model=model)
+
+
+def _generate_url(ollama_host: str) -> str:
+    return f"{ollama_host.rstrip('/')}/api/generate"
+
+
+def _generate_payload(
+    *, model: str, prompt: str, options: dict, settings: GenerationSettings
+) -> dict:
+    if settings.num_ctx is not None:
+        options = {**options, "num_ctx": settings.num_ctx}
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "format": "json",
+        "options": options,
+    }
+    if settings.keep_alive is not None:
+        payload["keep_alive"] = settings.keep_alive
+    return payload
+
+
+def _expert_payload(
+    *,
+    model: str,
     item_id: str,
     item_text: str,
     round_number: int,
     expert_id: str,
     seed: int,
+    settings: GenerationSettings | None = None,
 ) -> dict:
-    prompt = (
-        "You are a Delphi expert. Return only JSON with keys: rating (1-9 integer), "
-        "category (string), rationale (short string), confidence (0-1 float). "
-        f"Round: {round_number}. Expert: {expert_id}. Item ID: {item_id}. Item: {item_text}"
+    settings = settings or DEFAULT_GENERATION
+    prompt = settings.prompts["expert"].render(
+        item_id=item_id, item_text=item_text, round_number=round_number, expert_id=expert_id
+    )
+    return _generate_payload(
+        model=model, prompt=prompt, options={"seed": seed, "temperature": 0.2}, settings=settings
     )
 
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "format": "json",
-        "options": {"seed": seed, "temperature": 0.2},
-    }
 
-    url = f"{ollama_host.rstrip('/')}/api/generate"
-    response = httpx.post(url, json=payload, timeout=120.0)
+def _clarification_payload(
+    *,
+    model: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    settings = settings or DEFAULT_GENERATION
+    prompt = settings.prompts["clarification"].render(
+        item_id=item_id, item_text=item_text, round_number=round_number, expert_id=expert_id
+    )
+    return _generate_payload(
+        model=model, prompt=prompt, options={"seed": seed, "temperature": 0.2}, settings=settings
+    )
+
+
+def _facilitator_payload(
+    *,
+    model: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    clarification_question: str,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    settings = settings or DEFAULT_GENERATION
+    prompt = settings.prompts["facilitator"].render(
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        clarification_question=clarification_question,
+    )
+    return _generate_payload(
+        model=model, prompt=prompt, options={"temperature": 0.1}, settings=settings
+    )
+
+
+def _expert_with_clarification_payload(
+    *,
+    model: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    clarification_question: str,
+    facilitator_answer: str,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    settings = settings or DEFAULT_GENERATION
+    prompt = settings.prompts["expert_with_clarification"].render(
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        clarification_question=clarification_question,
+        facilitator_answer=facilitator_answer,
+    )
+    return _generate_payload(
+        model=model, prompt=prompt, options={"seed": seed, "temperature": 0.2}, settings=settings
+    )
+
+
+def _raise_for_status(response: httpx.Response, *, model: str) -> None:
     try:
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -66,16 +245,155 @@ def call_ollama_expert(
             request=exc.request,
             response=exc.response,
         ) from exc
+
+
+def _load_generation(body: dict) -> dict:
+    try:
+        parsed = json.loads(body.get("response", "{}"))
+    except json.JSONDecodeError as exc:
+        raise InvalidGenerationError(f"Model returned invalid JSON: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise InvalidGenerationError("Model returned JSON that is not an object")
+    return parsed
+
+
+def _parse_rating(body: dict) -> dict:
+    parsed = _load_generation(body)
+    try:
+        return {
+            "rating": int(parsed["rating"]),
+            "category": str(parsed["category"]),
+            "rationale": str(parsed.get("rationale", "")),
+            "confidence": float(parsed.get("confidence", 0.5)),
+        }
+    except (KeyError, TypeError, ValueError) as exc:
+        raise InvalidGenerationError(f"Model output violates the rating schema: {exc!r}") from exc
+
+
+def _parse_text(body: dict, key: str) -> str:
+    return str(_load_generation(body).get(key, "")).strip()
+
+
+def _record(kind: str, payload: dict, body: dict, started: float, *, cached: bool) -> None:
+    record_call(
+        ollama_call_metrics(
+            kind=kind,
+            model=payload["model"],
+            body=body,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            cached=cached,
+            seed=payload.get("options", {}).get("seed"),
+        )
+    )
+
+
+def _store(cache: ResponseCache, payload: dict, body: dict) -> None:
+    cache.put(payload, body)
+    seed = requested_seed()
+    options = payload.get("options", {})
+    if seed is not None and "seed" in options and options["seed"] != seed:
+        # A retry reseeded this request; replays look up the caller's original one.
+        cache.put({**payload, "options": {**options, "seed": seed}}, body)
+
+
+def _generate(
+    *,
+    ollama_host: str,
+    payload: dict,
+    client: httpx.Client | None,
+    cache: ResponseCache | None,
+    parse: Callable[[dict], object],
+    kind: str,
+):
+    started = time.perf_counter()
+    if cache is not None:
+        cached = cache.get(payload)
+        if cached is not None:
+            result = parse(cached)
+            _record(kind, payload, cached, started, cached=True)
+            return result
+    if client is None:
+        response = httpx.post(_generate_url(ollama_host), json=payload, timeout=120.0)
+    else:
+        response = client.post(_generate_url(ollama_host), json=payload)
+    _raise_for_status(response, model=payload["model"])
     body = response.json()
-    text = body.get("response", "{}")
-    parsed = json.loads(text)
+    # Parse before storing so malformed generations are never replayed from the cache.
+    result = parse(body)
+    _record(kind, payload, body, started, cached=False)
+    if cache is not None:
+        _store(cache, payload, body)
+    return result
 
-    return {
-        "rating": int(parsed["rating"]),
-        "category": str(parsed["category"]),
-        "rationale": str(parsed.get("rationale", "")),
-        "confidence": float(parsed.get("confidence", 0.5)),
-    }
+
+async def _generate_async(
+    *,
+    ollama_host: str,
+    payload: dict,
+    client: httpx.AsyncClient | None,
+    cache: ResponseCache | None,
+    parse: Callable[[dict], object],
+    kind: str,
+):
+    started = time.perf_counter()
+    if cache is not None:
+        cached = cache.get(payload)
+        if cached is not None:
+            result = parse(cached)
+            _record(kind, payload, cached, started, cached=True)
+            return result
+    if client is None:
+        async with httpx.AsyncClient(timeout=120.0) as owned:
+            response = await owned.post(_generate_url(ollama_host), json=payload)
+    else:
+        response = await client.post(_generate_url(ollama_host), json=payload)
+    _raise_for_status(response, model=payload["model"])
+    body = response.json()
+    result = parse(body)
+    _record(kind, payload, body, started, cached=False)
+    if cache is not None:
+        _store(cache, payload, body)
+    return result
+
+
+def _parse_clarification(body: dict) -> str:
+    return _parse_text(body, "clarification_question")
+
+
+def _parse_facilitator(body: dict) -> str:
+    return _parse_text(body, "facilitator_answer")
+
+
+def call_ollama_expert(
+    *,
+    model: str,
+    ollama_host: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    payload = _expert_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        settings=settings,
+    )
+    return _generate(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_rating,
+        kind="expert",
+    )
 
 
 def ask_ollama_clarification_question(
@@ -87,25 +405,27 @@ def ask_ollama_clarification_question(
     round_number: int,
     expert_id: str,
     seed: int,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
 ) -> str:
-    prompt = (
-        "You are a Delphi expert. Ask exactly one concise clarification question before rating. "
-        "Return only JSON with key: clarification_question. "
-        f"Round: {round_number}. Expert: {expert_id}. Item ID: {item_id}. Item: {item_text}"
+    payload = _clarification_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        settings=settings,
+    )
+    return _generate(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_clarification,
+        kind="clarification",
     )
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "format": "json",
-        "options": {"seed": seed, "temperature": 0.2},
-    }
-    url = f"{ollama_host.rstrip('/')}/api/generate"
-    response = httpx.post(url, json=payload, timeout=120.0)
-    response.raise_for_status()
-    body = response.json()
-    parsed = json.loads(body.get("response", "{}"))
-    return str(parsed.get("clarification_question", "")).strip()
 
 
 def call_ollama_facilitator(
@@ -117,28 +437,27 @@ def call_ollama_facilitator(
     round_number: int,
     expert_id: str,
     clarification_question: str,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
 ) -> str:
-    prompt = (
-        "You are a Delphi facilitator. Only answer clarification within scope of the item. "
-        "Do not provide ratings or final decision recommendations. "
-        "If out of scope, return: 'Pergunta fora de escopo para este experimento.' "
-        "Return only JSON with key: facilitator_answer. "
-        f"Round: {round_number}. Expert: {expert_id}. Item ID: {item_id}. Item: {item_text}. "
-        f"Question: {clarification_question}"
+    payload = _facilitator_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        clarification_question=clarification_question,
+        settings=settings,
+    )
+    return _generate(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_facilitator,
+        kind="facilitator",
     )
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "format": "json",
-        "options": {"temperature": 0.1},
-    }
-    url = f"{ollama_host.rstrip('/')}/api/generate"
-    response = httpx.post(url, json=payload, timeout=120.0)
-    response.raise_for_status()
-    body = response.json()
-    parsed = json.loads(body.get("response", "{}"))
-    return str(parsed.get("facilitator_answer", "")).strip()
 
 
 def call_ollama_expert_with_clarification(
@@ -152,29 +471,158 @@ def call_ollama_expert_with_clarification(
     seed: int,
     clarification_question: str,
     facilitator_answer: str,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
 ) -> dict:
-    prompt = (
-        "You are a Delphi expert. Rate the item after considering the facilitator response. "
-        "Return only JSON with keys: rating (1-9 integer), category (string), "
-        "rationale (short string), confidence (0-1 float). "
-        f"Round: {round_number}. Expert: {expert_id}. Item ID: {item_id}. Item: {item_text}. "
-        f"Clarification question: {clarification_question}. Facilitator answer: {facilitator_answer}"
+    payload = _expert_with_clarification_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        clarification_question=clarification_question,
+        facilitator_answer=facilitator_answer,
+        settings=settings,
+    )
+    return _generate(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_rating,
+        kind="expert_with_clarification",
+    )
+
+
+async def call_ollama_expert_async(
+    *,
+    model: str,
+    ollama_host: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    client: httpx.AsyncClient | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    payload = _expert_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        settings=settings,
+    )
+    return await _generate_async(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_rating,
+        kind="expert",
+    )
+
+
+async def ask_ollama_clarification_question_async(
+    *,
+    model: str,
+    ollama_host: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    client: httpx.AsyncClient | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
+) -> str:
+    payload = _clarification_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        settings=settings,
+    )
+    return await _generate_async(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_clarification,
+        kind="clarification",
+    )
+
+
+async def call_ollama_facilitator_async(
+    *,
+    model: str,
+    ollama_host: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    clarification_question: str,
+    client: httpx.AsyncClient | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
+) -> str:
+    payload = _facilitator_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        clarification_question=clarification_question,
+        settings=settings,
+    )
+    return await _generate_async(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_facilitator,
+        kind="facilitator",
+    )
+
+
+async def call_ollama_expert_with_clarification_async(
+    *,
+    model: str,
+    ollama_host: str,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    clarification_question: str,
+    facilitator_answer: str,
+    client: httpx.AsyncClient | None = None,
+    cache: ResponseCache | None = None,
+    settings: GenerationSettings | None = None,
+) -> dict:
+    payload = _expert_with_clarification_payload(
+        model=model,
+        item_id=item_id,
+        item_text=item_text,
+        round_number=round_number,
+        expert_id=expert_id,
+        seed=seed,
+        clarification_question=clarification_question,
+        facilitator_answer=facilitator_answer,
+        settings=settings,
+    )
+    return await _generate_async(
+        ollama_host=ollama_host,
+        payload=payload,
+        client=client,
+        cache=cache,
+        parse=_parse_rating,
+        kind="expert_with_clarification",
     )
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "format": "json",
-        "options": {"seed": seed, "temperature": 0.2},
-    }
-    url = f"{ollama_host.rstrip('/')}/api/generate"
-    response = httpx.post(url, json=payload, timeout=120.0)
-    response.raise_for_status()
-    body = response.json()
-    parsed = json.loads(body.get("response", "{}"))
-    return {
-        "rating": int(parsed["rating"]),
-        "category": str(parsed["category"]),
-        "rationale": str(parsed.get("rationale", "")),
-        "confidence": float(parsed.get("confidence", 0.5)),
-    }
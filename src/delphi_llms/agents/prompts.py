@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+PROMPT_FIELDS = {
+    "expert": ("item_id", "item_text", "round_number", "expert_id"),
+    "clarification": ("item_id", "item_text", "round_number", "expert_id"),
+    "facilitator": (
+        "item_id",
+        "item_text",
+        "round_number",
+        "expert_id",
+        "clarification_question",
+    ),
+    "expert_with_clarification": (
+        "item_id",
+        "item_text",
+        "round_number",
+        "expert_id",
+        "clarification_question",
+        "facilitator_answer",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A fixed ``prefix`` followed by a ``suffix`` holding every per-call field.
+
+    Ollama reuses the KV cache for the longest matching token prefix, so the instructions stay
+    byte-identical across calls and the fields that change most often come last.
+    """
+
+    prefix: str
+    suffix: str
+
+    def render(self, **fields: object) -> str:
+        return self.prefix + self.suffix.format(**fields)
+
+
+_ITEM = "Item ID: {item_id}. Item: {item_text}. "
+
+DEFAULT_PROMPTS = {
+    "expert": PromptTemplate(
+        prefix=(
+            "You are a Delphi expert. Return only JSON with keys: rating (1-9 integer), "
+            "category (string), rationale (short string), confidence (0-1 float).\n"
+        ),
+        suffix=_ITEM + "Round: {round_number}. Expert: {expert_id}.",
+    ),
+    "clarification": PromptTemplate(
+        prefix=(
+            "You are a Delphi expert. Ask exactly one concise clarification question before "
+            "rating. Return only JSON with key: clarification_question.\n"
+        ),
+        suffix=_ITEM + "Round: {round_number}. Expert: {expert_id}.",
+    ),
+    "facilitator": PromptTemplate(
+        prefix=(
+            "You are a Delphi facilitator. Only answer clarification within scope of the item. "
+            "Do not provide ratings or final decision recommendations. "
+            "If out of scope, return: 'Pergunta fora de escopo para este experimento.' "
+            "Return only JSON with key: facilitator_answer.\n"
+        ),
+        suffix=_ITEM + "Round: {round_number}. Expert: {expert_id}. "
+        "Question: {clarification_question}",
+    ),
+    "expert_with_clarification": PromptTemplate(
+        prefix=(
+            "You are a Delphi expert. Rate the item after considering the facilitator response. "
+            "Return only JSON with keys: rating (1-9 integer), category (string), "
+            "rationale (short string), confidence (0-1 float).\n"
+        ),
+        suffix=_ITEM + "Round: {round_number}. Expert: {expert_id}. "
+        "Clarification question: {clarification_question}. "
+        "Facilitator answer: {facilitator_answer}",
+    ),
+}
+
+
+def load_prompt_templates(overrides: dict | None) -> dict[str, PromptTemplate]:
+    templates = dict(DEFAULT_PROMPTS)
+    for kind, override in (overrides or {}).items():
+        if kind not in PROMPT_FIELDS:
+            raise ValueError(f"Unknown prompt template: {kind}")
+        if not isinstance(override, dict):
+            raise TypeError(f"Prompt template '{kind}' must be a mapping with prefix/suffix")
+        template = PromptTemplate(
+            prefix=str(override.get("prefix", templates[kind].prefix)),
+            suffix=str(override.get("suffix", templates[kind].suffix)),
+        )
+        try:
+            template.render(**{name: "" for name in PROMPT_FIELDS[kind]})
+        except (KeyError, IndexError) as exc:
+            raise ValueError(f"Prompt template '{kind}' uses unknown field {exc}") from exc
+        templates[kind] = template
+    return templates
@@ -0,0 +1,145 @@
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from delphi_llms.instrumentation import retry_attempt
+
+
+class InvalidGenerationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    deadline: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("retry delays must be >= 0")
+
+    def delay(self, attempt: int) -> float:
+        # Full jitter keeps parallel experts that failed together from retrying in lockstep.
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, InvalidGenerationError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+class RetryStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, model: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(model, {"retries": 0, "exhausted": 0})
+            counts[outcome] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {model: dict(counts) for model, counts in sorted(self._counts.items())}
+
+    def drain(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            return counts
+
+    def merge(self, counts: dict[str, dict[str, int]]) -> None:
+        with self._lock:
+            for model, outcomes in counts.items():
+                merged = self._counts.setdefault(model, {"retries": 0, "exhausted": 0})
+                for outcome, count in outcomes.items():
+                    merged[outcome] += count
+
+
+def _next_kwargs(kwargs: dict, exc: BaseException, attempt: int) -> dict:
+    # A fixed seed reproduces the same malformed output, so schema failures retry with a
+    # derived seed; transport failures keep the original request. The seed and attempt that
+    # succeeded are recorded in the call metrics, and the accepted response is also cached
+    # under the caller's seed so replays find it (see instrumentation.retry_attempt).
+    if isinstance(exc, InvalidGenerationError) and "seed" in kwargs:
+        return {**kwargs, "seed": kwargs["seed"] + attempt}
+    return kwargs
+
+
+def _give_up(
+    policy: RetryPolicy, exc: BaseException, *, attempt: int, elapsed: float, wait: float
+) -> bool:
+    if not is_retryable(exc) or attempt >= policy.max_attempts:
+        return True
+    return policy.deadline is not None and elapsed + wait > policy.deadline
+
+
+def call_with_retry(
+    fn: Callable,
+    /,
+    *,
+    policy: RetryPolicy,
+    stats: RetryStats | None = None,
+    **kwargs,
+):
+    started = time.monotonic()
+    call_kwargs = kwargs
+    attempt = 1
+    while True:
+        try:
+            with retry_attempt(attempt, requested_seed=kwargs.get("seed")):
+                return fn(**call_kwargs)
+        except Exception as exc:
+            wait = policy.delay(attempt)
+            if _give_up(
+                policy, exc, attempt=attempt, elapsed=time.monotonic() - started, wait=wait
+            ):
+                if stats is not None and is_retryable(exc):
+                    stats.record(str(kwargs.get("model")), "exhausted")
+                raise
+            if stats is not None:
+                stats.record(str(kwargs.get("model")), "retries")
+            call_kwargs = _next_kwargs(kwargs, exc, attempt)
+            attempt += 1
+            time.sleep(wait)
+
+
+async def call_with_retry_async(
+    fn: Callable[..., Awaitable],
+    /,
+    *,
+    policy: RetryPolicy,
+    stats: RetryStats | None = None,
+    **kwargs,
+):
+    started = time.monotonic()
+    call_kwargs = kwargs
+    attempt = 1
+    while True:
+        try:
+            with retry_attempt(attempt, requested_seed=kwargs.get("seed")):
+                return await fn(**call_kwargs)
+        except Exception as exc:
+            wait = policy.delay(attempt)
+            if _give_up(
+                policy, exc, attempt=attempt, elapsed=time.monotonic() - started, wait=wait
+            ):
+                if stats is not None and is_retryable(exc):
+                    stats.record(str(kwargs.get("model")), "exhausted")
+                raise
+            if stats is not None:
+                stats.record(str(kwargs.get("model")), "retries")
+            call_kwargs = _next_kwargs(kwargs, exc, attempt)
+            attempt += 1
+            await asyncio.sleep(wait)
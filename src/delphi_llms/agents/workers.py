@@ -0,0 +1,97 @@
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from delphi_llms.agents.cache import ResponseCache
+from delphi_llms.agents.ollama import create_ollama_client
+from delphi_llms.agents.retry import RetryStats
+from delphi_llms.delphi.executors import ExecutionBackend, ProcessBackend
+
+# Per-process state of a worker started by OllamaWorkerBackend; empty in the parent.
+_worker: dict = {}
+
+_CACHE_COUNTERS = ("hits", "misses", "stores")
+
+
+def init_worker(client_settings: dict, cache: ResponseCache | None) -> None:
+    _worker["client"] = create_ollama_client(**client_settings)
+    _worker["cache"] = cache
+    _worker["retry_stats"] = RetryStats()
+    _worker["reported"] = {name: getattr(cache, name, 0) for name in _CACHE_COUNTERS}
+
+
+def worker_call(fn: Callable, /, **kwargs):
+    """Call an Ollama function with this worker's pooled client and cache connection."""
+    return fn(client=_worker["client"], cache=_worker["cache"], **kwargs)
+
+
+class WorkerRetryStats:
+    """Picklable stand-in for ``RetryStats`` that records into the current worker's counters."""
+
+    def record(self, model: str, outcome: str) -> None:
+        _worker["retry_stats"].record(model, outcome)
+
+
+def _run_and_report(fn: Callable, /, *args, **kwargs) -> tuple[object, dict]:
+    result = fn(*args, **kwargs)
+    cache = _worker["cache"]
+    reported = _worker["reported"]
+    cache_counts = {}
+    for name in _CACHE_COUNTERS:
+        current = getattr(cache, name, 0)
+        cache_counts[name] = current - reported[name]
+        reported[name] = current
+    return result, {"retries": _worker["retry_stats"].drain(), "cache": cache_counts}
+
+
+class _LinkedFuture(Future):
+    def __init__(self, inner: Future) -> None:
+        super().__init__()
+        self._inner = inner
+
+    def cancel(self) -> bool:
+        return self._inner.cancel() and super().cancel()
+
+
+class OllamaWorkerBackend(ExecutionBackend):
+    """Process backend whose workers each keep one pooled Ollama client and cache connection.
+
+    Retry and cache counters from the workers travel back with every result and are merged
+    into the parent's ``retry_stats`` and ``cache``, so run reports cover all processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        client_settings: dict,
+        cache: ResponseCache | None,
+        retry_stats: RetryStats,
+    ) -> None:
+        self.max_workers = max_workers
+        self.cache = cache
+        self.retry_stats = retry_stats
+        self._processes = ProcessBackend(
+            max_workers, initializer=init_worker, initargs=(client_settings, cache)
+        )
+
+    def _settle(self, outer: _LinkedFuture, inner: Future) -> None:
+        if inner.cancelled():
+            return
+        exc = inner.exception()
+        if exc is not None:
+            outer.set_exception(exc)
+            return
+        result, report = inner.result()
+        self.retry_stats.merge(report["retries"])
+        if self.cache is not None:
+            self.cache.add_counts(**report["cache"])
+        outer.set_result(result)
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        inner = self._processes.submit(_run_and_report, fn, *args, **kwargs)
+        outer = _LinkedFuture(inner)
+        inner.add_done_callback(lambda done: self._settle(outer, done))
+        return outer
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._processes.shutdown(wait=wait)
@@ -0,0 +1,275 @@
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+
+from delphi_llms.data.loader import parse_dataset_sheet
+from delphi_llms.delphi.aggregation import finalize_category
+from delphi_llms.delphi.engine import _round_metrics, run_recursive_delphi, run_standard_delphi
+from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite
+from delphi_llms.models import ExpertResponse
+
+SCALES = {
+    "quick": {
+        "engine_items": 20,
+        "engine_experts": 5,
+        "engine_n_max": 3,
+        "latency_ms": 2.0,
+        "panel_size": 1_000,
+        "panel_repeats": 200,
+        "sheet_experts": 30,
+        "sheet_items": 100,
+        "export_events": 20_000,
+        "repeats": 3,
+    },
+    "full": {
+        "engine_items": 200,
+        "engine_experts": 5,
+        "engine_n_max": 5,
+        "latency_ms": 5.0,
+        "panel_size": 10_000,
+        "panel_repeats": 1_000,
+        "sheet_experts": 200,
+        "sheet_items": 500,
+        "export_events": 1_000_000,
+        "repeats": 5,
+    },
+}
+
+
+def _timed(fn: Callable[[], object], *, repeats: int) -> dict:
+    timings: list[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return {
+        "repeats": repeats,
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "mean_seconds": statistics.fmean(timings),
+        "max_seconds": max(timings),
+    }
+
+
+def _synthetic_answer(item_id: str, round_number: int, seed: int) -> dict:
+    rng = random.Random(f"{item_id}:{round_number}:{seed}")
+    rating = rng.choice([8, 8, 8, rng.randint(1, 9)])
+    category = "include" if rating >= 7 else "exclude" if rating <= 3 else "maybe"
+    return {"rating": rating, "category": category, "rationale": "bench", "confidence": 0.8}
+
+
+def _sleeping_expert(*, latency: float, item_id: str, round_number: int, seed: int, **_: object):
+    time.sleep(latency)
+    return _synthetic_answer(item_id, round_number, seed)
+
+
+def _sleeping_text(*, latency: float, **_: object) -> str:
+    time.sleep(latency)
+    return "bench"
+
+
+def bench_engine(*, mode: str, scale: dict) -> dict:
+    latency = scale["latency_ms"] / 1000.0
+    kwargs = {
+        "items": [
+            {"item_id": str(idx), "item_text": f"Item {idx}"}
+            for idx in range(scale["engine_items"])
+        ],
+        "expert_seeds": list(range(1, scale["engine_experts"] + 1)),
+        "n_max": scale["engine_n_max"],
+    }
+    if mode == "standard":
+        run = partial(
+            run_standard_delphi, call_expert=partial(_sleeping_expert, latency=latency), **kwargs
+        )
+    else:
+        run = partial(
+            run_recursive_delphi,
+            ask_expert_clarification=partial(_sleeping_text, latency=latency),
+            call_facilitator=partial(_sleeping_text, latency=latency),
+            call_expert_with_clarification=partial(_sleeping_expert, latency=latency),
+            **kwargs,
+        )
+    event_logs: list[list] = []
+    result = _timed(lambda: event_logs.append(run()["event_log"]), repeats=scale["repeats"])
+    result["events"] = sum(len(events) for events in event_logs[-1])
+    result["latency_ms"] = scale["latency_ms"]
+    return result
+
+
+def _synthetic_panel(size: int) -> list[ExpertResponse]:
+    rng = random.Random(size)
+    panel: list[ExpertResponse] = []
+    for idx in range(size):
+        rating = rng.randint(1, 9)
+        panel.append(
+            ExpertResponse(
+                item_id="bench",
+                round=1,
+                expert_id=f"expert_{idx}",
+                rating=rating,
+                category="include" if rating >= 7 else "exclude" if rating <= 3 else "maybe",
+                rationale="bench",
+                confidence=0.5,
+            )
+        )
+    return panel
+
+
+def bench_aggregation(*, scale: dict) -> dict:
+    panel = _synthetic_panel(scale["panel_size"])
+
+    def run() -> None:
+        for _ in range(scale["panel_repeats"]):
+            finalize_category(panel)
+            _round_metrics(panel)
+
+    result = _timed(run, repeats=scale["repeats"])
+    result["panel_size"] = scale["panel_size"]
+    result["panels"] = scale["panel_repeats"]
+    return result
+
+
+def synthetic_dataset_sheet(*, experts: int, items: int, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    width = items + 1
+    rows: list[list[object]] = [
+        ["Experts", *[f"Domain {col // 10}" if col % 10 == 0 else None for col in range(items)]],
+        [None, *[f"Item text {col}" for col in range(items)]],
+    ]
+    ratings = [[rng.randint(1, 9) for _ in range(items)] for _ in range(experts)]
+    rows.extend(["Anonymised expert", *row] for row in ratings)
+    columns = list(zip(*ratings))
+    rows.append(["Min", *[min(col) for col in columns]])
+    rows.append(["Max", *[max(col) for col in columns]])
+    rows.append(["Median", *[statistics.median(col) for col in columns]])
+    rows.append(["AGREEMENT_INCLUSION", *[sum(r >= 7 for r in col) / experts for col in columns]])
+    rows.append(["AGREEMENT_EXCLUSION", *[sum(r <= 3 for r in col) / experts for col in columns]])
+    rows.append([None] * width)
+    rows.append(["Comments summary", *[f"comment {col}" for col in range(items)]])
+    return pd.DataFrame(rows)
+
+
+def bench_parse(*, scale: dict) -> dict:
+    sheet = synthetic_dataset_sheet(experts=scale["sheet_experts"], items=scale["sheet_items"])
+    result = _timed(lambda: parse_dataset_sheet(sheet, round_number=1), repeats=scale["repeats"])
+    result["experts"] = scale["sheet_experts"]
+    result["items"] = scale["sheet_items"]
+    return result
+
+
+def synthetic_run_dir(base_dir: Path, *, events: int, experts: int = 5) -> Path:
+    run_dir = base_dir / "run-bench"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    per_round = experts + 1
+    rounds = max(events // per_round, 1)
+    rng = random.Random(events)
+    with (run_dir / "events.jsonl").open("w", encoding="utf-8") as handle:
+        for idx in range(rounds):
+            item_id, round_number = str(idx // 3), idx % 3 + 1
+            ratings = [rng.randint(1, 9) for _ in range(experts)]
+            for expert, rating in enumerate(ratings, start=1):
+                event = {
+                    "type": "expert_response",
+                    "item_id": item_id,
+                    "round": round_number,
+                    "expert_id": f"expert_{expert}",
+                    "rating": rating,
+                    "category": "include" if rating >= 7 else "maybe",
+                    "rationale": "bench",
+                    "confidence": 0.8,
+                }
+                handle.write(json.dumps(event) + "\n")
+            summary = {
+                "type": "round_summary",
+                "item_id": item_id,
+                "round": round_number,
+                "categories": ["include"] * experts,
+                "stop": round_number == 3,
+                "reason": "converged",
+                "median": float(statistics.median(ratings)),
+                "agreement_inclusion": 0.5,
+                "agreement_exclusion": 0.0,
+            }
+            handle.write(json.dumps(summary) + "\n")
+    summary_rows = [
+        {"item_id": str(idx), "item_text": f"Item {idx}", "final_category": "include"}
+        for idx in range((rounds + 2) // 3)
+    ]
+    (run_dir / "summary.json").write_text(json.dumps(summary_rows), encoding="utf-8")
+    return run_dir
+
+
+def bench_export(*, scale: dict, workdir: Path) -> dict:
+    synthetic_run_dir(workdir / "runs", events=scale["export_events"])
+    sqlite_path = workdir / "bench.sqlite"
+    result = _timed(
+        lambda: export_latest_run_to_sqlite(base_run_dir=workdir / "runs", sqlite_path=sqlite_path),
+        repeats=scale["repeats"],
+    )
+    result["events"] = scale["export_events"]
+    return result
+
+
+BENCHMARKS: dict[str, Callable[..., dict]] = {
+    "engine_standard": lambda *, scale, workdir: bench_engine(mode="standard", scale=scale),
+    "engine_recursive": lambda *, scale, workdir: bench_engine(mode="recursive", scale=scale),
+    "aggregation": lambda *, scale, workdir: bench_aggregation(scale=scale),
+    "parse_dataset_sheet": lambda *, scale, workdir: bench_parse(scale=scale),
+    "export_sqlite": lambda *, scale, workdir: bench_export(scale=scale, workdir=workdir),
+}
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run_benchmarks(*, scale: str = "quick", names: list[str] | None = None) -> dict:
+    if scale not in SCALES:
+        raise ValueError(f"scale must be one of: {', '.join(SCALES)}")
+    unknown = sorted(set(names or []) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    results: dict[str, dict] = {}
+    for name in names or list(BENCHMARKS):
+        with tempfile.TemporaryDirectory(prefix="delphi-bench-") as workdir:
+            results[name] = BENCHMARKS[name](scale=SCALES[scale], workdir=Path(workdir))
+    return {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(current: dict, baseline: dict) -> dict[str, float]:
+    ratios: dict[str, float] = {}
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous and previous.get("median_seconds"):
+            ratios[name] = result["median_seconds"] / previous["median_seconds"]
+    return ratios
@@ -1,34 +1,80 @@
-from pathlib import Path
+import asyncio
 import json
 import os
+import time
+from contextlib import nullcontext
 from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
 
+import httpx
 import typer
 
+from delphi_llms.agents.cache import CacheMissError, ResponseCache
+from delphi_llms.agents.hosts import OllamaHost, OllamaHostPool
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
 from delphi_llms.agents.ollama import (
+    GenerationSettings,
     ask_ollama_clarification_question,
+    ask_ollama_clarification_question_async,
     call_ollama_expert,
+    call_ollama_expert_async,
     call_ollama_expert_with_clarification,
+    call_ollama_expert_with_clarification_async,
     call_ollama_facilitator,
+    call_ollama_facilitator_async,
+    create_async_ollama_client,
+    create_ollama_client,
     ensure_model_available,
+    prewarm_model,
+)
+from delphi_llms.agents.prompts import load_prompt_templates
+from delphi_llms.agents.retry import (
+    RetryPolicy,
+    RetryStats,
+    call_with_retry,
+    call_with_retry_async,
 )
+from delphi_llms.agents.workers import OllamaWorkerBackend, WorkerRetryStats, worker_call
+from delphi_llms.bench import BENCHMARKS, SCALES, compare_to_baseline, run_benchmarks
 from delphi_llms.config import load_yaml
-from delphi_llms.data.loader import parse_round_results_xlsx
+from delphi_llms.data.loader import load_round_results, parse_round_results_xlsx
+from delphi_llms.delphi.artifacts import columnar_available, write_run_report
+from delphi_llms.delphi.async_engine import run_recursive_delphi_async, run_standard_delphi_async
 from delphi_llms.delphi.engine import run_recursive_delphi, run_standard_delphi
-from delphi_llms.eval.compare import evaluate_run_against_human, load_latest_run_dir
-from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite
-
+from delphi_llms.delphi.events import (
+    FanoutEventSink,
+    JsonlEventSink,
+    SqliteEventSink,
+    load_checkpoint,
+    sort_events_file,
+)
+from delphi_llms.delphi.executors import ExecutionBackend, create_backend
+from delphi_llms.delphi.shards import merge_shards, shard_dir, shard_items
+from delphi_llms.delphi.stopping import StoppingPolicy
+from delphi_llms.eval.compare import (
+    ConsensusThresholds,
+    evaluate_run_against_human,
+    load_consensus_thresholds,
+    load_latest_run_dir,
+    write_evaluation,
+)
+from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite, export_runs_to_warehouse
+from delphi_llms.eval.leaderboard import evaluate_all_runs
+from delphi_llms.sweep import expand_grid, resolve_config, run_sweep
 
 app = typer.Typer(help="Delphi LLM experiments CLI.")
 dataset_app = typer.Typer(help="Dataset operations.")
 experiment_app = typer.Typer(help="Experiment operations.")
 evaluate_app = typer.Typer(help="Evaluation operations.")
 export_app = typer.Typer(help="Export operations.")
+mock_app = typer.Typer(help="Local mock Ollama server for load tests.")
 
 app.add_typer(dataset_app, name="dataset")
 app.add_typer(experiment_app, name="experiment")
 app.add_typer(evaluate_app, name="evaluate")
 app.add_typer(export_app, name="export")
+app.add_typer(mock_app, name="mock")
 
 
 def _ensure_config_exists(config: Path) -> None:
@@ -47,6 +93,197 @@ def _required_path(config_data: dict, dotted_key: str) -> Path:
     return Path(cursor)
 
 
+def _dataset_cache_dir(config: Path, config_data: dict) -> Path | None:
+    settings = config_data.get("dataset_cache", {})
+    if not settings.get("enabled", True):
+        return None
+    if settings.get("dir"):
+        return Path(settings["dir"])
+    return config.parent / ".delphi-cache" / "datasets"
+
+
+def _ollama_client_settings(config_data: dict) -> dict:
+    settings = config_data.get("ollama", {})
+    return {
+        "timeout": float(settings.get("timeout", 120.0)),
+        "connect_timeout": float(settings.get("connect_timeout", 10.0)),
+        "max_connections": int(settings.get("max_connections", 32)),
+        "max_keepalive_connections": int(settings.get("max_keepalive_connections", 16)),
+        "keepalive_expiry": float(settings.get("keepalive_expiry", 60.0)),
+    }
+
+
+def _open_response_cache(config_data: dict) -> ResponseCache | None:
+    settings = config_data.get("cache", {})
+    mode = str(settings.get("mode", "off")).strip().lower()
+    if mode not in {"off", "readwrite", "replay"}:
+        raise typer.BadParameter("cache.mode must be one of: off, readwrite, replay")
+    if mode == "off":
+        return None
+    max_entries = settings.get("max_entries")
+    max_age_days = settings.get("max_age_days")
+    try:
+        return ResponseCache(
+            Path(settings.get("path", "runs/cache/responses.sqlite")),
+            max_entries=int(max_entries) if max_entries is not None else None,
+            max_age_seconds=float(max_age_days) * 86400 if max_age_days is not None else None,
+            read_only=mode == "replay",
+        )
+    except FileNotFoundError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+def _generation_settings(config_data: dict) -> GenerationSettings:
+    settings = config_data.get("ollama", {})
+    num_ctx = settings.get("num_ctx")
+    try:
+        prompts = load_prompt_templates(config_data.get("prompts"))
+    except (TypeError, ValueError) as exc:
+        raise typer.BadParameter(f"prompts: {exc}") from exc
+    return GenerationSettings(
+        prompts=prompts,
+        keep_alive=settings.get("keep_alive"),
+        num_ctx=int(num_ctx) if num_ctx is not None else None,
+    )
+
+
+def _prewarm_hosts(
+    pool: OllamaHostPool, models: list[str], keep_alive: str | int | None, client: httpx.Client
+) -> None:
+    for host in pool.hosts:
+        if not host.available(time.monotonic()):
+            continue
+        for model in models:
+            try:
+                prewarm_model(
+                    ollama_host=host.url, model=model, keep_alive=keep_alive, client=client
+                )
+            except httpx.HTTPError as exc:
+                typer.echo(f"warning: could not pre-warm {model} on {host.url} ({exc})")
+
+
+def _retry_policy(config_data: dict) -> RetryPolicy:
+    settings = config_data.get("retry", {})
+    deadline = settings.get("deadline_seconds")
+    try:
+        return RetryPolicy(
+            max_attempts=int(settings.get("max_attempts", 4)),
+            base_delay=float(settings.get("base_delay_seconds", 1.0)),
+            max_delay=float(settings.get("max_delay_seconds", 30.0)),
+            deadline=float(deadline) if deadline is not None else None,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(f"retry: {exc}") from exc
+
+
+def _stopping_policy(config_data: dict) -> StoppingPolicy:
+    settings = config_data.get("stopping", {})
+    quorum = settings.get("quorum")
+    try:
+        return StoppingPolicy(
+            early_continue=bool(settings.get("early_continue", False)),
+            quorum=float(quorum) if quorum is not None else None,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(f"stopping: {exc}") from exc
+
+
+def _ollama_host_pool(config_data: dict) -> OllamaHostPool:
+    settings = config_data.get("ollama", {})
+    entries = settings.get("hosts") or [os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")]
+    hosts: list[OllamaHost] = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"url": entry}
+        if not isinstance(entry, dict) or not str(entry.get("url", "")).strip():
+            raise typer.BadParameter("Each ollama.hosts entry needs a url")
+        max_concurrency = entry.get("max_concurrency")
+        hosts.append(
+            OllamaHost(
+                url=str(entry["url"]).strip(),
+                max_concurrency=int(max_concurrency) if max_concurrency is not None else None,
+            )
+        )
+    return OllamaHostPool(
+        hosts, cooldown_seconds=float(settings.get("host_cooldown_seconds", 10.0))
+    )
+
+
+def _check_hosts(pool: OllamaHostPool, models: list[str], client: httpx.Client) -> None:
+    reachable = 0
+    for url in pool.urls:
+        try:
+            for model in models:
+                ensure_model_available(ollama_host=url, model=model, client=client)
+        except httpx.HTTPError as exc:
+            pool.mark_down(url)
+            typer.echo(f"warning: Ollama host unreachable: {url} ({exc})")
+            continue
+        except ValueError as exc:
+            raise typer.BadParameter(f"{url}: {exc}") from exc
+        reachable += 1
+    if not reachable:
+        raise typer.BadParameter("No reachable Ollama host.")
+
+
+def _engine_callables(
+    *,
+    mode: str,
+    model: str,
+    facilitator_model: str,
+    asynchronous: bool,
+    pool: OllamaHostPool | None = None,
+    retry_policy: RetryPolicy | None = None,
+    retry_stats: RetryStats | None = None,
+    in_worker: bool = False,
+    **shared,
+) -> dict:
+    if in_worker:
+        retry_stats = WorkerRetryStats()
+
+    def bind(fn, bound_model: str):  # type: ignore[no-untyped-def]
+        if in_worker:
+            fn = partial(worker_call, fn)
+        if pool is not None:
+            fn = partial(pool.call_async if asynchronous else pool.call, fn)
+        if retry_policy is None:
+            return partial(fn, model=bound_model, **shared)
+        retry = call_with_retry_async if asynchronous else call_with_retry
+        return partial(
+            retry, fn, policy=retry_policy, stats=retry_stats, model=bound_model, **shared
+        )
+
+    if mode == "standard":
+        call_expert = call_ollama_expert_async if asynchronous else call_ollama_expert
+        return {"call_expert": bind(call_expert, model)}
+    if asynchronous:
+        ask, facilitate, rate = (
+            ask_ollama_clarification_question_async,
+            call_ollama_facilitator_async,
+            call_ollama_expert_with_clarification_async,
+        )
+    else:
+        ask, facilitate, rate = (
+            ask_ollama_clarification_question,
+            call_ollama_facilitator,
+            call_ollama_expert_with_clarification,
+        )
+    return {
+        "ask_expert_clarification": bind(ask, model),
+        "call_facilitator": bind(facilitate, facilitator_model),
+        "call_expert_with_clarification": bind(rate, model),
+    }
+
+
+async def _run_async_engine(
+    *, mode: str, client_settings: dict, call_kwargs: dict, **engine_kwargs
+) -> dict:
+    async with create_async_ollama_client(**client_settings) as client:
+        callables = _engine_callables(mode=mode, asynchronous=True, client=client, **call_kwargs)
+        run = run_standard_delphi_async if mode == "standard" else run_recursive_delphi_async
+        return await run(**engine_kwargs, **callables)
+
+
 @dataset_app.command("validate")
 def dataset_validate(config: Path = typer.Option(..., exists=False)) -> None:
     try:
@@ -60,8 +297,13 @@ def dataset_validate(config: Path = typer.Option(..., exists=False)) -> None:
         if not round2_path.exists():
             raise typer.BadParameter(f"Round 2 results file not found: {round2_path}")
 
-        r1_ratings, r1_summary = parse_round_results_xlsx(round1_path, round_number=1)
-        r2_ratings, r2_summary = parse_round_results_xlsx(round2_path, round_number=2)
+        cache_dir = _dataset_cache_dir(config, config_data)
+        r1_ratings, r1_summary = load_round_results(
+            round1_path, round_number=1, cache_dir=cache_dir, parse=parse_round_results_xlsx
+        )
+        r2_ratings, r2_summary = load_round_results(
+            round2_path, round_number=2, cache_dir=cache_dir, parse=parse_round_results_xlsx
+        )
 
         typer.echo(f"dataset config ok: {config}")
         typer.echo(
@@ -77,103 +319,438 @@ def dataset_validate(config: Path = typer.Option(..., exists=False)) -> None:
         raise typer.Exit(code=1) from exc
 
 
+def _load_round1_items(config_data: dict, *, cache_dir: Path | None) -> list[dict]:
+    smoke_limit = int(config_data.get("smoke", {}).get("limit", 5))
+    round1_path = _required_path(config_data, "dataset_paths.round1_results")
+    if not round1_path.exists():
+        raise typer.BadParameter(f"Round 1 results file not found: {round1_path}")
+
+    _, round1_summary = load_round_results(
+        round1_path, round_number=1, cache_dir=cache_dir, parse=parse_round_results_xlsx
+    )
+    return (
+        round1_summary[["item_col", "item_text"]]
+        .rename(columns={"item_col": "item_id"})
+        .head(smoke_limit)
+        .to_dict(orient="records")
+    )
+
+
+def _open_live_sqlite(
+    outputs: dict, output_dir: Path, completed_events: list[dict]
+) -> SqliteEventSink | None:
+    if not outputs.get("live_sqlite", False):
+        return None
+    path = output_dir / "results.sqlite"
+    # A resumed run rebuilds the database from the checkpoint so it never holds rows from
+    # rounds that were cut short.
+    for stale in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        stale.unlink(missing_ok=True)
+    sink = SqliteEventSink(
+        path,
+        buffer_size=int(outputs.get("live_sqlite_buffer_size", 1000)),
+        flush_interval=float(outputs.get("live_sqlite_flush_seconds", 2.0)),
+    )
+    for event in completed_events:
+        sink.emit(event)
+    return sink
+
+
+def _execute_experiment(
+    config_data: dict,
+    *,
+    resume: Path | None = None,
+    items: list[dict] | None = None,
+    dataset_cache_dir: Path | None = None,
+    output_dir: Path | None = None,
+    backend: ExecutionBackend | None = None,
+    pool: OllamaHostPool | None = None,
+) -> Path:
+    """Run one experiment and write its artefacts.
+
+    A sweep passes its own ``output_dir`` plus a ``backend`` and host ``pool`` shared with
+    the other runs; both stay open when this run returns.
+    """
+    mode = str(config_data.get("mode", "standard")).strip().lower()
+    if mode not in {"standard", "recursive"}:
+        raise typer.BadParameter("mode must be one of: standard, recursive")
+
+    model = str(config_data.get("model", "")).strip()
+    if not model:
+        raise typer.BadParameter("Missing required config key: model")
+
+    n_max = int(config_data.get("n_max", 10))
+    expert_seeds = list(config_data.get("experts", {}).get("seeds", []))
+    if not expert_seeds:
+        raise typer.BadParameter("Missing required config key: experts.seeds")
+
+    concurrency = config_data.get("concurrency", {})
+    backend_kind = str(concurrency.get("backend", "thread"))
+    max_workers = int(concurrency.get("max_workers", len(expert_seeds)))
+    max_in_flight = concurrency.get("max_in_flight")
+    max_in_flight = int(max_in_flight) if max_in_flight is not None else None
+
+    if items is None:
+        items = _load_round1_items(config_data, cache_dir=dataset_cache_dir)
+    if not items:
+        raise typer.BadParameter("No items loaded from round 1 summary.")
+
+    if pool is None:
+        pool = _ollama_host_pool(config_data)
+    if backend_kind == "process":
+        # Routing state lives in this process, so process workers talk to one fixed host.
+        if len(pool.hosts) > 1:
+            raise typer.BadParameter("concurrency.backend: process supports a single Ollama host")
+        routing = {"ollama_host": pool.urls[0]}
+    else:
+        routing = {"pool": pool}
+    retry_stats = RetryStats()
+    facilitator_model = str(config_data.get("facilitator", {}).get("model", model)).strip()
+    outputs = config_data.get("outputs", {})
+
+    if resume is not None:
+        output_dir = resume
+        if not (output_dir / "events.jsonl").exists():
+            raise typer.BadParameter(f"No events.jsonl to resume in: {output_dir}")
+        completed_events = load_checkpoint(output_dir / "events.jsonl")
+    else:
+        if output_dir is None:
+            run_dir = Path(outputs.get("run_dir", "runs/latest"))
+            timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+            output_dir = run_dir / f"run-{timestamp}"
+        completed_events = []
+    events_path = output_dir / "events.jsonl"
+    config_snapshot_path = output_dir / "config.json"
+    if not config_snapshot_path.exists():
+        output_dir.mkdir(parents=True, exist_ok=True)
+        config_snapshot_path.write_text(
+            json.dumps(config_data, ensure_ascii=True, indent=2, sort_keys=True, default=str),
+            encoding="utf-8",
+        )
+
+    engine_kwargs = {
+        "items": items,
+        "expert_seeds": expert_seeds,
+        "n_max": n_max,
+        "max_in_flight": max_in_flight,
+        "completed_events": completed_events,
+        "stopping": _stopping_policy(config_data),
+    }
+    client_settings = _ollama_client_settings(config_data)
+    generation = _generation_settings(config_data)
+    cache = _open_response_cache(config_data)
+    call_kwargs = {
+        "model": model,
+        "facilitator_model": facilitator_model,
+        "cache": cache,
+        "settings": generation,
+        "retry_policy": _retry_policy(config_data),
+        "retry_stats": retry_stats,
+        **routing,
+    }
+    with create_ollama_client(**client_settings) as client:
+        # Replay runs are served entirely from the cache and never reach Ollama.
+        if cache is None or not cache.read_only:
+            required = [model, facilitator_model] if mode == "recursive" else [model]
+            _check_hosts(pool, required, client)
+            if config_data.get("ollama", {}).get("prewarm", True):
+                _prewarm_hosts(pool, sorted(set(required)), generation.keep_alive, client)
+
+        started = time.perf_counter()
+        try:
+            live_sink = _open_live_sqlite(outputs, output_dir, completed_events)
+            event_sink = JsonlEventSink(
+                events_path,
+                append=resume is not None,
+                buffer_size=int(outputs.get("events_buffer_size", 256)),
+                flush_interval=float(outputs.get("events_flush_seconds", 1.0)),
+            )
+            if live_sink is not None:
+                event_sink = FanoutEventSink(event_sink, live_sink)
+            with event_sink:
+                if backend_kind == "asyncio":
+                    engine_kwargs["max_in_flight"] = max_in_flight or max_workers
+                    run_data = asyncio.run(
+                        _run_async_engine(
+                            mode=mode,
+                            client_settings=client_settings,
+                            call_kwargs=call_kwargs,
+                            event_sink=event_sink,
+                            **engine_kwargs,
+                        )
+                    )
+                else:
+                    shared_backend = backend is not None
+                    if not shared_backend and backend_kind == "process":
+                        backend = OllamaWorkerBackend(
+                            max_workers,
+                            client_settings=client_settings,
+                            cache=cache,
+                            retry_stats=retry_stats,
+                        )
+                    elif not shared_backend:
+                        try:
+                            backend = create_backend(backend_kind, max_workers=max_workers)
+                        except ValueError as exc:
+                            raise typer.BadParameter(str(exc)) from exc
+                    if isinstance(backend, OllamaWorkerBackend):
+                        # httpx clients and sqlite connections cannot be pickled; each worker
+                        # process opens its own once and reports its counters back.
+                        callables = _engine_callables(
+                            mode=mode,
+                            asynchronous=False,
+                            in_worker=True,
+                            **{k: v for k, v in call_kwargs.items() if k != "cache"},
+                        )
+                    else:
+                        callables = _engine_callables(
+                            mode=mode, asynchronous=False, client=client, **call_kwargs
+                        )
+                    run = run_standard_delphi if mode == "standard" else run_recursive_delphi
+                    with nullcontext(backend) if shared_backend else backend:
+                        run_data = run(
+                            **engine_kwargs, backend=backend, event_sink=event_sink, **callables
+                        )
+                if live_sink is not None:
+                    live_sink.write_item_results(run_data["item_results"])
+        except CacheMissError as exc:
+            raise typer.BadParameter(f"replay cache miss: {exc}") from exc
+        finally:
+            if cache is not None:
+                cache.close()
+    wall_time = time.perf_counter() - started
+
+    # The sink wrote rounds as they closed; put them back in item/round order.
+    sort_events_file(events_path, [str(r["item_id"]) for r in run_data["item_results"]])
+    summary_path = output_dir / "summary.json"
+    with summary_path.open("w", encoding="utf-8") as handle:
+        json.dump(run_data["item_results"], handle, ensure_ascii=True, indent=2)
+    columnar = bool(outputs.get("columnar", False))
+    if columnar and not columnar_available():
+        typer.echo("columnar artefacts skipped: pyarrow is not installed")
+        columnar = False
+    report, columnar_paths = write_run_report(
+        output_dir,
+        item_results=run_data["item_results"],
+        wall_time_seconds=wall_time,
+        columnar=columnar,
+    )
+    report_path = output_dir / "run_report.json"
+
+    if completed_events:
+        typer.echo(f"resumed: {len(completed_events)} events restored from checkpoint")
+    typer.echo(f"experiment run complete: {output_dir}")
+    typer.echo(f"events: {events_path}")
+    typer.echo(f"summary: {summary_path}")
+    typer.echo(f"report: {report_path}")
+    if live_sink is not None:
+        typer.echo(f"live sqlite: {live_sink.path}")
+    for columnar_path in columnar_paths:
+        typer.echo(f"columnar: {columnar_path}")
+    latency = report["overall"]["latency_ms"]
+    if report["overall"]["calls"]:
+        typer.echo(
+            f"latency ms: p50={latency['p50']:.0f} p95={latency['p95']:.0f} "
+            f"p99={latency['p99']:.0f} wall_time={wall_time:.1f}s"
+        )
+    if cache is not None:
+        stats = cache.stats()
+        typer.echo(f"cache: hits={stats['hits']} misses={stats['misses']}")
+    if retry_stats is not None:
+        for retried_model, counts in retry_stats.snapshot().items():
+            typer.echo(
+                f"retries: model={retried_model} retries={counts['retries']} "
+                f"exhausted={counts['exhausted']}"
+            )
+    return output_dir
+
+
+def _run_shard(
+    config_data: dict, run_dir: Path, *, index: int, count: int, items: list[dict]
+) -> Path:
+    """Run (or continue) one shard of ``run_dir``; a finished shard is left untouched."""
+    output_dir = shard_dir(run_dir, index=index, count=count)
+    if (output_dir / "summary.json").exists():
+        typer.echo(f"shard {index} of {count} already complete: {output_dir}")
+        return output_dir
+    resume = output_dir if (output_dir / "events.jsonl").exists() else None
+    return _execute_experiment(
+        {**config_data, "shard": {"index": index, "count": count}},
+        resume=resume,
+        items=shard_items(items, index=index, count=count),
+        output_dir=output_dir,
+    )
+
+
+def _merge_shards(run_dir: Path, count: int) -> None:
+    try:
+        paths = merge_shards(run_dir, count=count)
+    except (FileNotFoundError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    typer.echo(f"merged {count} shards: {run_dir}")
+    typer.echo(f"events: {paths['events']}")
+    typer.echo(f"summary: {paths['summary']}")
+
+
+def _run_sharded(config_data: dict, *, count: int, items: list[dict]) -> Path:
+    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    run_dir = Path(config_data.get("outputs", {}).get("run_dir", "runs/latest"))
+    run_dir = run_dir / f"run-{timestamp}"
+    backend_kind = str(config_data.get("concurrency", {}).get("shard_backend", "process"))
+    try:
+        backend = create_backend(backend_kind, max_workers=count)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    with backend:
+        futures = [
+            backend.submit(_run_shard, config_data, run_dir, index=index, count=count, items=items)
+            for index in range(count)
+        ]
+        for future in futures:
+            future.result()
+    _merge_shards(run_dir, count)
+    return run_dir
+
+
 @experiment_app.command("run")
-def experiment_run(config: Path = typer.Option(..., exists=False)) -> None:
+def experiment_run(
+    config: Path = typer.Option(..., exists=False),
+    resume: Path | None = typer.Option(
+        None, "--resume", help="Run directory of an interrupted run to continue."
+    ),
+    live_sqlite: bool = typer.Option(
+        False, "--live-sqlite", help="Also write events to <run dir>/results.sqlite as they close."
+    ),
+    shards: int = typer.Option(
+        1, "--shards", min=1, help="Split the items across N local worker processes."
+    ),
+) -> None:
     try:
         _ensure_config_exists(config)
         config_data = load_yaml(config)
-        mode = str(config_data.get("mode", "standard")).strip().lower()
-        if mode not in {"standard", "recursive"}:
-            raise typer.BadParameter("mode must be one of: standard, recursive")
+        if live_sqlite:
+            config_data.setdefault("outputs", {})["live_sqlite"] = True
+        cache_dir = _dataset_cache_dir(config, config_data)
+        if shards > 1:
+            if resume is not None:
+                raise typer.BadParameter(
+                    "--resume does not apply to sharded runs; rerun 'experiment shard'"
+                )
+            items = _load_round1_items(config_data, cache_dir=cache_dir)
+            _run_sharded(config_data, count=shards, items=items)
+            return
+        _execute_experiment(config_data, resume=resume, dataset_cache_dir=cache_dir)
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
 
-        model = str(config_data.get("model", "")).strip()
-        if not model:
-            raise typer.BadParameter("Missing required config key: model")
 
-        n_max = int(config_data.get("n_max", 10))
-        expert_seeds = list(config_data.get("experts", {}).get("seeds", []))
-        if not expert_seeds:
-            raise typer.BadParameter("Missing required config key: experts.seeds")
+@experiment_app.command("shard")
+def experiment_shard(
+    config: Path = typer.Option(..., exists=False),
+    run_dir: Path = typer.Option(..., "--run-dir", help="Run directory shared by all shards."),
+    index: int = typer.Option(..., "--index", min=0, help="Shard to run, from 0."),
+    count: int = typer.Option(..., "--count", min=1, help="Total number of shards."),
+) -> None:
+    try:
+        _ensure_config_exists(config)
+        config_data = load_yaml(config)
+        if index >= count:
+            raise typer.BadParameter("--index must be smaller than --count")
+        items = _load_round1_items(config_data, cache_dir=_dataset_cache_dir(config, config_data))
+        _run_shard(config_data, run_dir, index=index, count=count, items=items)
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
 
-        smoke_limit = int(config_data.get("smoke", {}).get("limit", 5))
-        round1_path = _required_path(config_data, "dataset_paths.round1_results")
-        if not round1_path.exists():
-            raise typer.BadParameter(f"Round 1 results file not found: {round1_path}")
 
-        _, round1_summary = parse_round_results_xlsx(round1_path, round_number=1)
-        items = (
-            round1_summary[["item_col", "item_text"]]
-            .rename(columns={"item_col": "item_id"})
-            .head(smoke_limit)
-            .to_dict(orient="records")
-        )
-        if not items:
-            raise typer.BadParameter("No items loaded from round 1 summary.")
+@experiment_app.command("merge")
+def experiment_merge(
+    run_dir: Path = typer.Option(..., "--run-dir", help="Run directory holding shards/."),
+    count: int = typer.Option(..., "--count", min=1, help="Total number of shards."),
+) -> None:
+    try:
+        _merge_shards(run_dir, count)
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
+
 
-        ollama_host = os.getenv("OLLAMA_HOST", "http://127.0.0.1:11434")
+@experiment_app.command("sweep")
+def experiment_sweep(
+    config: Path = typer.Option(..., exists=False),
+    grid: Path = typer.Option(..., exists=False, help="YAML grid of models, seeds, n_max, modes."),
+) -> None:
+    try:
+        _ensure_config_exists(config)
+        _ensure_config_exists(grid)
+        config_data = load_yaml(config)
+        grid_data = load_yaml(grid)
         try:
-            ensure_model_available(ollama_host=ollama_host, model=model)
-            facilitator_model = str(config_data.get("facilitator", {}).get("model", model)).strip()
-            if mode == "recursive":
-                ensure_model_available(ollama_host=ollama_host, model=facilitator_model)
+            runs = expand_grid(grid_data, config_data)
         except ValueError as exc:
             raise typer.BadParameter(str(exc)) from exc
-
-        if mode == "standard":
-            run_data = run_standard_delphi(
-                items=items,
-                expert_seeds=expert_seeds,
-                n_max=n_max,
-                call_expert=lambda **kwargs: call_ollama_expert(  # noqa: E731
-                    model=model,
-                    ollama_host=ollama_host,
-                    **kwargs,
-                ),
-            )
-        else:
-            run_data = run_recursive_delphi(
-                items=items,
-                expert_seeds=expert_seeds,
-                n_max=n_max,
-                ask_expert_clarification=lambda **kwargs: ask_ollama_clarification_question(  # noqa: E731
-                    model=model,
-                    ollama_host=ollama_host,
-                    **kwargs,
-                ),
-                call_facilitator=lambda **kwargs: call_ollama_facilitator(  # noqa: E731
-                    model=facilitator_model,
-                    ollama_host=ollama_host,
-                    **kwargs,
-                ),
-                call_expert_with_clarification=lambda **kwargs: call_ollama_expert_with_clarification(  # noqa: E731
-                    model=model,
-                    ollama_host=ollama_host,
-                    **kwargs,
+        concurrency = config_data.get("concurrency", {})
+        budget = int(grid_data.get("max_workers", concurrency.get("max_workers", 10)))
+        if budget < 1:
+            raise typer.BadParameter("sweep max_workers must be at least 1")
+        max_parallel_runs = grid_data.get("max_parallel_runs")
+        facilitator_model = grid_data.get("facilitator_model")
+
+        items = _load_round1_items(config_data, cache_dir=_dataset_cache_dir(config, config_data))
+        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        sweep_dir = Path(config_data.get("outputs", {}).get("run_dir", "runs/latest"))
+        sweep_dir = sweep_dir / f"sweep-{timestamp}"
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        typer.echo(f"sweep: {len(runs)} runs, max_workers={budget}, dir={sweep_dir}")
+
+        # One host pool and one worker pool for every run: the budget is global, not per run.
+        pool = _ollama_host_pool(config_data)
+        with create_backend("thread", max_workers=budget) as backend:
+            results = run_sweep(
+                runs,
+                execute=lambda run: _execute_experiment(
+                    resolve_config(
+                        config_data,
+                        run,
+                        max_workers=budget,
+                        facilitator_model=facilitator_model,
+                    ),
+                    items=items,
+                    output_dir=sweep_dir / run.name,
+                    backend=backend,
+                    pool=pool,
                 ),
+                max_parallel_runs=int(max_parallel_runs) if max_parallel_runs else None,
             )
+        manifest_path = sweep_dir / "sweep.json"
+        manifest_path.write_text(
+            json.dumps({"grid": grid_data, "runs": results}, ensure_ascii=True, indent=2),
+            encoding="utf-8",
+        )
 
-        run_dir = Path(config_data.get("outputs", {}).get("run_dir", "runs/latest"))
-        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
-        output_dir = run_dir / f"run-{timestamp}"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        events_path = output_dir / "events.jsonl"
-        with events_path.open("w", encoding="utf-8") as handle:
-            for event in run_data["event_log"]:
-                handle.write(json.dumps(event, ensure_ascii=True) + "\n")
-
-        summary_path = output_dir / "summary.json"
-        with summary_path.open("w", encoding="utf-8") as handle:
-            json.dump(run_data["item_results"], handle, ensure_ascii=True, indent=2)
-
-        typer.echo(f"experiment run complete: {output_dir}")
-        typer.echo(f"events: {events_path}")
-        typer.echo(f"summary: {summary_path}")
+        failed = [r for r in results if r["status"] != "completed"]
+        for record in results:
+            detail = record.get("run_dir") or record.get("error")
+            typer.echo(f"{record['name']}: {record['status']} {detail}")
+        typer.echo(f"sweep manifest: {manifest_path}")
+        if failed:
+            raise typer.BadParameter(f"{len(failed)} of {len(results)} sweep runs failed")
     except typer.BadParameter as exc:
         typer.echo(str(exc))
         raise typer.Exit(code=1) from exc
 
 
+def _consensus_thresholds(config_data: dict) -> ConsensusThresholds:
+    categories_config = config_data.get("evaluation", {}).get("categories_config")
+    if categories_config is None:
+        return ConsensusThresholds()
+    path = Path(categories_config)
+    if not path.exists():
+        raise typer.BadParameter(f"Categories config not found: {path}")
+    return load_consensus_thresholds(path)
+
+
 @evaluate_app.command("run")
 def evaluate_run(config: Path = typer.Option(..., exists=False)) -> None:
     try:
@@ -185,12 +762,14 @@ def evaluate_run(config: Path = typer.Option(..., exists=False)) -> None:
             raise typer.BadParameter(f"Round 2 results file not found: {round2_path}")
 
         run_dir = load_latest_run_dir(run_dir_base)
-        result = evaluate_run_against_human(run_dir=run_dir, round2_results_path=round2_path)
+        result = evaluate_run_against_human(
+            run_dir=run_dir,
+            round2_results_path=round2_path,
+            cache_dir=_dataset_cache_dir(config, config_data),
+            thresholds=_consensus_thresholds(config_data),
+        )
 
-        summary_path = run_dir / "evaluation_summary.json"
-        items_path = run_dir / "evaluation_items.csv"
-        summary_path.write_text(json.dumps(result["summary"], ensure_ascii=True, indent=2), encoding="utf-8")
-        result["items"].to_csv(items_path, index=False)
+        summary_path, items_path = write_evaluation(run_dir, result)
 
         typer.echo(f"evaluation complete: {run_dir}")
         typer.echo(f"summary: {summary_path}")
@@ -200,15 +779,212 @@ def evaluate_run(config: Path = typer.Option(..., exists=False)) -> None:
         raise typer.Exit(code=1) from exc
 
 
+@evaluate_app.command("all")
+def evaluate_all(
+    config: Path = typer.Option(..., exists=False),
+    base: list[Path] | None = typer.Option(
+        None, "--base", help="Directory with run-* folders (repeatable); default outputs.run_dir."
+    ),
+    workers: int = typer.Option(os.cpu_count() or 1, "--workers", min=1),
+    force: bool = typer.Option(False, "--force", help="Re-evaluate runs with current results."),
+    output: Path | None = typer.Option(None, "--output", help="Leaderboard CSV path."),
+) -> None:
+    try:
+        _ensure_config_exists(config)
+        config_data = load_yaml(config)
+        outputs = config_data.get("outputs", {})
+        round2_path = _required_path(config_data, "dataset_paths.round2_results")
+        if not round2_path.exists():
+            raise typer.BadParameter(f"Round 2 results file not found: {round2_path}")
+
+        result = evaluate_all_runs(
+            bases=base or [Path(outputs.get("run_dir", "runs/latest"))],
+            round2_results_path=round2_path,
+            cache_dir=_dataset_cache_dir(config, config_data),
+            thresholds=_consensus_thresholds(config_data),
+            max_workers=workers,
+            force=force,
+        )
+        board = result["leaderboard"]
+        leaderboard_path = output or Path(outputs.get("leaderboard_path", "runs/leaderboard.csv"))
+        leaderboard_path.parent.mkdir(parents=True, exist_ok=True)
+        board.to_csv(leaderboard_path, index=False)
+
+        typer.echo(
+            f"evaluated: {len(result['evaluated'])} reused: {len(result['reused'])} "
+            f"leaderboard: {leaderboard_path}"
+        )
+        for row in board.itertuples(index=False):
+            typer.echo(
+                f"{row.rank}. {row.run_id} model={row.model} match={row.decision_match_ratio:.3f} "
+                f"median_err={row.mean_abs_median_error:.3f} rounds={row.mean_rounds_run:.2f}"
+            )
+    except (typer.BadParameter, FileNotFoundError) as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
+
+
 @export_app.command("sqlite")
 def export_sqlite(config: Path = typer.Option(..., exists=False)) -> None:
     try:
         _ensure_config_exists(config)
         config_data = load_yaml(config)
         run_dir_base = Path(config_data.get("outputs", {}).get("run_dir", "runs/latest"))
-        sqlite_path = Path(config_data.get("outputs", {}).get("sqlite_path", "runs/latest/results.sqlite"))
+        sqlite_path = Path(
+            config_data.get("outputs", {}).get("sqlite_path", "runs/latest/results.sqlite")
+        )
         exported = export_latest_run_to_sqlite(base_run_dir=run_dir_base, sqlite_path=sqlite_path)
         typer.echo(f"sqlite export complete: {exported}")
     except (typer.BadParameter, FileNotFoundError) as exc:
         typer.echo(str(exc))
         raise typer.Exit(code=1) from exc
+
+
+@export_app.command("warehouse")
+def export_warehouse(config: Path = typer.Option(..., exists=False)) -> None:
+    try:
+        _ensure_config_exists(config)
+        config_data = load_yaml(config)
+        outputs = config_data.get("outputs", {})
+        run_dir_base = Path(outputs.get("run_dir", "runs/latest"))
+        warehouse_path = Path(outputs.get("warehouse_path", "runs/warehouse.sqlite"))
+        result = export_runs_to_warehouse(base_run_dir=run_dir_base, sqlite_path=warehouse_path)
+        typer.echo(f"warehouse export complete: {warehouse_path}")
+        typer.echo(
+            f"runs: ingested={len(result['ingested'])} skipped={len(result['skipped'])} "
+            f"incomplete={len(result['incomplete'])}"
+        )
+    except (typer.BadParameter, FileNotFoundError) as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
+
+
+def _mock_profile(config_data: dict) -> MockProfile:
+    settings = config_data.get("mock", {})
+    models = settings.get("models")
+    if not models:
+        model = str(config_data.get("model", "qwen3-4b")).strip()
+        models = sorted({model, str(config_data.get("facilitator", {}).get("model", model))})
+    try:
+        return MockProfile(
+            models=tuple(str(name) for name in models),
+            latency=str(settings.get("latency", "fixed")),
+            latency_ms=float(settings.get("latency_ms", 50.0)),
+            jitter_ms=float(settings.get("jitter_ms", 0.0)),
+            sigma=float(settings.get("sigma", 0.5)),
+            error_rate=float(settings.get("error_rate", 0.0)),
+            malformed_rate=float(settings.get("malformed_rate", 0.0)),
+            agreement=float(settings.get("agreement", 0.8)),
+            seed=int(settings.get("seed", 0)),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(f"mock: {exc}") from exc
+
+
+@mock_app.command("serve")
+def mock_serve(
+    config: Path | None = typer.Option(None, exists=False),
+    host: str = typer.Option("127.0.0.1"),
+    port: int = typer.Option(11434),
+) -> None:
+    try:
+        config_data = {}
+        if config is not None:
+            _ensure_config_exists(config)
+            config_data = load_yaml(config)
+        server = MockOllamaServer(_mock_profile(config_data), host=host, port=port)
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
+    typer.echo(f"mock ollama listening: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+@mock_app.command("run")
+def mock_run(
+    config: Path = typer.Option(..., exists=False),
+    items: int | None = typer.Option(
+        None, "--items", help="Use N synthetic items instead of the round 1 dataset."
+    ),
+    hosts: int = typer.Option(1, "--hosts", min=1, help="Number of mock servers to balance over."),
+) -> None:
+    try:
+        _ensure_config_exists(config)
+        config_data = load_yaml(config)
+        profile = _mock_profile(config_data)
+        servers = [MockOllamaServer(profile).start() for _ in range(hosts)]
+        try:
+            # Mock answers must never land in the real response cache.
+            run_config = {
+                **config_data,
+                "ollama": {
+                    **config_data.get("ollama", {}),
+                    "hosts": [server.url for server in servers],
+                },
+                "cache": {"mode": "off"},
+            }
+            synthetic = None
+            if items is not None:
+                synthetic = [
+                    {"item_id": str(idx), "item_text": f"Synthetic Delphi item {idx}."}
+                    for idx in range(1, items + 1)
+                ]
+            started = time.perf_counter()
+            _execute_experiment(
+                run_config,
+                items=synthetic,
+                dataset_cache_dir=_dataset_cache_dir(config, config_data),
+            )
+            wall_time = time.perf_counter() - started
+        finally:
+            for server in servers:
+                server.stop()
+        requests = sum(server.requests for server in servers)
+        typer.echo(f"mock requests: {requests} wall_time={wall_time:.2f}s")
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
+
+
+_BENCH_SCALE_HELP = f"One of: {', '.join(SCALES)}."
+_BENCH_ONLY_HELP = f"Benchmarks to run: {', '.join(BENCHMARKS)}."
+
+
+@app.command("bench")
+def bench(
+    output: Path = typer.Option("runs/bench/bench.json", "--output"),
+    scale: str = typer.Option("quick", "--scale", help=_BENCH_SCALE_HELP),
+    only: list[str] | None = typer.Option(None, "--only", help=_BENCH_ONLY_HELP),
+    baseline: Path | None = typer.Option(
+        None, "--baseline", help="Earlier bench JSON to compare median timings against."
+    ),
+) -> None:
+    try:
+        if baseline is not None and not baseline.exists():
+            raise typer.BadParameter(f"Baseline file not found: {baseline}")
+        try:
+            report = run_benchmarks(scale=scale, names=only)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8")
+
+        ratios = {}
+        if baseline is not None:
+            ratios = compare_to_baseline(report, json.loads(baseline.read_text(encoding="utf-8")))
+        for name, result in report["results"].items():
+            line = (
+                f"{name}: median={result['median_seconds']:.4f}s min={result['min_seconds']:.4f}s"
+            )
+            if name in ratios:
+                line += f" vs_baseline={ratios[name]:.2f}x"
+            typer.echo(line)
+        typer.echo(f"bench results: {output}")
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1) from exc
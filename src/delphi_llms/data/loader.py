@@ -1,18 +1,172 @@
+import glob
+import hashlib
+import importlib.util
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+# Bump when parse_dataset_sheet output changes so cached frames are rebuilt.
+PARSED_CACHE_VERSION = 2
 
 
 def load_csv(path: Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+def item_key(item_text: object) -> str:
+    """Stable join key for an item: a hash of its text with case and whitespace normalised."""
+    normalized = " ".join(str(item_text).split()).casefold()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+# Strings pandas.read_excel treats as missing by default.
+_NA_STRINGS = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+_SUMMARY_LABELS = (
+    "Min",
+    "Max",
+    "Median",
+    "AGREEMENT_INCLUSION",
+    "AGREEMENT_EXCLUSION",
+)
+_COMMENTS_LABEL = "Comments summary"
+
+
+def _cell_value(value: object) -> object:
+    if value is None or (isinstance(value, str) and (value in _NA_STRINGS or value in ERROR_CODES)):
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def read_dataset_sheet(path: Path) -> pd.DataFrame:
+    """Stream the rows ``parse_dataset_sheet`` needs from the "Dataset" sheet.
+
+    Only the two header rows, the expert rows and the summary rows are kept, indexed by their
+    sheet row number. Reading stops once the required summary rows have been seen and the
+    next non-empty row shows whether the optional "Comments summary" row follows them.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if "Dataset" not in workbook.sheetnames:
+            raise ValueError("Worksheet named 'Dataset' not found")
+        sheet = workbook["Dataset"]
+        sheet.reset_dimensions()
+        pending = set(_SUMMARY_LABELS)
+        comments_seen = False
+        rows: dict[int, list[object]] = {}
+        for row_number, values in enumerate(sheet.iter_rows(values_only=True)):
+            label = str(_cell_value(values[0]) if values else np.nan).strip()
+            if not pending:
+                # Only the optional comments row may still follow the required ones.
+                if label == _COMMENTS_LABEL and not comments_seen:
+                    rows[row_number] = [_cell_value(value) for value in values]
+                elif not comments_seen and all(pd.isna(_cell_value(v)) for v in values):
+                    continue
+                break
+            if (
+                row_number < 2
+                or label.lower() == "anonymised expert"
+                or label in pending
+                or label == _COMMENTS_LABEL
+            ):
+                rows[row_number] = [_cell_value(value) for value in values]
+                pending.discard(label)
+                comments_seen = comments_seen or label == _COMMENTS_LABEL
+    finally:
+        workbook.close()
+    return pd.DataFrame(list(rows.values()), index=list(rows))
+
+
 def parse_round_results_xlsx(path: Path, round_number: int) -> tuple[pd.DataFrame, pd.DataFrame]:
-    dataset_sheet = pd.read_excel(path, sheet_name="Dataset", header=None)
-    return parse_dataset_sheet(dataset_sheet, round_number=round_number)
+    return parse_dataset_sheet(read_dataset_sheet(path), round_number=round_number)
+
+
+def dataset_fingerprint(path: Path, round_number: int) -> str:
+    stat = path.stat()
+    content = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            content.update(chunk)
+    material = "|".join(
+        [
+            str(path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            content.hexdigest(),
+            str(round_number),
+            str(PARSED_CACHE_VERSION),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _parquet_available() -> bool:
+    return any(importlib.util.find_spec(name) for name in ("pyarrow", "fastparquet"))
+
+
+def load_round_results(
+    path: Path,
+    round_number: int,
+    *,
+    cache_dir: Path | None = None,
+    parse: Callable[..., tuple[pd.DataFrame, pd.DataFrame]] = parse_round_results_xlsx,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Without a Parquet engine the workbook is simply parsed every time.
+    if cache_dir is None or not _parquet_available():
+        return parse(path, round_number=round_number)
+
+    path_key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+    prefix = f"{path.stem}-{path_key}-round{round_number}"
+    stem = f"{prefix}-{dataset_fingerprint(path, round_number)[:16]}"
+    ratings_path = cache_dir / f"{stem}.ratings.parquet"
+    summary_path = cache_dir / f"{stem}.summary.parquet"
+    if ratings_path.exists() and summary_path.exists():
+        try:
+            return pd.read_parquet(ratings_path), pd.read_parquet(summary_path)
+        except (OSError, ValueError):
+            pass
+
+    ratings_long, item_summary = parse(path, round_number=round_number)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{glob.escape(prefix)}-*.parquet"):
+        stale.unlink(missing_ok=True)
+    for frame, target in ((ratings_long, ratings_path), (item_summary, summary_path)):
+        tmp_path = target.with_suffix(".parquet.tmp")
+        frame.to_parquet(tmp_path)
+        tmp_path.replace(target)
+    return ratings_long, item_summary
 
 
-def parse_dataset_sheet(dataset_sheet: pd.DataFrame, round_number: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+def parse_dataset_sheet(
+    dataset_sheet: pd.DataFrame, round_number: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     labels = dataset_sheet[0].astype(str).str.strip()
     lower_labels = labels.str.lower()
 
@@ -47,63 +201,51 @@ def parse_dataset_sheet(dataset_sheet: pd.DataFrame, round_number: int) -> tuple
     ]
 
     domains = domain_row.ffill()
-    item_meta = pd.DataFrame(
-        {
-            "item_col": item_columns,
-            "item_domain": [str(domains.iloc[col]).strip() for col in item_columns],
-            "item_text": [str(item_text_row.iloc[col]).strip() for col in item_columns],
-        }
-    )
-
-    ratings_records: list[dict] = []
-    for expert_seq, row_idx in enumerate(expert_rows, start=1):
-        for item_col in item_columns:
-            rating = pd.to_numeric(dataset_sheet.iloc[row_idx, item_col], errors="coerce")
-            if pd.isna(rating):
-                continue
-            meta = item_meta[item_meta["item_col"] == item_col].iloc[0]
-            ratings_records.append(
-                {
-                    "round": round_number,
-                    "expert_seq": expert_seq,
-                    "expert_label": "Anonymised expert",
-                    "row_idx": row_idx,
-                    "item_col": item_col,
-                    "item_domain": meta["item_domain"],
-                    "item_text": meta["item_text"],
-                    "rating": int(rating),
-                }
-            )
-
-    ratings_long = pd.DataFrame(ratings_records)
-
-    summary_records: list[dict] = []
-    for item_col in item_columns:
-        meta = item_meta[item_meta["item_col"] == item_col].iloc[0]
-        summary_records.append(
+    item_domains = [str(domains.iloc[col]).strip() for col in item_columns]
+    item_texts = [str(item_text_row.iloc[col]).strip() for col in item_columns]
+
+    # Coerce the whole expert x item block at once and keep the non-missing cells in
+    # expert-major order.
+    block = dataset_sheet.loc[expert_rows].iloc[:, item_columns]
+    ratings = block.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    expert_pos, item_pos = np.nonzero(~np.isnan(ratings))
+    if len(expert_pos):
+        ratings_long = pd.DataFrame(
             {
                 "round": round_number,
-                "item_col": item_col,
-                "item_domain": meta["item_domain"],
-                "item_text": meta["item_text"],
-                "min": pd.to_numeric(dataset_sheet.iloc[summary_row_index["min"], item_col], errors="coerce"),
-                "max": pd.to_numeric(dataset_sheet.iloc[summary_row_index["max"], item_col], errors="coerce"),
-                "median": pd.to_numeric(
-                    dataset_sheet.iloc[summary_row_index["median"], item_col], errors="coerce"
-                ),
-                "agreement_inclusion": pd.to_numeric(
-                    dataset_sheet.iloc[summary_row_index["agreement_inclusion"], item_col], errors="coerce"
-                ),
-                "agreement_exclusion": pd.to_numeric(
-                    dataset_sheet.iloc[summary_row_index["agreement_exclusion"], item_col], errors="coerce"
-                ),
-                "comments_summary": (
-                    str(dataset_sheet.iloc[comments_row_index, item_col]).strip()
-                    if comments_row_index is not None and pd.notna(dataset_sheet.iloc[comments_row_index, item_col])
-                    else None
-                ),
+                "expert_seq": expert_pos + 1,
+                "expert_label": "Anonymised expert",
+                "row_idx": np.asarray(expert_rows, dtype=np.int64)[expert_pos],
+                "item_col": np.asarray(item_columns, dtype=np.int64)[item_pos],
+                "item_domain": np.asarray(item_domains, dtype=object)[item_pos],
+                "item_text": np.asarray(item_texts, dtype=object)[item_pos],
+                "rating": np.trunc(ratings[expert_pos, item_pos]).astype(np.int64),
             }
         )
+    else:
+        ratings_long = pd.DataFrame()
+
+    if not item_columns:
+        return ratings_long, pd.DataFrame()
+
+    def summary_row(row_idx: int) -> pd.Series:
+        values = pd.Series(dataset_sheet.loc[row_idx].iloc[item_columns].tolist(), dtype=object)
+        return pd.to_numeric(values, errors="coerce")
+
+    comments: list[str | None] = [None] * len(item_columns)
+    if comments_row_index is not None:
+        cells = dataset_sheet.loc[comments_row_index].iloc[item_columns].tolist()
+        comments = [str(cell).strip() if pd.notna(cell) else None for cell in cells]
 
-    item_summary = pd.DataFrame(summary_records)
+    item_summary = pd.DataFrame(
+        {
+            "round": round_number,
+            "item_col": item_columns,
+            "item_domain": item_domains,
+            "item_text": item_texts,
+            "item_key": [item_key(text) for text in item_texts],
+            **{key: summary_row(row_idx).to_numpy() for key, row_idx in summary_row_index.items()},
+            "comments_summary": comments,
+        }
+    )
     return ratings_long, item_summary
@@ -0,0 +1,187 @@
+import importlib.util
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import pandas as pd
+
+from delphi_llms.delphi.events import RUN_CALLS_COLUMNS, iter_events, run_call_rows
+from delphi_llms.instrumentation import CallSummary
+
+COLUMNAR_FILES = {
+    "expert_responses": "expert_responses.parquet",
+    "round_summaries": "round_summaries.parquet",
+    "calls": "calls.parquet",
+    "item_results": "item_results.parquet",
+}
+
+EXPERT_RESPONSE_COLUMNS = (
+    "item_id",
+    "round",
+    "expert_id",
+    "rating",
+    "category",
+    "rationale",
+    "confidence",
+    "clarification_question",
+    "facilitator_answer",
+)
+
+ROUND_SUMMARY_COLUMNS = (
+    "item_id",
+    "round",
+    "categories",
+    "stop",
+    "reason",
+    "median",
+    "agreement_inclusion",
+    "agreement_exclusion",
+)
+
+_DTYPES = {
+    "round": "int64",
+    "rating": "int64",
+    "confidence": "float64",
+    "stop": "bool",
+    "median": "float64",
+    "agreement_inclusion": "float64",
+    "agreement_exclusion": "float64",
+    "call_index": "int64",
+    "cached": "bool",
+    "queue_wait_ms": "float64",
+    "latency_ms": "float64",
+    "total_ms": "float64",
+    "load_ms": "float64",
+    "prompt_eval_ms": "float64",
+    "eval_ms": "float64",
+    "prompt_eval_count": "Int64",
+    "eval_count": "Int64",
+    "rounds_run": "int64",
+    "final_median": "float64",
+    "final_agreement_inclusion": "float64",
+    "final_agreement_exclusion": "float64",
+}
+
+
+def columnar_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _typed(rows: list, columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    frame = pd.DataFrame(rows, columns=list(columns) if columns else None)
+    return frame.astype({c: t for c, t in _DTYPES.items() if c in frame.columns})
+
+
+class EventRows:
+    """Columnar rows of a run's events, collected one event at a time."""
+
+    def __init__(self) -> None:
+        self.responses: list[tuple] = []
+        self.summaries: list[tuple] = []
+        self.calls: list[tuple] = []
+
+    def add(self, event: dict) -> None:
+        if event.get("type") == "expert_response":
+            self.responses.append(tuple(event.get(c) for c in EXPERT_RESPONSE_COLUMNS))
+            self.calls.extend(run_call_rows(event))
+        elif event.get("type") == "round_summary":
+            self.summaries.append(tuple(event.get(c) for c in ROUND_SUMMARY_COLUMNS))
+
+    def frames(self) -> dict[str, pd.DataFrame]:
+        return {
+            "expert_responses": _typed(self.responses, EXPERT_RESPONSE_COLUMNS),
+            "round_summaries": _typed(self.summaries, ROUND_SUMMARY_COLUMNS),
+            "calls": _typed(self.calls, RUN_CALLS_COLUMNS),
+        }
+
+
+def event_frames(events: Iterable[dict]) -> dict[str, pd.DataFrame]:
+    rows = EventRows()
+    for event in events:
+        rows.add(event)
+    return rows.frames()
+
+
+def _write_frames(run_dir: Path, frames: dict[str, pd.DataFrame]) -> list[Path]:
+    written: list[Path] = []
+    for name, frame in frames.items():
+        target = run_dir / COLUMNAR_FILES[name]
+        tmp_path = target.with_suffix(".parquet.tmp")
+        frame.to_parquet(tmp_path, engine="pyarrow", index=False)
+        tmp_path.replace(target)
+        written.append(target)
+    return written
+
+
+def write_columnar_artifacts(
+    run_dir: Path, *, events: Iterable[dict], item_results: list[dict]
+) -> list[Path]:
+    return _write_frames(run_dir, {**event_frames(events), "item_results": _typed(item_results)})
+
+
+def write_run_report(
+    run_dir: Path,
+    *,
+    item_results: list[dict],
+    wall_time_seconds: float | None,
+    columnar: bool = False,
+) -> tuple[dict, list[Path]]:
+    """Write ``run_report.json`` (and the Parquet artefacts when ``columnar``) from a single
+    streaming pass over ``events.jsonl``; returns the report and the Parquet paths."""
+    calls = CallSummary()
+    rows = EventRows() if columnar else None
+    for event in iter_events(run_dir / "events.jsonl"):
+        calls.add(event)
+        if rows is not None:
+            rows.add(event)
+    report = calls.report(wall_time_seconds=wall_time_seconds)
+    (run_dir / "run_report.json").write_text(
+        json.dumps(report, ensure_ascii=True, indent=2), encoding="utf-8"
+    )
+    if rows is None:
+        return report, []
+    return report, _write_frames(run_dir, {**rows.frames(), "item_results": _typed(item_results)})
+
+
+def has_columnar_artifacts(run_dir: Path) -> bool:
+    """True when every columnar file exists and is at least as new as ``events.jsonl``.
+
+    A run resumed after the files were written appends to the JSONL first, which makes the
+    columnar copies stale until the run finishes and rewrites them.
+    """
+    if not columnar_available():
+        return False
+    paths = [run_dir / name for name in COLUMNAR_FILES.values()]
+    if not all(path.exists() for path in paths):
+        return False
+    events_path = run_dir / "events.jsonl"
+    if not events_path.exists():
+        return True
+    newest_events = events_path.stat().st_mtime_ns
+    return all(path.stat().st_mtime_ns >= newest_events for path in paths)
+
+
+def _read_columnar(run_dir: Path, name: str) -> pd.DataFrame:
+    return pd.read_parquet(run_dir / COLUMNAR_FILES[name], engine="pyarrow", memory_map=True)
+
+
+def load_run_frames(run_dir: Path) -> dict[str, pd.DataFrame]:
+    """Load expert responses, round summaries, calls and item results as typed DataFrames.
+
+    Reads the Parquet artefacts when they are present and current, otherwise rebuilds the
+    same frames from ``events.jsonl`` and ``summary.json``.
+    """
+    if has_columnar_artifacts(run_dir):
+        return {name: _read_columnar(run_dir, name) for name in COLUMNAR_FILES}
+    frames = event_frames(iter_events(run_dir / "events.jsonl"))
+    frames["item_results"] = load_item_results(run_dir)
+    return frames
+
+
+def load_item_results(run_dir: Path) -> pd.DataFrame:
+    if has_columnar_artifacts(run_dir):
+        return _read_columnar(run_dir, "item_results")
+    summary_path = run_dir / "summary.json"
+    if not summary_path.exists():
+        raise FileNotFoundError(f"Run summary not found: {summary_path}")
+    return _typed(json.loads(summary_path.read_text(encoding="utf-8")))
@@ -0,0 +1,269 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from delphi_llms.delphi.engine import (
+    _build_response,
+    _close_round,
+    _collect,
+    _item_states,
+    _ItemState,
+    _record,
+    _restore,
+    _round_decision,
+    _validate_panel,
+)
+from delphi_llms.delphi.events import EventSink
+from delphi_llms.delphi.stopping import StoppingPolicy
+from delphi_llms.instrumentation import CallRecorder
+from delphi_llms.models import ExpertResponse
+
+
+async def _standard_expert_response_async(
+    call_expert: Callable[..., Awaitable[dict]],
+    *,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    submitted_at: float | None = None,
+) -> ExpertResponse:
+    with CallRecorder(submitted_at=submitted_at) as recorder:
+        payload = await call_expert(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+        )
+    return _build_response(
+        item_id=item_id,
+        round_number=round_number,
+        expert_id=expert_id,
+        payload=payload,
+        metrics=recorder.metrics(),
+    )
+
+
+async def _recursive_expert_response_async(
+    ask_expert_clarification: Callable[..., Awaitable[str]],
+    call_facilitator: Callable[..., Awaitable[str]],
+    call_expert_with_clarification: Callable[..., Awaitable[dict]],
+    *,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    submitted_at: float | None = None,
+) -> ExpertResponse:
+    with CallRecorder(submitted_at=submitted_at) as recorder:
+        question = await ask_expert_clarification(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+        )
+        answer = await call_facilitator(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            clarification_question=question,
+        )
+        payload = await call_expert_with_clarification(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+            clarification_question=question,
+            facilitator_answer=answer,
+        )
+    return _build_response(
+        item_id=item_id,
+        round_number=round_number,
+        expert_id=expert_id,
+        payload=payload,
+        clarification_question=question,
+        facilitator_answer=answer,
+        metrics=recorder.metrics(),
+    )
+
+
+async def _run_item(
+    state: _ItemState,
+    *,
+    expert_ids: list[str],
+    expert_seeds: list[int],
+    n_max: int,
+    run_expert: Callable[..., Awaitable[ExpertResponse]],
+    semaphore: asyncio.Semaphore,
+    event_sink: EventSink | None,
+    stopping: StoppingPolicy,
+) -> None:
+    async def _expert_one(expert_idx: int) -> ExpertResponse:
+        submitted_at = time.time()
+        async with semaphore:
+            return await run_expert(
+                item_id=state.item_id,
+                item_text=state.item_text,
+                round_number=state.round_number,
+                expert_id=expert_ids[expert_idx],
+                seed=expert_seeds[expert_idx],
+                submitted_at=submitted_at,
+            )
+
+    while state.result is None:
+        state.round_number += 1
+        tasks = {asyncio.ensure_future(_expert_one(idx)): idx for idx in range(len(expert_ids))}
+        try:
+            while (
+                _round_decision(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping)
+                is None
+            ):
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # One answer at a time, so the policy sees them in the order they arrived.
+                task = min(done, key=tasks.get)
+                state.responses[tasks.pop(task)] = task.result()
+        finally:
+            # Once the policy has decided the round, outstanding calls are cancelled.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        _record(
+            state,
+            _close_round(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping),
+            event_sink,
+        )
+        state.responses = {}
+
+
+async def _schedule_async(
+    states: list[_ItemState],
+    *,
+    expert_ids: list[str],
+    expert_seeds: list[int],
+    n_max: int,
+    run_expert: Callable[..., Awaitable[ExpertResponse]],
+    max_in_flight: int,
+    event_sink: EventSink | None,
+    stopping: StoppingPolicy,
+) -> None:
+    # Items start together; the semaphore is FIFO, so earlier items acquire slots first.
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tasks = [
+        asyncio.ensure_future(
+            _run_item(
+                state,
+                expert_ids=expert_ids,
+                expert_seeds=expert_seeds,
+                n_max=n_max,
+                run_expert=run_expert,
+                semaphore=semaphore,
+                event_sink=event_sink,
+                stopping=stopping,
+            )
+        )
+        for state in states
+        if state.result is None
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def run_standard_delphi_async(
+    *,
+    items: list[dict],
+    expert_seeds: list[int],
+    n_max: int,
+    call_expert: Callable[..., Awaitable[dict]],
+    expert_ids: list[str] | None = None,
+    max_in_flight: int | None = None,
+    event_sink: EventSink | None = None,
+    completed_events: list[dict] | None = None,
+    stopping: StoppingPolicy = StoppingPolicy(),
+) -> dict:
+    expert_ids = _validate_panel(
+        items=items,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        expert_ids=expert_ids,
+        max_in_flight=max_in_flight,
+    )
+    states = _item_states(items)
+    _restore(
+        states,
+        completed_events or [],
+        expert_ids=expert_ids,
+        n_max=n_max,
+        stopping=stopping,
+        event_sink=event_sink,
+    )
+    await _schedule_async(
+        states,
+        expert_ids=expert_ids,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        run_expert=partial(_standard_expert_response_async, call_expert),
+        max_in_flight=max_in_flight or len(expert_ids),
+        event_sink=event_sink,
+        stopping=stopping,
+    )
+    return _collect(states)
+
+
+async def run_recursive_delphi_async(
+    *,
+    items: list[dict],
+    expert_seeds: list[int],
+    n_max: int,
+    ask_expert_clarification: Callable[..., Awaitable[str]],
+    call_facilitator: Callable[..., Awaitable[str]],
+    call_expert_with_clarification: Callable[..., Awaitable[dict]],
+    expert_ids: list[str] | None = None,
+    max_in_flight: int | None = None,
+    event_sink: EventSink | None = None,
+    completed_events: list[dict] | None = None,
+    stopping: StoppingPolicy = StoppingPolicy(),
+) -> dict:
+    expert_ids = _validate_panel(
+        items=items,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        expert_ids=expert_ids,
+        max_in_flight=max_in_flight,
+    )
+    states = _item_states(items)
+    _restore(
+        states,
+        completed_events or [],
+        expert_ids=expert_ids,
+        n_max=n_max,
+        stopping=stopping,
+        event_sink=event_sink,
+    )
+    await _schedule_async(
+        states,
+        expert_ids=expert_ids,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        run_expert=partial(
+            _recursive_expert_response_async,
+            ask_expert_clarification,
+            call_facilitator,
+            call_expert_with_clarification,
+        ),
+        max_in_flight=max_in_flight or len(expert_ids),
+        event_sink=event_sink,
+        stopping=stopping,
+    )
+    return _collect(states)
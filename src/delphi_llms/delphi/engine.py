@@ -1,29 +1,50 @@
-from concurrent.futures import ThreadPoolExecutor
+import heapq
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
 from statistics import median
-from typing import Callable
 
 from delphi_llms.delphi.aggregation import finalize_category
-from delphi_llms.delphi.stopping import should_stop
+from delphi_llms.delphi.events import EventSink
+from delphi_llms.delphi.executors import ExecutionBackend, ThreadBackend
+from delphi_llms.delphi.stopping import StopDecision, StoppingPolicy, decide_round
+from delphi_llms.instrumentation import CallRecorder
 from delphi_llms.models import ExpertResponse
 
 
+class _ItemState:
+    def __init__(self, *, position: int, item_id: str, item_text: str) -> None:
+        self.position = position
+        self.item_id = item_id
+        self.item_text = item_text
+        self.round_number = 0
+        self.responses: dict[int, ExpertResponse] = {}
+        self.events: list[dict] = []
+        self.result: dict | None = None
+
+
 def _build_response(
     *,
     item_id: str,
     round_number: int,
     expert_id: str,
     payload: dict,
+    clarification_question: str | None = None,
+    facilitator_answer: str | None = None,
+    metrics: dict | None = None,
 ) -> ExpertResponse:
     return ExpertResponse(
         item_id=item_id,
         round=round_number,
         expert_id=expert_id,
-        clarification_question=None,
-        facilitator_answer=None,
+        clarification_question=clarification_question,
+        facilitator_answer=facilitator_answer,
         rating=int(payload["rating"]),
         category=str(payload["category"]),
         rationale=str(payload.get("rationale", "")),
         confidence=float(payload.get("confidence", 0.5)),
+        metrics=metrics,
     )
 
 
@@ -39,104 +60,357 @@ def _round_metrics(responses: list[ExpertResponse]) -> dict:
     }
 
 
-def run_standard_delphi(
+def _standard_expert_response(
+    call_expert: Callable[..., dict],
+    *,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    submitted_at: float | None = None,
+) -> ExpertResponse:
+    with CallRecorder(submitted_at=submitted_at) as recorder:
+        payload = call_expert(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+        )
+    return _build_response(
+        item_id=item_id,
+        round_number=round_number,
+        expert_id=expert_id,
+        payload=payload,
+        metrics=recorder.metrics(),
+    )
+
+
+def _recursive_expert_response(
+    ask_expert_clarification: Callable[..., str],
+    call_facilitator: Callable[..., str],
+    call_expert_with_clarification: Callable[..., dict],
+    *,
+    item_id: str,
+    item_text: str,
+    round_number: int,
+    expert_id: str,
+    seed: int,
+    submitted_at: float | None = None,
+) -> ExpertResponse:
+    with CallRecorder(submitted_at=submitted_at) as recorder:
+        question = ask_expert_clarification(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+        )
+        answer = call_facilitator(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            clarification_question=question,
+        )
+        payload = call_expert_with_clarification(
+            item_id=item_id,
+            item_text=item_text,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=seed,
+            clarification_question=question,
+            facilitator_answer=answer,
+        )
+    return _build_response(
+        item_id=item_id,
+        round_number=round_number,
+        expert_id=expert_id,
+        payload=payload,
+        clarification_question=question,
+        facilitator_answer=answer,
+        metrics=recorder.metrics(),
+    )
+
+
+def _validate_panel(
     *,
     items: list[dict],
     expert_seeds: list[int],
     n_max: int,
-    call_expert: Callable[..., dict],
-    expert_ids: list[str] | None = None,
-) -> dict:
+    expert_ids: list[str] | None,
+    max_in_flight: int | None,
+) -> list[str]:
     if not items:
         raise ValueError("items must not be empty")
     if not expert_seeds:
         raise ValueError("expert_seeds must not be empty")
+    if n_max < 1:
+        raise ValueError("n_max must be at least 1")
 
     if expert_ids is None:
-        expert_ids = [f"expert_{idx+1}" for idx in range(len(expert_seeds))]
+        expert_ids = [f"expert_{idx + 1}" for idx in range(len(expert_seeds))]
     if len(expert_ids) != len(expert_seeds):
         raise ValueError("expert_ids and expert_seeds must have the same length")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    return expert_ids
+
+
+def _item_states(items: list[dict]) -> list[_ItemState]:
+    return [
+        _ItemState(
+            position=position, item_id=str(item["item_id"]), item_text=str(item["item_text"])
+        )
+        for position, item in enumerate(items)
+    ]
+
+
+def _round_decision(
+    state: _ItemState, *, expert_ids: list[str], n_max: int, stopping: StoppingPolicy
+) -> StopDecision | None:
+    return decide_round(
+        [state.responses[idx].category for idx in sorted(state.responses)],
+        panel_size=len(expert_ids),
+        current_round=state.round_number,
+        n_max=n_max,
+        policy=stopping,
+    )
+
+
+def _close_round(
+    state: _ItemState, *, expert_ids: list[str], n_max: int, stopping: StoppingPolicy
+) -> list[dict]:
+    # With an early-deciding policy the round may close on part of the panel; its events and
+    # metrics then cover only the experts that answered.
+    responses = [state.responses[idx] for idx in sorted(state.responses)]
+    categories = [response.category for response in responses]
+    decision = _round_decision(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping)
+    if decision is None:
+        raise RuntimeError("round closed before the stopping policy could decide it")
+    metrics = _round_metrics(responses)
+
+    events = [{"type": "expert_response", **response.model_dump()} for response in responses]
+    events.append(
+        {
+            "type": "round_summary",
+            "item_id": state.item_id,
+            "round": state.round_number,
+            "categories": categories,
+            "stop": decision.stop,
+            "reason": decision.reason,
+            **metrics,
+        }
+    )
 
+    if decision.stop:
+        final_category = (
+            categories[0] if decision.reason == "converged" else finalize_category(responses)
+        )
+        state.result = {
+            "item_id": state.item_id,
+            "item_text": state.item_text,
+            "final_category": final_category,
+            "stop_reason": decision.reason,
+            "rounds_run": state.round_number,
+            "final_median": metrics["median"],
+            "final_agreement_inclusion": metrics["agreement_inclusion"],
+            "final_agreement_exclusion": metrics["agreement_exclusion"],
+        }
+    return events
+
+
+def _record(state: _ItemState, events: list[dict], event_sink: EventSink | None) -> None:
+    # Without a sink events are kept per item so event_log comes back in item order; with one
+    # they are handed off immediately and never accumulate in memory (the sink sees them in
+    # completion order; see events.sort_events_file).
+    if event_sink is None:
+        state.events.extend(events)
+        return
+    for event in events:
+        event_sink.emit(event)
+
+
+def _restore(
+    states: list[_ItemState],
+    completed_events: list[dict],
+    *,
+    expert_ids: list[str],
+    n_max: int,
+    stopping: StoppingPolicy,
+    event_sink: EventSink | None,
+) -> None:
+    responses: dict[tuple[str, int], dict[str, ExpertResponse]] = {}
+    closed: dict[tuple[str, int], int] = {}
+    for event in completed_events:
+        key = (str(event.get("item_id")), int(event.get("round", 0)))
+        if event.get("type") == "expert_response":
+            responses.setdefault(key, {})[event["expert_id"]] = ExpertResponse.model_validate(event)
+        elif event.get("type") == "round_summary":
+            closed[key] = len(event.get("categories", []))
+
+    # Replaying completed rounds through _close_round rebuilds the same events and decisions
+    # the interrupted run produced, so resumed items continue exactly where they stopped.
+    # A sink already holds these events, so they are only kept for the in-memory event_log.
+    for state in states:
+        while state.result is None and (state.item_id, state.round_number + 1) in closed:
+            key = (state.item_id, state.round_number + 1)
+            round_responses = responses.get(key, {})
+            if len(round_responses) != closed[key]:
+                break
+            state.round_number += 1
+            state.responses = {
+                idx: round_responses[e] for idx, e in enumerate(expert_ids) if e in round_responses
+            }
+            events = _close_round(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping)
+            if event_sink is None:
+                state.events.extend(events)
+            state.responses = {}
+
+
+def _collect(states: list[_ItemState]) -> dict:
     item_results: list[dict] = []
     event_log: list[dict] = []
+    for state in states:
+        if state.result is None:
+            raise RuntimeError("failed to finalize category")
+        item_results.append(state.result)
+        event_log.extend(state.events)
+    return {"item_results": item_results, "event_log": event_log}
+
 
-    for item in items:
-        item_id = str(item["item_id"])
-        item_text = str(item["item_text"])
-        stop_reason = "max_rounds_reached"
-        final_category = None
-        rounds_run = 0
-        final_metrics = {"median": None, "agreement_inclusion": None, "agreement_exclusion": None}
-
-        for round_number in range(1, n_max + 1):
-            rounds_run = round_number
-
-            with ThreadPoolExecutor(max_workers=len(expert_ids)) as pool:
-                futures = [
-                    pool.submit(
-                        call_expert,
-                        item_id=item_id,
-                        item_text=item_text,
-                        round_number=round_number,
-                        expert_id=expert_id,
-                        seed=seed,
-                    )
-                    for expert_id, seed in zip(expert_ids, expert_seeds, strict=True)
-                ]
-                payloads = [future.result() for future in futures]
-
-            responses = [
-                _build_response(
-                    item_id=item_id,
+def _schedule(
+    states: list[_ItemState],
+    *,
+    expert_ids: list[str],
+    expert_seeds: list[int],
+    n_max: int,
+    run_expert: Callable[..., ExpertResponse],
+    max_in_flight: int | None,
+    backend: ExecutionBackend | None,
+    event_sink: EventSink | None,
+    stopping: StoppingPolicy,
+) -> None:
+    if backend is None:
+        with ThreadBackend(max_workers=max_in_flight or len(expert_ids)) as owned:
+            _schedule(
+                states,
+                expert_ids=expert_ids,
+                expert_seeds=expert_seeds,
+                n_max=n_max,
+                run_expert=run_expert,
+                max_in_flight=max_in_flight,
+                backend=owned,
+                event_sink=event_sink,
+                stopping=stopping,
+            )
+        return
+
+    max_in_flight = max_in_flight or backend.max_workers
+    # Pending calls are ordered by (item position, round, expert) so that items
+    # admitted earlier always advance first and later items only fill idle slots.
+    pending: list[tuple[int, int, int]] = []
+    for state in states:
+        if state.result is not None:
+            continue
+        state.round_number += 1
+        for expert_idx in range(len(expert_ids)):
+            pending.append((state.position, state.round_number, expert_idx))
+    heapq.heapify(pending)
+
+    in_flight: dict[Future, tuple[_ItemState, int, int]] = {}
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < max_in_flight:
+                position, round_number, expert_idx = heapq.heappop(pending)
+                state = states[position]
+                if state.result is not None or round_number != state.round_number:
+                    continue  # the round was decided before this call went out
+                future = backend.submit(
+                    run_expert,
+                    item_id=state.item_id,
+                    item_text=state.item_text,
                     round_number=round_number,
-                    expert_id=expert_id,
-                    payload=payload,
+                    expert_id=expert_ids[expert_idx],
+                    seed=expert_seeds[expert_idx],
+                    submitted_at=time.time(),
                 )
-                for expert_id, payload in zip(expert_ids, payloads, strict=True)
-            ]
-            categories = [response.category for response in responses]
-            decision = should_stop(categories=categories, current_round=round_number, n_max=n_max)
-            metrics = _round_metrics(responses)
-
-            for response in responses:
-                event_log.append({"type": "expert_response", **response.model_dump()})
-            event_log.append(
-                {
-                    "type": "round_summary",
-                    "item_id": item_id,
-                    "round": round_number,
-                    "categories": categories,
-                    "stop": decision.stop,
-                    "reason": decision.reason,
-                    **metrics,
-                }
-            )
-
-            if decision.stop:
-                stop_reason = decision.reason
-                final_category = (
-                    categories[0] if decision.reason == "converged" else finalize_category(responses)
+                in_flight[future] = (state, round_number, expert_idx)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: (in_flight[f][0].position, in_flight[f][2])):
+                state, round_number, expert_idx = in_flight.pop(future)
+                if state.result is not None or round_number != state.round_number:
+                    continue  # a late answer to a round that closed early is dropped
+                state.responses[expert_idx] = future.result()
+                if (
+                    _round_decision(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping)
+                    is None
+                ):
+                    continue
+
+                _record(
+                    state,
+                    _close_round(state, expert_ids=expert_ids, n_max=n_max, stopping=stopping),
+                    event_sink,
                 )
-                final_metrics = metrics
-                break
+                state.responses = {}
+                # Calls for the closed round that have not started yet are not worth making.
+                for other in [f for f, entry in in_flight.items() if entry[0] is state]:
+                    if other.cancel():
+                        del in_flight[other]
+                if state.result is None:
+                    state.round_number += 1
+                    for idx in range(len(expert_ids)):
+                        heapq.heappush(pending, (state.position, state.round_number, idx))
+    except BaseException:
+        for future in in_flight:
+            future.cancel()
+        raise
 
-        if final_category is None:
-            raise RuntimeError("failed to finalize category")
-
-        item_results.append(
-            {
-                "item_id": item_id,
-                "item_text": item_text,
-                "final_category": final_category,
-                "stop_reason": stop_reason,
-                "rounds_run": rounds_run,
-                "final_median": final_metrics["median"],
-                "final_agreement_inclusion": final_metrics["agreement_inclusion"],
-                "final_agreement_exclusion": final_metrics["agreement_exclusion"],
-            }
-        )
 
-    return {"item_results": item_results, "event_log": event_log}
+def run_standard_delphi(
+    *,
+    items: list[dict],
+    expert_seeds: list[int],
+    n_max: int,
+    call_expert: Callable[..., dict],
+    expert_ids: list[str] | None = None,
+    max_in_flight: int | None = None,
+    backend: ExecutionBackend | None = None,
+    event_sink: EventSink | None = None,
+    completed_events: list[dict] | None = None,
+    stopping: StoppingPolicy = StoppingPolicy(),
+) -> dict:
+    expert_ids = _validate_panel(
+        items=items,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        expert_ids=expert_ids,
+        max_in_flight=max_in_flight,
+    )
+    states = _item_states(items)
+    _restore(
+        states,
+        completed_events or [],
+        expert_ids=expert_ids,
+        n_max=n_max,
+        stopping=stopping,
+        event_sink=event_sink,
+    )
+    _schedule(
+        states,
+        expert_ids=expert_ids,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        run_expert=partial(_standard_expert_response, call_expert),
+        max_in_flight=max_in_flight,
+        backend=backend,
+        event_sink=event_sink,
+        stopping=stopping,
+    )
+    return _collect(states)
 
 
 def run_recursive_delphi(
@@ -148,114 +422,42 @@ def run_recursive_delphi(
     call_facilitator: Callable[..., str],
     call_expert_with_clarification: Callable[..., dict],
     expert_ids: list[str] | None = None,
+    max_in_flight: int | None = None,
+    backend: ExecutionBackend | None = None,
+    event_sink: EventSink | None = None,
+    completed_events: list[dict] | None = None,
+    stopping: StoppingPolicy = StoppingPolicy(),
 ) -> dict:
-    if not items:
-        raise ValueError("items must not be empty")
-    if not expert_seeds:
-        raise ValueError("expert_seeds must not be empty")
-
-    if expert_ids is None:
-        expert_ids = [f"expert_{idx+1}" for idx in range(len(expert_seeds))]
-    if len(expert_ids) != len(expert_seeds):
-        raise ValueError("expert_ids and expert_seeds must have the same length")
-
-    item_results: list[dict] = []
-    event_log: list[dict] = []
-
-    for item in items:
-        item_id = str(item["item_id"])
-        item_text = str(item["item_text"])
-        stop_reason = "max_rounds_reached"
-        final_category = None
-        rounds_run = 0
-        final_metrics = {"median": None, "agreement_inclusion": None, "agreement_exclusion": None}
-
-        for round_number in range(1, n_max + 1):
-            rounds_run = round_number
-
-            def _expert_one(expert_id: str, seed: int) -> ExpertResponse:
-                question = ask_expert_clarification(
-                    item_id=item_id,
-                    item_text=item_text,
-                    round_number=round_number,
-                    expert_id=expert_id,
-                    seed=seed,
-                )
-                answer = call_facilitator(
-                    item_id=item_id,
-                    item_text=item_text,
-                    round_number=round_number,
-                    expert_id=expert_id,
-                    clarification_question=question,
-                )
-                payload = call_expert_with_clarification(
-                    item_id=item_id,
-                    item_text=item_text,
-                    round_number=round_number,
-                    expert_id=expert_id,
-                    seed=seed,
-                    clarification_question=question,
-                    facilitator_answer=answer,
-                )
-                return ExpertResponse(
-                    item_id=item_id,
-                    round=round_number,
-                    expert_id=expert_id,
-                    clarification_question=question,
-                    facilitator_answer=answer,
-                    rating=int(payload["rating"]),
-                    category=str(payload["category"]),
-                    rationale=str(payload.get("rationale", "")),
-                    confidence=float(payload.get("confidence", 0.5)),
-                )
-
-            with ThreadPoolExecutor(max_workers=len(expert_ids)) as pool:
-                futures = [
-                    pool.submit(_expert_one, expert_id, seed)
-                    for expert_id, seed in zip(expert_ids, expert_seeds, strict=True)
-                ]
-                responses = [future.result() for future in futures]
-
-            categories = [response.category for response in responses]
-            decision = should_stop(categories=categories, current_round=round_number, n_max=n_max)
-            metrics = _round_metrics(responses)
-
-            for response in responses:
-                event_log.append({"type": "expert_response", **response.model_dump()})
-            event_log.append(
-                {
-                    "type": "round_summary",
-                    "item_id": item_id,
-                    "round": round_number,
-                    "categories": categories,
-                    "stop": decision.stop,
-                    "reason": decision.reason,
-                    **metrics,
-                }
-            )
-
-            if decision.stop:
-                stop_reason = decision.reason
-                final_category = (
-                    categories[0] if decision.reason == "converged" else finalize_category(responses)
-                )
-                final_metrics = metrics
-                break
-
-        if final_category is None:
-            raise RuntimeError("failed to finalize category")
-
-        item_results.append(
-            {
-                "item_id": item_id,
-                "item_text": item_text,
-                "final_category": final_category,
-                "stop_reason": stop_reason,
-                "rounds_run": rounds_run,
-                "final_median": final_metrics["median"],
-                "final_agreement_inclusion": final_metrics["agreement_inclusion"],
-                "final_agreement_exclusion": final_metrics["agreement_exclusion"],
-            }
-        )
-
-    return {"item_results": item_results, "event_log": event_log}
+    expert_ids = _validate_panel(
+        items=items,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        expert_ids=expert_ids,
+        max_in_flight=max_in_flight,
+    )
+    states = _item_states(items)
+    _restore(
+        states,
+        completed_events or [],
+        expert_ids=expert_ids,
+        n_max=n_max,
+        stopping=stopping,
+        event_sink=event_sink,
+    )
+    _schedule(
+        states,
+        expert_ids=expert_ids,
+        expert_seeds=expert_seeds,
+        n_max=n_max,
+        run_expert=partial(
+            _recursive_expert_response,
+            ask_expert_clarification,
+            call_facilitator,
+            call_expert_with_clarification,
+        ),
+        max_in_flight=max_in_flight,
+        backend=backend,
+        event_sink=event_sink,
+        stopping=stopping,
+    )
+    return _collect(states)
@@ -0,0 +1,456 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Self
+
+RUN_EVENTS_COLUMNS = (
+    "type",
+    "item_id",
+    "round",
+    "expert_id",
+    "rating",
+    "category",
+    "rationale",
+    "confidence",
+    "clarification_question",
+    "facilitator_answer",
+    "stop",
+    "reason",
+    "categories_json",
+    "median",
+    "agreement_inclusion",
+    "agreement_exclusion",
+)
+
+RUN_EVENTS_DDL = """
+create table if not exists run_events (
+  type text,
+  item_id text,
+  round integer,
+  expert_id text,
+  rating real,
+  category text,
+  rationale text,
+  confidence real,
+  clarification_question text,
+  facilitator_answer text,
+  stop integer,
+  reason text,
+  categories_json text,
+  median real,
+  agreement_inclusion real,
+  agreement_exclusion real
+)
+"""
+
+RUN_EVENTS_INSERT = (
+    f"insert into run_events ({', '.join(RUN_EVENTS_COLUMNS)}) "
+    f"values ({', '.join('?' for _ in RUN_EVENTS_COLUMNS)})"
+)
+
+
+def run_event_row(event: dict) -> tuple:
+    return (
+        event.get("type"),
+        event.get("item_id"),
+        event.get("round"),
+        event.get("expert_id"),
+        event.get("rating"),
+        event.get("category"),
+        event.get("rationale"),
+        event.get("confidence"),
+        event.get("clarification_question"),
+        event.get("facilitator_answer"),
+        1 if event.get("stop") else 0 if "stop" in event else None,
+        event.get("reason"),
+        json.dumps(event.get("categories")) if event.get("categories") is not None else None,
+        event.get("median"),
+        event.get("agreement_inclusion"),
+        event.get("agreement_exclusion"),
+    )
+
+
+RUN_CALLS_COLUMNS = (
+    "item_id",
+    "round",
+    "expert_id",
+    "call_index",
+    "kind",
+    "model",
+    "cached",
+    "queue_wait_ms",
+    "latency_ms",
+    "total_ms",
+    "load_ms",
+    "prompt_eval_ms",
+    "eval_ms",
+    "prompt_eval_count",
+    "eval_count",
+)
+
+RUN_CALLS_DDL = """
+create table if not exists run_calls (
+  item_id text,
+  round integer,
+  expert_id text,
+  call_index integer,
+  kind text,
+  model text,
+  cached integer,
+  queue_wait_ms real,
+  latency_ms real,
+  total_ms real,
+  load_ms real,
+  prompt_eval_ms real,
+  eval_ms real,
+  prompt_eval_count integer,
+  eval_count integer
+)
+"""
+
+RUN_CALLS_INSERT = (
+    f"insert into run_calls ({', '.join(RUN_CALLS_COLUMNS)}) "
+    f"values ({', '.join('?' for _ in RUN_CALLS_COLUMNS)})"
+)
+
+
+def run_call_rows(event: dict) -> list[tuple]:
+    metrics = event.get("metrics") if event.get("type") == "expert_response" else None
+    if not metrics:
+        return []
+    return [
+        (
+            event.get("item_id"),
+            event.get("round"),
+            event.get("expert_id"),
+            index,
+            call.get("kind"),
+            call.get("model"),
+            1 if call.get("cached") else 0,
+            metrics.get("queue_wait_ms") if index == 0 else None,
+            call.get("latency_ms"),
+            call.get("total_ms"),
+            call.get("load_ms"),
+            call.get("prompt_eval_ms"),
+            call.get("eval_ms"),
+            call.get("prompt_eval_count"),
+            call.get("eval_count"),
+        )
+        for index, call in enumerate(metrics.get("calls", []))
+    ]
+
+
+RUN_SUMMARY_COLUMNS = (
+    "item_id",
+    "item_text",
+    "final_category",
+    "stop_reason",
+    "rounds_run",
+    "final_median",
+    "final_agreement_inclusion",
+    "final_agreement_exclusion",
+)
+
+RUN_SUMMARY_DDL = """
+create table if not exists run_summary (
+  item_id text,
+  item_text text,
+  final_category text,
+  stop_reason text,
+  rounds_run integer,
+  final_median real,
+  final_agreement_inclusion real,
+  final_agreement_exclusion real
+)
+"""
+
+RUN_SUMMARY_INSERT = (
+    f"insert into run_summary ({', '.join(RUN_SUMMARY_COLUMNS)}) "
+    f"values ({', '.join('?' for _ in RUN_SUMMARY_COLUMNS)})"
+)
+
+
+def run_summary_row(item_result: dict) -> tuple:
+    return tuple(item_result.get(column) for column in RUN_SUMMARY_COLUMNS)
+
+
+class EventSink:
+    """Receives engine events as rounds close; implementations decide when to persist them."""
+
+    def emit(self, event: dict) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class MemoryEventSink(EventSink):
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+
+    def emit(self, event: dict) -> None:
+        self.events.append(event)
+
+
+class _BufferedEventSink(EventSink):
+    def __init__(self, *, buffer_size: int, flush_interval: float) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: list[dict] = []
+        self._last_flush = time.monotonic()
+
+    def emit(self, event: dict) -> None:
+        self._buffer.append(event)
+        if (
+            len(self._buffer) >= self.buffer_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write(self._buffer)
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def _write(self, events: list[dict]) -> None:
+        raise NotImplementedError
+
+
+class JsonlEventSink(_BufferedEventSink):
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        buffer_size: int = 256,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(buffer_size=buffer_size, flush_interval=flush_interval)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a" if append else "w", encoding="utf-8")
+
+    def _write(self, events: list[dict]) -> None:
+        self._handle.write("".join(json.dumps(e, ensure_ascii=True) + "\n" for e in events))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self.flush()
+            self._handle.close()
+
+
+class SqliteEventSink(EventSink):
+    """Persists events to SQLite from a dedicated writer thread while the run is in progress.
+
+    ``emit`` only enqueues; the writer commits a batch every ``buffer_size`` events or
+    ``flush_interval`` seconds, so the database can be queried (WAL) during long runs.
+    """
+
+    def __init__(self, path: Path, *, buffer_size: int = 1000, flush_interval: float = 2.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sqlite-event-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        self._raise_writer_error()
+
+    def _run(self) -> None:
+        conn: sqlite3.Connection | None = None
+        try:
+            conn = sqlite3.connect(self.path)
+            conn.execute("pragma journal_mode=wal")
+            conn.execute("pragma synchronous=normal")
+            conn.execute(RUN_EVENTS_DDL)
+            conn.execute(RUN_CALLS_DDL)
+            conn.execute(RUN_SUMMARY_DDL)
+            conn.commit()
+        except BaseException as exc:  # noqa: BLE001
+            self._error = exc
+            if conn is not None:
+                conn.close()
+            return
+        finally:
+            self._ready.set()
+        try:
+            self._drain(conn)
+        except BaseException as exc:  # noqa: BLE001
+            self._error = exc
+            # Keep consuming so flush() and close() never wait on a dead writer.
+            while True:
+                kind, payload = self._queue.get()
+                if kind == "flush":
+                    payload.set()
+                elif kind == "close":
+                    break
+        finally:
+            conn.close()
+
+    def _drain(self, conn: sqlite3.Connection) -> None:
+        pending: list[dict] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                kind, payload = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                kind, payload = "tick", None
+            if kind == "event":
+                pending.append(payload)
+                if len(pending) < self.buffer_size:
+                    continue
+            elif kind == "summary":
+                self._write(conn, pending)
+                pending = []
+                with conn:
+                    conn.execute("delete from run_summary")
+                    conn.executemany(RUN_SUMMARY_INSERT, payload)
+                continue
+            self._write(conn, pending)
+            pending = []
+            deadline = time.monotonic() + self.flush_interval
+            if kind == "flush":
+                payload.set()
+            elif kind == "close":
+                return
+
+    def _write(self, conn: sqlite3.Connection, events: list[dict]) -> None:
+        if not events:
+            return
+        with conn:
+            conn.executemany(RUN_EVENTS_INSERT, [run_event_row(e) for e in events])
+            conn.executemany(RUN_CALLS_INSERT, [row for e in events for row in run_call_rows(e)])
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"SQLite event writer failed: {self._error}") from self._error
+
+    def emit(self, event: dict) -> None:
+        self._raise_writer_error()
+        self._queue.put(("event", event))
+
+    def write_item_results(self, item_results: list[dict]) -> None:
+        self._queue.put(("summary", [run_summary_row(row) for row in item_results]))
+
+    def flush(self) -> None:
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(("flush", done))
+            done.wait()
+        self._raise_writer_error()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(("close", None))
+            self._thread.join()
+        self._raise_writer_error()
+
+
+class FanoutEventSink(EventSink):
+    def __init__(self, *sinks: EventSink) -> None:
+        self.sinks = list(sinks)
+
+    def emit(self, event: dict) -> None:
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+def iter_events(path: Path) -> Iterator[dict]:
+    """Yield the events of ``path`` one at a time, so a pass never holds the whole log."""
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave the last line half-written; everything before it is intact.
+                return
+
+
+def read_events(path: Path) -> list[dict]:
+    return list(iter_events(path))
+
+
+def completed_round_events(events: list[dict]) -> list[dict]:
+    closed = {
+        (event["item_id"], event["round"])
+        for event in events
+        if event.get("type") == "round_summary"
+    }
+    return [event for event in events if (event.get("item_id"), event.get("round")) in closed]
+
+
+def load_checkpoint(path: Path) -> list[dict]:
+    """Return the events of fully completed rounds and rewrite ``path`` to hold only those."""
+    events = completed_round_events(read_events(path))
+    tmp_path = Path(path).with_suffix(".jsonl.tmp")
+    with JsonlEventSink(tmp_path) as sink:
+        for event in events:
+            sink.emit(event)
+    tmp_path.replace(path)
+    return events
+
+
+def canonical_order_key(event: dict, positions: dict[str, int]) -> tuple[int, int, bool]:
+    """Sort key putting events in item (round 1 order), then round order, summary last."""
+    return (
+        positions[str(event["item_id"])],
+        int(event["round"]),
+        event.get("type") == "round_summary",
+    )
+
+
+def sort_events_file(path: Path, item_ids: list[str]) -> None:
+    """Rewrite ``path`` in canonical item/round order, keeping each round's block intact.
+
+    Only a sort key and a byte offset per line are held in memory; the lines themselves are
+    copied into a temporary file that then replaces ``path``.
+    """
+    positions = {item_id: position for position, item_id in enumerate(item_ids)}
+    path = Path(path)
+    lines: list[tuple[tuple[int, int, bool], int, int]] = []
+    with path.open("rb") as handle:
+        offset = 0
+        for line in handle:
+            if line.strip():
+                key = canonical_order_key(json.loads(line), positions)
+                # The offset breaks ties, so experts keep their order within a round.
+                lines.append((key, offset, len(line)))
+            offset += len(line)
+    lines.sort()
+    tmp_path = path.with_suffix(".jsonl.tmp")
+    with path.open("rb") as source, tmp_path.open("wb") as target:
+        for _, offset, length in lines:
+            source.seek(offset)
+            line = source.read(length)
+            target.write(line if line.endswith(b"\n") else line + b"\n")
+        target.flush()
+        os.fsync(target.fileno())
+    tmp_path.replace(path)
@@ -0,0 +1,95 @@
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Self
+
+
+class ExecutionBackend:
+    """Runs engine calls; owned for the lifetime of a run and shared by all its rounds."""
+
+    max_workers: int
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        raise NotImplementedError
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown(wait=True)
+
+
+class _PoolBackend(ExecutionBackend):
+    def __init__(self, executor: Executor, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = executor
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class ThreadBackend(_PoolBackend):
+    def __init__(self, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        super().__init__(ThreadPoolExecutor(max_workers=max_workers), max_workers)
+
+
+class ProcessBackend(_PoolBackend):
+    """Submitted callables and their results must be picklable.
+
+    ``initializer(*initargs)`` runs once in each worker, for state such as HTTP clients that
+    should live for the whole run rather than be rebuilt per call.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        # Spawned workers avoid forking a parent that already runs HTTP client threads.
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+        super().__init__(executor, max_workers)
+
+
+class InlineBackend(ExecutionBackend):
+    """Runs every call synchronously at submit time; deterministic and thread-free."""
+
+    max_workers = 1
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:  # noqa: BLE001
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        return future
+
+
+BACKENDS = {"thread": ThreadBackend, "process": ProcessBackend, "inline": InlineBackend}
+
+
+def create_backend(kind: str, max_workers: int) -> ExecutionBackend:
+    kind = kind.strip().lower()
+    if kind not in BACKENDS:
+        raise ValueError(f"backend must be one of: {', '.join(BACKENDS)}")
+    if kind == "inline":
+        return InlineBackend()
+    return BACKENDS[kind](max_workers=max_workers)
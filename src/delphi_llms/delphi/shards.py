@@ -0,0 +1,103 @@
+import json
+import shutil
+from pathlib import Path
+
+from delphi_llms.delphi.artifacts import columnar_available, write_run_report
+from delphi_llms.delphi.events import canonical_order_key, sort_events_file
+
+SHARDS_DIR = "shards"
+
+
+def _check_shard(index: int, count: int) -> None:
+    if count < 1:
+        raise ValueError("shard count must be at least 1")
+    if not 0 <= index < count:
+        raise ValueError(f"shard index must be between 0 and {count - 1}")
+
+
+def shard_items(items: list[dict], *, index: int, count: int) -> list[dict]:
+    """Items at positions ``index``, ``index + count``, ... of the round 1 order."""
+    _check_shard(index, count)
+    return items[index::count]
+
+
+def shard_dir(run_dir: Path, *, index: int, count: int) -> Path:
+    _check_shard(index, count)
+    return run_dir / SHARDS_DIR / f"shard-{index}-of-{count}"
+
+
+def canonical_events(events: list[dict], item_ids: list[str]) -> list[dict]:
+    """Order events by item (round 1 order), then round, keeping each round's block intact.
+
+    A run writes rounds in completion order, which depends on timing; this is the order a
+    run without an event sink returns in ``event_log``, and the one ``events.jsonl`` is
+    rewritten in when a run or a merge finishes.
+    """
+    positions = {item_id: position for position, item_id in enumerate(item_ids)}
+    return sorted(events, key=lambda e: canonical_order_key(e, positions))
+
+
+def _read_json(path: Path) -> object:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def merge_shards(run_dir: Path, *, count: int) -> dict:
+    """Combine the ``count`` finished shards under ``run_dir`` into one canonical run.
+
+    Writes ``events.jsonl``, ``summary.json``, ``run_report.json`` and ``config.json`` to
+    ``run_dir`` (plus the Parquet artefacts when the shards were configured with them) and
+    returns their paths.
+    """
+    shard_dirs = [shard_dir(run_dir, index=index, count=count) for index in range(count)]
+    unfinished = [str(d) for d in shard_dirs if not (d / "summary.json").exists()]
+    if unfinished:
+        raise FileNotFoundError(f"Shards not finished: {', '.join(unfinished)}")
+
+    summaries = [_read_json(d / "summary.json") for d in shard_dirs]
+    total = sum(len(summary) for summary in summaries)
+    for index, summary in enumerate(summaries):
+        if len(summary) != len(range(index, total, count)):
+            raise ValueError(
+                f"shard {index} holds {len(summary)} items, expected a 1/{count} slice"
+            )
+    # Shard k holds round 1 positions k, k + count, ...; interleaving restores the full order.
+    item_results = [summaries[p % count][p // count] for p in range(total)]
+    item_ids = [str(result["item_id"]) for result in item_results]
+
+    # Finished shards hold only closed rounds; concatenate them, then sort on disk.
+    events_path = run_dir / "events.jsonl"
+    with events_path.open("wb") as target:
+        for d in shard_dirs:
+            with (d / "events.jsonl").open("rb") as source:
+                shutil.copyfileobj(source, target)
+    sort_events_file(events_path, item_ids)
+    summary_path = run_dir / "summary.json"
+    summary_path.write_text(json.dumps(item_results, ensure_ascii=True, indent=2), encoding="utf-8")
+
+    config = _read_json(shard_dirs[0] / "config.json")
+    config.pop("shard", None)
+    config["shards"] = count
+    config_path = run_dir / "config.json"
+    config_path.write_text(
+        json.dumps(config, ensure_ascii=True, indent=2, sort_keys=True, default=str),
+        encoding="utf-8",
+    )
+
+    # Shards run side by side, so the merged run took as long as the slowest one.
+    wall_times = [
+        _read_json(d / "run_report.json").get("wall_time_seconds", 0.0)
+        for d in shard_dirs
+        if (d / "run_report.json").exists()
+    ]
+    write_run_report(
+        run_dir,
+        item_results=item_results,
+        wall_time_seconds=max(wall_times, default=0.0),
+        columnar=config.get("outputs", {}).get("columnar", False) and columnar_available(),
+    )
+    return {
+        "events": events_path,
+        "summary": summary_path,
+        "report": run_dir / "run_report.json",
+        "config": config_path,
+    }
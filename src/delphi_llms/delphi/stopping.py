@@ -1,3 +1,5 @@
+import math
+from collections import Counter
 from dataclasses import dataclass
 
 
@@ -7,6 +9,23 @@ class StopDecision:
     reason: str
 
 
+@dataclass(frozen=True)
+class StoppingPolicy:
+    """When a round may be decided before every expert has answered.
+
+    ``early_continue`` closes a round as soon as two categories have appeared, since full
+    convergence is then out of reach; it never applies to the last round, whose majority vote
+    needs the whole panel. ``quorum`` stops the item once that share of the panel agrees.
+    """
+
+    early_continue: bool = False
+    quorum: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.quorum is not None and not 0.5 < self.quorum <= 1.0:
+            raise ValueError("quorum must be above 0.5 and at most 1")
+
+
 def has_full_convergence(categories: list[str]) -> bool:
     if not categories:
         return False
@@ -19,3 +38,39 @@ def should_stop(categories: list[str], current_round: int, n_max: int) -> StopDe
     if current_round >= n_max:
         return StopDecision(stop=True, reason="max_rounds_reached")
     return StopDecision(stop=False, reason="continue")
+
+
+def decide_round(
+    categories: list[str],
+    *,
+    panel_size: int,
+    current_round: int,
+    n_max: int,
+    policy: StoppingPolicy = StoppingPolicy(),
+) -> StopDecision | None:
+    """Decide a round from the categories received so far, or None if it needs more answers.
+
+    With the whole panel in, this is ``should_stop`` plus the quorum rule, so the default
+    policy only ever decides complete rounds.
+    """
+    counts = Counter(categories)
+    top = max(counts.values(), default=0)
+    needed = None
+    if policy.quorum is not None:
+        needed = math.ceil(round(policy.quorum * panel_size, 9))
+
+    if len(categories) >= panel_size:
+        decision = should_stop(categories, current_round, n_max)
+        if decision.reason != "converged" and needed is not None and top >= needed:
+            return StopDecision(stop=True, reason="quorum_reached")
+        return decision
+    if needed is not None and top >= needed:
+        return StopDecision(stop=True, reason="quorum_reached")
+    if (
+        policy.early_continue
+        and current_round < n_max
+        and len(counts) > 1
+        and (needed is None or top + panel_size - len(categories) < needed)
+    ):
+        return StopDecision(stop=False, reason="continue")
+    return None
@@ -1,63 +1,109 @@
 import json
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from delphi_llms.data.loader import parse_round_results_xlsx
+from delphi_llms.config import load_yaml
+from delphi_llms.data.loader import item_key, load_round_results, parse_round_results_xlsx
+from delphi_llms.delphi.artifacts import load_item_results
 
 
-def classify_human_category(agreement_inclusion: float, agreement_exclusion: float) -> str:
-    if agreement_inclusion >= 0.75 and agreement_exclusion < 0.75:
+@dataclass(frozen=True)
+class ConsensusThresholds:
+    include: float = 0.75
+    exclude: float = 0.75
+
+
+def load_consensus_thresholds(path: Path | None) -> ConsensusThresholds:
+    if path is None:
+        return ConsensusThresholds()
+    settings = load_yaml(path).get("human_consensus", {})
+    defaults = ConsensusThresholds()
+    return ConsensusThresholds(
+        include=float(settings.get("include", defaults.include)),
+        exclude=float(settings.get("exclude", defaults.exclude)),
+    )
+
+
+def classify_human_category(
+    agreement_inclusion: float,
+    agreement_exclusion: float,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+) -> str:
+    if agreement_inclusion >= thresholds.include and agreement_exclusion < thresholds.exclude:
         return "include"
-    if agreement_exclusion >= 0.75 and agreement_inclusion < 0.75:
+    if agreement_exclusion >= thresholds.exclude and agreement_inclusion < thresholds.include:
         return "exclude"
     return "maybe"
 
 
+def classify_human_categories(
+    agreement_inclusion: object,
+    agreement_exclusion: object,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+) -> np.ndarray:
+    inclusion = np.asarray(agreement_inclusion, dtype=float)
+    exclusion = np.asarray(agreement_exclusion, dtype=float)
+    include = (inclusion >= thresholds.include) & (exclusion < thresholds.exclude)
+    exclude = (exclusion >= thresholds.exclude) & (inclusion < thresholds.include)
+    return np.select([include, exclude], ["include", "exclude"], default="maybe")
+
+
+def _child_dirs(parent: Path, prefix: str) -> list[Path]:
+    return sorted(p for p in parent.iterdir() if p.is_dir() and p.name.startswith(prefix))
+
+
+def list_run_dirs(base_run_dir: Path) -> list[Path]:
+    """Every ``run-*`` directory under ``base_run_dir``, including those inside ``sweep-*``."""
+    if not base_run_dir.exists():
+        raise FileNotFoundError(f"Run directory not found: {base_run_dir}")
+    run_dirs = _child_dirs(base_run_dir, "run-")
+    for sweep_dir in _child_dirs(base_run_dir, "sweep-"):
+        run_dirs.extend(_child_dirs(sweep_dir, "run-"))
+    return run_dirs
+
+
+def run_dir_id(run_dir: Path) -> str:
+    """Identifier of a run across bases; sweep run names repeat, so they keep their sweep."""
+    if run_dir.parent.name.startswith("sweep-"):
+        return f"{run_dir.parent.name}/{run_dir.name}"
+    return run_dir.name
+
+
 def load_latest_run_dir(base_run_dir: Path) -> Path:
     if not base_run_dir.exists():
         raise FileNotFoundError(f"Run directory not found: {base_run_dir}")
-    candidates = [p for p in base_run_dir.iterdir() if p.is_dir() and p.name.startswith("run-")]
+    candidates = _child_dirs(base_run_dir, "run-")
     if not candidates:
         raise FileNotFoundError(f"No run-* directories found under: {base_run_dir}")
-    return sorted(candidates)[-1]
+    return candidates[-1]
 
 
-def evaluate_run_against_human(
-    *,
-    run_dir: Path,
+def load_human_baseline(
     round2_results_path: Path,
-) -> dict:
-    summary_path = run_dir / "summary.json"
-    if not summary_path.exists():
-        raise FileNotFoundError(f"Run summary not found: {summary_path}")
-    item_results = json.loads(summary_path.read_text(encoding="utf-8"))
-    llm_df = pd.DataFrame(item_results)
-
-    _, human_summary = parse_round_results_xlsx(round2_results_path, round_number=2)
-    human_df = human_summary.copy()
-    human_df["human_category"] = human_df.apply(
-        lambda r: classify_human_category(
-            float(r["agreement_inclusion"]),
-            float(r["agreement_exclusion"]),
-        ),
-        axis=1,
+    *,
+    cache_dir: Path | None = None,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+) -> pd.DataFrame:
+    _, human_summary = load_round_results(
+        round2_results_path, round_number=2, cache_dir=cache_dir, parse=parse_round_results_xlsx
     )
+    human_df = human_summary[
+        ["item_key", "median", "agreement_inclusion", "agreement_exclusion"]
+    ].drop_duplicates("item_key")
+    return human_df.assign(
+        human_category=classify_human_categories(
+            human_df["agreement_inclusion"], human_df["agreement_exclusion"], thresholds
+        )
+    )[["item_key", "human_category", "median", "agreement_inclusion", "agreement_exclusion"]]
 
-    merged = llm_df.merge(
-        human_df[
-            [
-                "item_text",
-                "human_category",
-                "median",
-                "agreement_inclusion",
-                "agreement_exclusion",
-            ]
-        ],
-        on="item_text",
-        how="left",
-        suffixes=("_llm", "_human"),
-    )
+
+def score_run(run_dir: Path, human_df: pd.DataFrame) -> dict:
+    llm_df = load_item_results(run_dir)
+    llm_df = llm_df.assign(item_key=[item_key(text) for text in llm_df["item_text"]])
+    merged = llm_df.merge(human_df, on="item_key", how="left", suffixes=("_llm", "_human"))
     merged["decision_match"] = merged["final_category"] == merged["human_category"]
     merged["abs_median_error"] = (merged["final_median"] - merged["median"]).abs()
     merged["abs_agreement_inclusion_error"] = (
@@ -67,7 +113,7 @@ def evaluate_run_against_human(
         merged["final_agreement_exclusion"] - merged["agreement_exclusion"]
     ).abs()
 
-    total = int(len(merged))
+    total = len(merged)
     matched = int(merged["decision_match"].sum())
     summary = {
         "run_dir": str(run_dir),
@@ -83,3 +129,40 @@ def evaluate_run_against_human(
         ),
     }
     return {"summary": summary, "items": merged}
+
+
+def evaluate_runs_against_human(
+    *,
+    run_dirs: list[Path],
+    round2_results_path: Path,
+    cache_dir: Path | None = None,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+) -> dict[Path, dict]:
+    """Score many runs against one human baseline, loaded and classified only once."""
+    human_df = load_human_baseline(round2_results_path, cache_dir=cache_dir, thresholds=thresholds)
+    return {run_dir: score_run(run_dir, human_df) for run_dir in run_dirs}
+
+
+def evaluate_run_against_human(
+    *,
+    run_dir: Path,
+    round2_results_path: Path,
+    cache_dir: Path | None = None,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+) -> dict:
+    return evaluate_runs_against_human(
+        run_dirs=[run_dir],
+        round2_results_path=round2_results_path,
+        cache_dir=cache_dir,
+        thresholds=thresholds,
+    )[run_dir]
+
+
+def write_evaluation(run_dir: Path, result: dict) -> tuple[Path, Path]:
+    summary_path = run_dir / "evaluation_summary.json"
+    items_path = run_dir / "evaluation_items.csv"
+    summary_path.write_text(
+        json.dumps(result["summary"], ensure_ascii=True, indent=2), encoding="utf-8"
+    )
+    result["items"].to_csv(items_path, index=False)
+    return summary_path, items_path
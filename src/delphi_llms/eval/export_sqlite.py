@@ -1,148 +1,208 @@
+import hashlib
 import json
 import sqlite3
+from datetime import UTC, datetime
+from itertools import islice, repeat
 from pathlib import Path
 
-from delphi_llms.eval.compare import load_latest_run_dir
+from delphi_llms.delphi.artifacts import has_columnar_artifacts, load_item_results, load_run_frames
+from delphi_llms.delphi.events import (
+    RUN_CALLS_COLUMNS,
+    RUN_CALLS_DDL,
+    RUN_CALLS_INSERT,
+    RUN_EVENTS_COLUMNS,
+    RUN_EVENTS_DDL,
+    RUN_EVENTS_INSERT,
+    RUN_SUMMARY_COLUMNS,
+    RUN_SUMMARY_DDL,
+    RUN_SUMMARY_INSERT,
+    run_call_rows,
+    run_event_row,
+    run_summary_row,
+)
+from delphi_llms.eval.compare import list_run_dirs, load_latest_run_dir, run_dir_id
+
+EXPORT_CHUNK_SIZE = 10_000
+
+BULK_LOAD_PRAGMAS = (
+    "pragma journal_mode=wal",
+    "pragma synchronous=off",
+    "pragma temp_store=memory",
+    "pragma cache_size=-65536",
+)
+
+EXPORT_INDEXES = (
+    "create index if not exists run_events_item_round on run_events (item_id, round)",
+    "create index if not exists run_events_type on run_events (type)",
+    "create index if not exists run_events_expert on run_events (expert_id)",
+    "create index if not exists run_calls_item_round on run_calls (item_id, round)",
+)
+
+EXPORT_TABLES = ("run_events", "run_calls", "run_summary", "eval_summary", "eval_items")
+
+EVAL_SUMMARY_COLUMNS = (
+    "run_dir",
+    "items_evaluated",
+    "decision_matches",
+    "decision_match_ratio",
+    "mean_abs_median_error",
+    "mean_abs_agreement_inclusion_error",
+    "mean_abs_agreement_exclusion_error",
+)
+
+EVAL_SUMMARY_DDL = """
+create table if not exists eval_summary (
+  run_dir text,
+  items_evaluated integer,
+  decision_matches integer,
+  decision_match_ratio real,
+  mean_abs_median_error real,
+  mean_abs_agreement_inclusion_error real,
+  mean_abs_agreement_exclusion_error real
+)
+"""
+
+RUN_ARTIFACTS = (
+    "config.json",
+    "events.jsonl",
+    "summary.json",
+    "evaluation_summary.json",
+    "evaluation_items.csv",
+)
+
+WAREHOUSE_RUNS_DDL = """
+create table if not exists runs (
+  run_id text primary key,
+  run_dir text,
+  fingerprint text,
+  config_json text,
+  ingested_at text
+)
+"""
+
+WAREHOUSE_PRAGMAS = (
+    "pragma journal_mode=wal",
+    "pragma synchronous=normal",
+    "pragma temp_store=memory",
+    "pragma cache_size=-65536",
+)
+
+WAREHOUSE_INDEXES = (
+    "create index if not exists run_events_run_item_round on run_events (run_id, item_id, round)",
+    "create index if not exists run_events_type on run_events (type)",
+    "create index if not exists run_events_expert on run_events (expert_id)",
+    "create index if not exists run_calls_run_item_round on run_calls (run_id, item_id, round)",
+    "create index if not exists run_summary_run on run_summary (run_id)",
+)
+
+
+def _with_run_id(ddl: str) -> str:
+    return ddl.replace("(", "(\n  run_id text,", 1)
+
+
+def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
+    return f"insert into {table} ({', '.join(columns)}) values ({', '.join('?' for _ in columns)})"
+
+
+def _records(frame) -> list[dict]:  # type: ignore[no-untyped-def]
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _column_values(frame, column: str) -> list:  # type: ignore[no-untyped-def]
+    values = frame[column]
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def _event_rows(frame, event_type: str) -> list[tuple]:  # type: ignore[no-untyped-def]
+    # Built column by column in run_event_row order, without a dict per row.
+    columns: list = []
+    for column in RUN_EVENTS_COLUMNS:
+        if column == "type":
+            columns.append(repeat(event_type))
+        elif column == "stop" and column in frame:
+            columns.append(frame[column].astype("int64").tolist())
+        elif column == "categories_json" and "categories" in frame:
+            columns.append([json.dumps(list(c)) for c in frame["categories"]])
+        elif column in frame:
+            columns.append(_column_values(frame, column))
+        else:
+            columns.append(repeat(None))
+    return list(zip(*columns))
+
+
+def _columnar_rows(run_dir: Path) -> tuple[list[tuple], list[tuple]]:
+    frames = load_run_frames(run_dir)
+    event_rows = _event_rows(frames["expert_responses"], "expert_response")
+    event_rows.extend(_event_rows(frames["round_summaries"], "round_summary"))
+    calls = frames["calls"].astype({"cached": "int64"})
+    call_rows = list(zip(*(_column_values(calls, c) for c in RUN_CALLS_COLUMNS)))
+    return event_rows, call_rows
+
+
+def _insert_events(conn: sqlite3.Connection, run_dir: Path, *, run_id: str | None = None) -> None:
+    events_insert, calls_insert = RUN_EVENTS_INSERT, RUN_CALLS_INSERT
+    prefix: tuple = ()
+    if run_id is not None:
+        events_insert = _insert_sql("run_events", ("run_id", *RUN_EVENTS_COLUMNS))
+        calls_insert = _insert_sql("run_calls", ("run_id", *RUN_CALLS_COLUMNS))
+        prefix = (run_id,)
+    # Columnar artefacts skip the per-line JSON decode entirely.
+    if has_columnar_artifacts(run_dir):
+        event_rows, call_rows = _columnar_rows(run_dir)
+        conn.executemany(events_insert, [(*prefix, *row) for row in event_rows])
+        conn.executemany(calls_insert, [(*prefix, *row) for row in call_rows])
+        return
+    with (run_dir / "events.jsonl").open("r", encoding="utf-8") as handle:
+        while lines := list(islice(handle, EXPORT_CHUNK_SIZE)):
+            events = [json.loads(line) for line in lines]
+            conn.executemany(events_insert, [(*prefix, *run_event_row(e)) for e in events])
+            conn.executemany(
+                calls_insert, [(*prefix, *row) for e in events for row in run_call_rows(e)]
+            )
+
+
+def _require_run_files(run_dir: Path) -> None:
+    for name in ("events.jsonl", "summary.json"):
+        if not (run_dir / name).exists():
+            raise FileNotFoundError(f"{name.split('.')[0]} file not found: {run_dir / name}")
+
+
+def _summary_rows(run_dir: Path) -> list[tuple]:
+    return [run_summary_row(row) for row in _records(load_item_results(run_dir))]
+
+
+def _eval_summary_row(run_dir: Path) -> tuple | None:
+    path = run_dir / "evaluation_summary.json"
+    if not path.exists():
+        return None
+    row = json.loads(path.read_text(encoding="utf-8"))
+    return tuple(row.get(column) for column in EVAL_SUMMARY_COLUMNS)
 
 
 def export_latest_run_to_sqlite(*, base_run_dir: Path, sqlite_path: Path) -> Path:
     run_dir = load_latest_run_dir(base_run_dir)
-    events_path = run_dir / "events.jsonl"
-    summary_path = run_dir / "summary.json"
-    evaluation_summary_path = run_dir / "evaluation_summary.json"
     evaluation_items_path = run_dir / "evaluation_items.csv"
-
-    if not events_path.exists():
-        raise FileNotFoundError(f"events file not found: {events_path}")
-    if not summary_path.exists():
-        raise FileNotFoundError(f"summary file not found: {summary_path}")
+    _require_run_files(run_dir)
 
     sqlite_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(sqlite_path)
     try:
-        conn.execute("drop table if exists run_events")
-        conn.execute("drop table if exists run_summary")
-        conn.execute("drop table if exists eval_summary")
-        conn.execute("drop table if exists eval_items")
-
-        conn.execute(
-            """
-            create table run_events (
-              type text,
-              item_id text,
-              round integer,
-              expert_id text,
-              rating real,
-              category text,
-              rationale text,
-              confidence real,
-              clarification_question text,
-              facilitator_answer text,
-              stop integer,
-              reason text,
-              categories_json text,
-              median real,
-              agreement_inclusion real,
-              agreement_exclusion real
-            )
-            """
-        )
-        conn.execute(
-            """
-            create table run_summary (
-              item_id text,
-              item_text text,
-              final_category text,
-              stop_reason text,
-              rounds_run integer,
-              final_median real,
-              final_agreement_inclusion real,
-              final_agreement_exclusion real
-            )
-            """
-        )
+        for pragma in BULK_LOAD_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("begin")
+        for table in EXPORT_TABLES:
+            conn.execute(f"drop table if exists {table}")
 
-        with events_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                row = json.loads(line)
-                conn.execute(
-                    """
-                    insert into run_events (
-                      type, item_id, round, expert_id, rating, category, rationale, confidence,
-                      clarification_question, facilitator_answer, stop, reason, categories_json,
-                      median, agreement_inclusion, agreement_exclusion
-                    ) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        row.get("type"),
-                        row.get("item_id"),
-                        row.get("round"),
-                        row.get("expert_id"),
-                        row.get("rating"),
-                        row.get("category"),
-                        row.get("rationale"),
-                        row.get("confidence"),
-                        row.get("clarification_question"),
-                        row.get("facilitator_answer"),
-                        1 if row.get("stop") else 0 if "stop" in row else None,
-                        row.get("reason"),
-                        json.dumps(row.get("categories")) if row.get("categories") is not None else None,
-                        row.get("median"),
-                        row.get("agreement_inclusion"),
-                        row.get("agreement_exclusion"),
-                    ),
-                )
-
-        summary_rows = json.loads(summary_path.read_text(encoding="utf-8"))
-        for row in summary_rows:
-            conn.execute(
-                """
-                insert into run_summary (
-                  item_id, item_text, final_category, stop_reason, rounds_run,
-                  final_median, final_agreement_inclusion, final_agreement_exclusion
-                ) values (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("item_id"),
-                    row.get("item_text"),
-                    row.get("final_category"),
-                    row.get("stop_reason"),
-                    row.get("rounds_run"),
-                    row.get("final_median"),
-                    row.get("final_agreement_inclusion"),
-                    row.get("final_agreement_exclusion"),
-                ),
-            )
+        conn.execute(RUN_EVENTS_DDL)
+        conn.execute(RUN_CALLS_DDL)
+        conn.execute(RUN_SUMMARY_DDL)
+        _insert_events(conn, run_dir)
+        conn.executemany(RUN_SUMMARY_INSERT, _summary_rows(run_dir))
 
-        if evaluation_summary_path.exists():
-            conn.execute(
-                """
-                create table eval_summary (
-                  run_dir text,
-                  items_evaluated integer,
-                  decision_matches integer,
-                  decision_match_ratio real,
-                  mean_abs_median_error real,
-                  mean_abs_agreement_inclusion_error real,
-                  mean_abs_agreement_exclusion_error real
-                )
-                """
-            )
-            row = json.loads(evaluation_summary_path.read_text(encoding="utf-8"))
-            conn.execute(
-                """
-                insert into eval_summary values (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("run_dir"),
-                    row.get("items_evaluated"),
-                    row.get("decision_matches"),
-                    row.get("decision_match_ratio"),
-                    row.get("mean_abs_median_error"),
-                    row.get("mean_abs_agreement_inclusion_error"),
-                    row.get("mean_abs_agreement_exclusion_error"),
-                ),
-            )
+        eval_row = _eval_summary_row(run_dir)
+        if eval_row is not None:
+            conn.execute(EVAL_SUMMARY_DDL)
+            conn.execute(_insert_sql("eval_summary", EVAL_SUMMARY_COLUMNS), eval_row)
 
         if evaluation_items_path.exists():
             import pandas as pd
@@ -150,8 +210,128 @@ def export_latest_run_to_sqlite(*, base_run_dir: Path, sqlite_path: Path) -> Pat
             df = pd.read_csv(evaluation_items_path)
             df.to_sql("eval_items", conn, if_exists="replace", index=False)
 
+        for statement in EXPORT_INDEXES:
+            conn.execute(statement)
         conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
     finally:
         conn.close()
 
     return sqlite_path
+
+
+def run_fingerprint(run_dir: Path) -> str:
+    digest = hashlib.sha256()
+    for name in RUN_ARTIFACTS:
+        path = run_dir / name
+        if not path.exists():
+            continue
+        digest.update(name.encode("utf-8") + b"\0")
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _append_eval_items(conn: sqlite3.Connection, path: Path, *, run_id: str) -> None:
+    import pandas as pd
+
+    # pandas.to_sql commits on its own, which would split the per-run transaction.
+    df = pd.read_csv(path)
+    df.insert(0, "run_id", run_id)
+    conn.execute("create table if not exists eval_items (run_id text)")
+    existing = {row[1] for row in conn.execute("pragma table_info(eval_items)")}
+    for column in df.columns:
+        if column not in existing:
+            conn.execute(f'alter table eval_items add column "{column}"')
+    columns = ", ".join(f'"{column}"' for column in df.columns)
+    conn.executemany(
+        f"insert into eval_items ({columns}) values ({', '.join('?' for _ in df.columns)})",
+        df.astype(object).where(df.notna(), None).itertuples(index=False, name=None),
+    )
+
+
+def _ingest_run(conn: sqlite3.Connection, run_dir: Path, *, fingerprint: str) -> None:
+    run_id = run_dir_id(run_dir)
+    config_path = run_dir / "config.json"
+    conn.execute("begin")
+    for table in EXPORT_TABLES:
+        if conn.execute(
+            "select 1 from sqlite_master where type = 'table' and name = ?", (table,)
+        ).fetchone():
+            conn.execute(f"delete from {table} where run_id = ?", (run_id,))
+    conn.execute("delete from runs where run_id = ?", (run_id,))
+
+    _insert_events(conn, run_dir, run_id=run_id)
+    conn.executemany(
+        _insert_sql("run_summary", ("run_id", *RUN_SUMMARY_COLUMNS)),
+        [(run_id, *row) for row in _summary_rows(run_dir)],
+    )
+    eval_row = _eval_summary_row(run_dir)
+    if eval_row is not None:
+        conn.execute(
+            _insert_sql("eval_summary", ("run_id", *EVAL_SUMMARY_COLUMNS)), (run_id, *eval_row)
+        )
+    evaluation_items_path = run_dir / "evaluation_items.csv"
+    if evaluation_items_path.exists():
+        _append_eval_items(conn, evaluation_items_path, run_id=run_id)
+
+    conn.execute(
+        _insert_sql("runs", ("run_id", "run_dir", "fingerprint", "config_json", "ingested_at")),
+        (
+            run_id,
+            str(run_dir.resolve()),
+            fingerprint,
+            config_path.read_text(encoding="utf-8") if config_path.exists() else None,
+            datetime.now(UTC).isoformat(),
+        ),
+    )
+    conn.commit()
+
+
+def export_runs_to_warehouse(*, base_run_dir: Path, sqlite_path: Path) -> dict[str, list[str]]:
+    """Append every finished run under ``base_run_dir`` to a multi-run warehouse database.
+
+    Rows carry the run directory name as ``run_id``, prefixed with its ``sweep-*`` folder for
+    sweep runs. Runs whose artefacts are unchanged since they were ingested are skipped; a
+    changed run (e.g. resumed or re-evaluated) replaces its previous rows. Runs without
+    ``summary.json`` are still in progress and are left alone.
+    """
+    run_dirs = list_run_dirs(base_run_dir)
+    sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+    result: dict[str, list[str]] = {"ingested": [], "skipped": [], "incomplete": []}
+    conn = sqlite3.connect(sqlite_path, isolation_level=None)
+    try:
+        for pragma in WAREHOUSE_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute(WAREHOUSE_RUNS_DDL)
+        conn.execute(_with_run_id(RUN_EVENTS_DDL))
+        conn.execute(_with_run_id(RUN_CALLS_DDL))
+        conn.execute(_with_run_id(RUN_SUMMARY_DDL))
+        conn.execute(_with_run_id(EVAL_SUMMARY_DDL))
+        for statement in WAREHOUSE_INDEXES:
+            conn.execute(statement)
+        ingested = dict(conn.execute("select run_id, fingerprint from runs").fetchall())
+
+        for run_dir in run_dirs:
+            run_id = run_dir_id(run_dir)
+            if not (run_dir / "events.jsonl").exists() or not (run_dir / "summary.json").exists():
+                result["incomplete"].append(run_id)
+                continue
+            fingerprint = run_fingerprint(run_dir)
+            if ingested.get(run_id) == fingerprint:
+                result["skipped"].append(run_id)
+                continue
+            try:
+                _ingest_run(conn, run_dir, fingerprint=fingerprint)
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            result["ingested"].append(run_id)
+    finally:
+        conn.close()
+    return result
@@ -0,0 +1,142 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pandas as pd
+
+from delphi_llms.delphi.artifacts import COLUMNAR_FILES, load_item_results
+from delphi_llms.delphi.executors import create_backend
+from delphi_llms.eval.compare import (
+    ConsensusThresholds,
+    list_run_dirs,
+    load_human_baseline,
+    run_dir_id,
+    score_run,
+    write_evaluation,
+)
+
+LEADERBOARD_COLUMNS = (
+    "rank",
+    "run_id",
+    "model",
+    "mode",
+    "items_evaluated",
+    "decision_match_ratio",
+    "mean_abs_median_error",
+    "mean_abs_agreement_inclusion_error",
+    "mean_abs_agreement_exclusion_error",
+    "mean_rounds_run",
+    "wall_time_seconds",
+    "prompt_tokens",
+    "eval_tokens",
+    "run_dir",
+)
+
+
+def discover_run_dirs(bases: list[Path]) -> list[Path]:
+    seen: dict[Path, Path] = {}
+    for base in bases:
+        for run_dir in list_run_dirs(base):
+            seen.setdefault(run_dir.resolve(), run_dir)
+    return list(seen.values())
+
+
+def _result_paths(run_dir: Path) -> list[Path]:
+    item_results = run_dir / COLUMNAR_FILES["item_results"]
+    return [run_dir / "summary.json", *([item_results] if item_results.exists() else [])]
+
+
+def evaluation_is_current(
+    run_dir: Path, *, thresholds: ConsensusThresholds = ConsensusThresholds()
+) -> bool:
+    outputs = [run_dir / "evaluation_summary.json", run_dir / "evaluation_items.csv"]
+    if not all(path.exists() for path in outputs):
+        return False
+    if _read_json(outputs[0]).get("thresholds") != asdict(thresholds):
+        return False
+    oldest_output = min(path.stat().st_mtime_ns for path in outputs)
+    return all(path.stat().st_mtime_ns <= oldest_output for path in _result_paths(run_dir))
+
+
+def _evaluate_and_write(
+    run_dir: Path, human_df: pd.DataFrame, thresholds: ConsensusThresholds
+) -> dict:
+    result = score_run(run_dir, human_df)
+    result["summary"]["thresholds"] = asdict(thresholds)
+    write_evaluation(run_dir, result)
+    return result["summary"]
+
+
+def _read_json(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def leaderboard_row(run_dir: Path, evaluation: dict) -> dict:
+    config = _read_json(run_dir / "config.json")
+    report = _read_json(run_dir / "run_report.json")
+    overall = report.get("overall", {})
+    rounds_run = load_item_results(run_dir).get("rounds_run", pd.Series(dtype=float))
+    return {
+        "run_id": run_dir_id(run_dir),
+        "model": config.get("model"),
+        "mode": config.get("mode"),
+        "items_evaluated": evaluation.get("items_evaluated"),
+        "decision_match_ratio": evaluation.get("decision_match_ratio"),
+        "mean_abs_median_error": evaluation.get("mean_abs_median_error"),
+        "mean_abs_agreement_inclusion_error": evaluation.get("mean_abs_agreement_inclusion_error"),
+        "mean_abs_agreement_exclusion_error": evaluation.get("mean_abs_agreement_exclusion_error"),
+        "mean_rounds_run": float(rounds_run.mean()) if len(rounds_run) else None,
+        "wall_time_seconds": report.get("wall_time_seconds"),
+        "prompt_tokens": overall.get("prompt_tokens"),
+        "eval_tokens": overall.get("eval_tokens"),
+        "run_dir": str(run_dir),
+    }
+
+
+def evaluate_all_runs(
+    *,
+    bases: list[Path],
+    round2_results_path: Path,
+    cache_dir: Path | None = None,
+    thresholds: ConsensusThresholds = ConsensusThresholds(),
+    backend: str = "process",
+    max_workers: int = 4,
+    force: bool = False,
+) -> dict:
+    """Evaluate every finished run under ``bases`` and rank them in a leaderboard.
+
+    Runs whose evaluation files are newer than their results and were scored with the same
+    thresholds are not re-scored. The human baseline is loaded once and shipped to the
+    workers, which write each run's evaluation.
+    """
+    run_dirs = [d for d in discover_run_dirs(bases) if (d / "summary.json").exists()]
+    pending = [d for d in run_dirs if force or not evaluation_is_current(d, thresholds=thresholds)]
+    evaluations: dict[Path, dict] = {}
+    if pending:
+        human_df = load_human_baseline(
+            round2_results_path, cache_dir=cache_dir, thresholds=thresholds
+        )
+        with create_backend(backend, max_workers=min(max_workers, len(pending))) as pool:
+            futures = {
+                d: pool.submit(_evaluate_and_write, d, human_df, thresholds) for d in pending
+            }
+            evaluations = {d: future.result() for d, future in futures.items()}
+    for run_dir in run_dirs:
+        if run_dir not in evaluations:
+            evaluations[run_dir] = _read_json(run_dir / "evaluation_summary.json")
+
+    board = pd.DataFrame(
+        [leaderboard_row(d, evaluations[d]) for d in run_dirs], columns=LEADERBOARD_COLUMNS[1:]
+    )
+    board = board.sort_values(
+        ["decision_match_ratio", "mean_abs_median_error", "run_id"],
+        ascending=[False, True, True],
+        na_position="last",
+        kind="stable",
+    ).reset_index(drop=True)
+    board.insert(0, "rank", range(1, len(board) + 1))
+    return {
+        "leaderboard": board,
+        "evaluated": [run_dir_id(d) for d in pending],
+        "reused": [run_dir_id(d) for d in run_dirs if d not in pending],
+    }
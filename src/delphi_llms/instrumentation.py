@@ -0,0 +1,189 @@
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Self
+
+_OLLAMA_DURATIONS = {
+    "total_duration": "total_ms",
+    "load_duration": "load_ms",
+    "prompt_eval_duration": "prompt_eval_ms",
+    "eval_duration": "eval_ms",
+}
+_OLLAMA_COUNTS = ("prompt_eval_count", "eval_count")
+
+_calls: ContextVar[list[dict] | None] = ContextVar("delphi_llms_calls", default=None)
+_attempt: ContextVar[int] = ContextVar("delphi_llms_attempt", default=1)
+_requested_seed: ContextVar[int | None] = ContextVar("delphi_llms_requested_seed", default=None)
+
+
+def record_call(call: dict) -> None:
+    calls = _calls.get()
+    if calls is not None:
+        calls.append(call)
+
+
+@contextmanager
+def retry_attempt(attempt: int, *, requested_seed: int | None = None) -> Iterator[None]:
+    """Mark the calls made inside the block as the ``attempt``-th try of a retried request
+    whose caller asked for ``requested_seed``."""
+    tokens = (_attempt.set(attempt), _requested_seed.set(requested_seed))
+    try:
+        yield
+    finally:
+        _attempt.reset(tokens[0])
+        _requested_seed.reset(tokens[1])
+
+
+def requested_seed() -> int | None:
+    """Seed the caller of the current retried request asked for, before any reseeding."""
+    return _requested_seed.get()
+
+
+def ollama_call_metrics(
+    *,
+    kind: str,
+    model: str,
+    body: dict,
+    latency_ms: float,
+    cached: bool,
+    seed: int | None = None,
+) -> dict:
+    # The seed is the one actually sent: retries of malformed output change it.
+    call: dict = {
+        "kind": kind,
+        "model": model,
+        "latency_ms": latency_ms,
+        "cached": cached,
+        "seed": seed,
+        "attempt": _attempt.get(),
+    }
+    for field, name in _OLLAMA_DURATIONS.items():
+        value = body.get(field)
+        call[name] = value / 1e6 if isinstance(value, (int, float)) and not cached else None
+    for field in _OLLAMA_COUNTS:
+        value = body.get(field)
+        call[field] = int(value) if isinstance(value, (int, float)) and not cached else None
+    return call
+
+
+class CallRecorder:
+    """Collects the calls made while it is active in the current thread or asyncio task."""
+
+    def __init__(self, *, submitted_at: float | None = None) -> None:
+        self.submitted_at = submitted_at
+        self.started_at: float | None = None
+        self.calls: list[dict] = []
+
+    def __enter__(self) -> Self:
+        self.started_at = time.time()
+        self._token = _calls.set(self.calls)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        _calls.reset(self._token)
+
+    def metrics(self) -> dict | None:
+        if not self.calls:
+            return None
+        queue_wait_ms = None
+        if self.submitted_at is not None and self.started_at is not None:
+            queue_wait_ms = max(self.started_at - self.submitted_at, 0.0) * 1000
+        return {"queue_wait_ms": queue_wait_ms, "calls": self.calls}
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+class _Group:
+    def __init__(self) -> None:
+        self.latency: list[float] = []
+        self.queue_wait: list[float] = []
+        self.cached = 0
+        self.sums = {name: [] for name in ("load_ms", "prompt_eval_ms", "eval_ms")}
+        self.prompt_tokens = 0
+        self.prompt_seconds = 0.0
+        self.eval_tokens = 0
+        self.eval_seconds = 0.0
+
+    def add(self, call: dict) -> None:
+        self.latency.append(call["latency_ms"])
+        if call.get("cached"):
+            self.cached += 1
+            return
+        for name, values in self.sums.items():
+            if call.get(name) is not None:
+                values.append(call[name])
+        if call.get("prompt_eval_count") and call.get("prompt_eval_ms"):
+            self.prompt_tokens += call["prompt_eval_count"]
+            self.prompt_seconds += call["prompt_eval_ms"] / 1000
+        if call.get("eval_count") and call.get("eval_ms"):
+            self.eval_tokens += call["eval_count"]
+            self.eval_seconds += call["eval_ms"] / 1000
+
+    def summary(self) -> dict:
+        return {
+            "calls": len(self.latency),
+            "cached": self.cached,
+            "latency_ms": {f"p{q}": percentile(self.latency, q) for q in (50, 95, 99)},
+            "queue_wait_ms": {f"p{q}": percentile(self.queue_wait, q) for q in (50, 95, 99)},
+            **{f"{name}_mean": _mean(values) for name, values in self.sums.items()},
+            "prompt_tokens": self.prompt_tokens,
+            "eval_tokens": self.eval_tokens,
+            "prompt_tokens_per_second": (
+                self.prompt_tokens / self.prompt_seconds if self.prompt_seconds else None
+            ),
+            "tokens_per_second": (
+                self.eval_tokens / self.eval_seconds if self.eval_seconds else None
+            ),
+        }
+
+
+class CallSummary:
+    """Call statistics of a run, built up one event at a time."""
+
+    def __init__(self) -> None:
+        self.overall = _Group()
+        self.by_model: dict[str, _Group] = {}
+        self.by_round: dict[int, _Group] = {}
+
+    def add(self, event: dict) -> None:
+        metrics = event.get("metrics") if event.get("type") == "expert_response" else None
+        if not metrics:
+            return
+        round_group = self.by_round.setdefault(int(event["round"]), _Group())
+        groups = [self.overall, round_group]
+        for call in metrics.get("calls", []):
+            model_group = self.by_model.setdefault(str(call.get("model")), _Group())
+            for group in (self.overall, round_group, model_group):
+                group.add(call)
+            groups.append(model_group)
+        if metrics.get("queue_wait_ms") is not None:
+            for group in {id(group): group for group in groups}.values():
+                group.queue_wait.append(metrics["queue_wait_ms"])
+
+    def report(self, *, wall_time_seconds: float | None = None) -> dict:
+        return {
+            "wall_time_seconds": wall_time_seconds,
+            "overall": self.overall.summary(),
+            "by_model": {model: group.summary() for model, group in sorted(self.by_model.items())},
+            "by_round": {str(key): group.summary() for key, group in sorted(self.by_round.items())},
+        }
+
+
+def summarize_calls(events: Iterable[dict], *, wall_time_seconds: float | None = None) -> dict:
+    summary = CallSummary()
+    for event in events:
+        summary.add(event)
+    return summary.report(wall_time_seconds=wall_time_seconds)
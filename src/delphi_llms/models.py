@@ -14,6 +14,7 @@ class ExpertResponse(BaseModel):
     category: str
     rationale: str
     confidence: float = Field(ge=0.0, le=1.0)
+    metrics: dict | None = None
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,134 @@
+import copy
+import itertools
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+MODES = ("standard", "recursive")
+
+
+@dataclass(frozen=True)
+class SweepRun:
+    index: int
+    model: str
+    mode: str
+    n_max: int
+    seeds: tuple[int, ...]
+    seed_set: int
+
+    @property
+    def name(self) -> str:
+        model_slug = re.sub(r"[^A-Za-z0-9]+", "-", self.model).strip("-").lower()
+        return f"run-{self.index:03d}-{model_slug}-{self.mode}-n{self.n_max}-s{self.seed_set}"
+
+
+def _grid_values(grid: dict, key: str, default: object) -> list:
+    values = grid.get(key)
+    if values is None:
+        return [default]
+    values = list(values)
+    if not values:
+        raise ValueError(f"sweep.{key} must not be empty")
+    return values
+
+
+def expand_grid(grid: dict, base_config: dict) -> list[SweepRun]:
+    """Expand models x seed sets x n_max x modes into runs, ordered so each model's runs
+    are contiguous. Dimensions missing from the grid fall back to the base config."""
+    models = list(
+        dict.fromkeys(
+            str(m).strip() for m in _grid_values(grid, "models", base_config.get("model", ""))
+        )
+    )
+    if not all(models):
+        raise ValueError("sweep.models must name at least one model")
+    seed_sets = _grid_values(grid, "seed_sets", base_config.get("experts", {}).get("seeds"))
+    if not all(seed_sets):
+        raise ValueError("every sweep seed set must list at least one seed")
+    n_max_values = [int(n) for n in _grid_values(grid, "n_max", base_config.get("n_max", 10))]
+    default_mode = base_config.get("mode", "standard")
+    modes = [str(m).strip().lower() for m in _grid_values(grid, "modes", default_mode)]
+    unknown = sorted(set(modes) - set(MODES))
+    if unknown:
+        raise ValueError(f"sweep.modes must be one of: {', '.join(MODES)} (got {unknown})")
+
+    runs: list[SweepRun] = []
+    for model in models:
+        for (seed_set, seeds), n_max, mode in itertools.product(
+            enumerate(seed_sets, start=1), n_max_values, modes
+        ):
+            runs.append(
+                SweepRun(
+                    index=len(runs) + 1,
+                    model=model,
+                    mode=mode,
+                    n_max=n_max,
+                    seeds=tuple(int(s) for s in seeds),
+                    seed_set=seed_set,
+                )
+            )
+    return runs
+
+
+def resolve_config(
+    base_config: dict, run: SweepRun, *, max_workers: int, facilitator_model: str | None
+) -> dict:
+    config = copy.deepcopy(base_config)
+    config["model"] = run.model
+    config["mode"] = run.mode
+    config["n_max"] = run.n_max
+    config.setdefault("experts", {})["seeds"] = list(run.seeds)
+    config["experts"]["count"] = len(run.seeds)
+    # The facilitator follows the run's model unless pinned, so a model group never makes
+    # Ollama swap to another model halfway through.
+    config.setdefault("facilitator", {})["model"] = facilitator_model or run.model
+    config["concurrency"] = {
+        **config.get("concurrency", {}),
+        "backend": "thread",
+        "max_workers": max_workers,
+    }
+    config["sweep_run"] = {"index": run.index, "name": run.name, "seed_set": run.seed_set}
+    return config
+
+
+def group_by_model(runs: list[SweepRun]) -> list[tuple[str, list[SweepRun]]]:
+    groups: dict[str, list[SweepRun]] = {}
+    for run in runs:
+        groups.setdefault(run.model, []).append(run)
+    return list(groups.items())
+
+
+def run_sweep(
+    runs: list[SweepRun],
+    *,
+    execute: Callable[[SweepRun], Path],
+    max_parallel_runs: int | None = None,
+) -> list[dict]:
+    """Execute the runs one model group at a time; runs inside a group overlap.
+
+    ``execute`` is expected to draw its calls from a backend shared by every run, which is
+    what bounds the sweep's total concurrency. A failed run is recorded and does not stop
+    the others.
+    """
+    results: list[dict] = []
+    for _, group in group_by_model(runs):
+        with ThreadPoolExecutor(max_workers=max_parallel_runs or len(group)) as drivers:
+            futures = [(run, drivers.submit(execute, run)) for run in group]
+            for run, future in futures:
+                record = {
+                    "index": run.index,
+                    "name": run.name,
+                    "model": run.model,
+                    "mode": run.mode,
+                    "n_max": run.n_max,
+                    "seeds": list(run.seeds),
+                    "seed_set": run.seed_set,
+                }
+                try:
+                    record.update(status="completed", run_dir=str(future.result()))
+                except Exception as exc:  # noqa: BLE001
+                    record.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+                results.append(record)
+    return results
@@ -0,0 +1,88 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+from delphi_llms.bench import synthetic_run_dir
+from delphi_llms.delphi.artifacts import (
+    has_columnar_artifacts,
+    load_item_results,
+    load_run_frames,
+    write_columnar_artifacts,
+    write_run_report,
+)
+from delphi_llms.delphi.events import read_events
+from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite
+from delphi_llms.instrumentation import summarize_calls
+
+
+def _run_with_metrics(base: Path) -> Path:
+    run_dir = synthetic_run_dir(base, events=24, experts=3)
+    events = read_events(run_dir / "events.jsonl")
+    events[0]["metrics"] = {
+        "queue_wait_ms": 3.0,
+        "calls": [{"kind": "expert", "model": "m", "cached": False, "latency_ms": 12.5}],
+    }
+    (run_dir / "events.jsonl").write_text(
+        "".join(json.dumps(event) + "\n" for event in events), encoding="utf-8"
+    )
+    return run_dir
+
+
+def test_columnar_frames_match_the_jsonl_fallback(tmp_path: Path) -> None:
+    run_dir = _run_with_metrics(tmp_path / "runs")
+    from_jsonl = load_run_frames(run_dir)
+    assert from_jsonl["calls"]["latency_ms"].tolist() == [12.5]
+
+    item_results = json.loads((run_dir / "summary.json").read_text(encoding="utf-8"))
+    report, paths = write_run_report(
+        run_dir, item_results=item_results, wall_time_seconds=2.0, columnar=True
+    )
+    assert report == summarize_calls(read_events(run_dir / "events.jsonl"), wall_time_seconds=2.0)
+    assert json.loads((run_dir / "run_report.json").read_text(encoding="utf-8")) == report
+    assert len(paths) == 4
+    assert has_columnar_artifacts(run_dir)
+    from_parquet = load_run_frames(run_dir)
+    for name, expected in from_jsonl.items():
+        actual = from_parquet[name]
+        if name == "round_summaries":
+            expected, actual = (
+                frame.assign(categories=frame["categories"].map(list))
+                for frame in (expected, actual)
+            )
+        pd.testing.assert_frame_equal(actual, expected)
+    assert from_parquet["round_summaries"]["round"].dtype == "int64"
+
+    stale = run_dir.stat().st_mtime_ns + 10**9
+    os.utime(run_dir / "events.jsonl", ns=(stale, stale))
+    assert not has_columnar_artifacts(run_dir)
+    assert len(load_item_results(run_dir)) == len(item_results)
+
+
+def test_export_prefers_columnar_artifacts_with_identical_rows(tmp_path: Path) -> None:
+    run_dir = _run_with_metrics(tmp_path / "runs")
+
+    def table_rows(sqlite_path: Path) -> dict[str, list[tuple]]:
+        with sqlite3.connect(sqlite_path) as conn:
+            return {
+                table: sorted(conn.execute(f"select * from {table}").fetchall(), key=repr)
+                for table in ("run_events", "run_calls", "run_summary")
+            }
+
+    jsonl_rows = table_rows(
+        export_latest_run_to_sqlite(base_run_dir=run_dir.parent, sqlite_path=tmp_path / "a.db")
+    )
+    write_columnar_artifacts(
+        run_dir,
+        events=read_events(run_dir / "events.jsonl"),
+        item_results=json.loads((run_dir / "summary.json").read_text(encoding="utf-8")),
+    )
+    (run_dir / "events.jsonl").write_text("not json\n", encoding="utf-8")
+    os.utime(run_dir / "events.jsonl", ns=(0, 0))
+    columnar_rows = table_rows(
+        export_latest_run_to_sqlite(base_run_dir=run_dir.parent, sqlite_path=tmp_path / "b.db")
+    )
+    assert columnar_rows == jsonl_rows
+    assert len(columnar_rows["run_calls"]) == 1
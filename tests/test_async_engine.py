@@ -0,0 +1,121 @@
+import asyncio
+
+from delphi_llms.delphi.async_engine import run_recursive_delphi_async, run_standard_delphi_async
+from delphi_llms.delphi.engine import run_standard_delphi
+from delphi_llms.delphi.stopping import StoppingPolicy
+
+
+def test_run_standard_delphi_async_matches_sync_engine() -> None:
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(3)]
+    expert_ids = ["e1", "e2", "e3"]
+
+    def payload(item_id: str, round_number: int, expert_id: str) -> dict:
+        if item_id == "i1" and round_number == 1 and expert_id == "e3":
+            return {"rating": 5, "category": "maybe", "rationale": "unsure", "confidence": 0.4}
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    def sync_call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        return payload(item_id, round_number, expert_id)
+
+    async def async_call(
+        *, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int
+    ):  # type: ignore[no-untyped-def]
+        await asyncio.sleep(0)
+        return payload(item_id, round_number, expert_id)
+
+    kwargs = {"items": items, "expert_seeds": [1, 2, 3], "n_max": 5, "expert_ids": expert_ids}
+    expected = run_standard_delphi(call_expert=sync_call, **kwargs)
+    result = asyncio.run(
+        run_standard_delphi_async(call_expert=async_call, max_in_flight=4, **kwargs)
+    )
+
+    assert result == expected
+    assert [r["rounds_run"] for r in result["item_results"]] == [1, 2, 1]
+
+
+def test_run_recursive_delphi_async_limits_in_flight_calls() -> None:
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(4)]
+    active = 0
+    peak = 0
+
+    async def ask(
+        *, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int
+    ) -> str:  # type: ignore[no-untyped-def]
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return f"q-{expert_id}"
+
+    async def fac(  # type: ignore[no-untyped-def]
+        *,
+        item_id: str,
+        item_text: str,
+        round_number: int,
+        expert_id: str,
+        clarification_question: str,
+    ) -> str:
+        return f"a-{clarification_question}"
+
+    async def final(  # type: ignore[no-untyped-def]
+        *,
+        item_id: str,
+        item_text: str,
+        round_number: int,
+        expert_id: str,
+        seed: int,
+        clarification_question: str,
+        facilitator_answer: str,
+    ):
+        return {"rating": 2, "category": "exclude", "rationale": "no", "confidence": 0.9}
+
+    result = asyncio.run(
+        run_recursive_delphi_async(
+            items=items,
+            expert_seeds=[1, 2, 3],
+            n_max=3,
+            ask_expert_clarification=ask,
+            call_facilitator=fac,
+            call_expert_with_clarification=final,
+            max_in_flight=5,
+        )
+    )
+
+    assert 1 < peak <= 5
+    assert [r["final_category"] for r in result["item_results"]] == ["exclude"] * 4
+    responses = [e for e in result["event_log"] if e["type"] == "expert_response"]
+    assert all(r["facilitator_answer"] == f"a-q-{r['expert_id']}" for r in responses)
+
+
+def test_run_standard_delphi_async_quorum_cancels_outstanding_calls() -> None:
+    cancelled: list[str] = []
+
+    async def call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        if expert_id == "e3":
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(expert_id)
+                raise
+        return {"rating": 8, "category": "include"}
+
+    result = asyncio.run(
+        run_standard_delphi_async(
+            items=[{"item_id": "i1", "item_text": "Item 1"}],
+            expert_seeds=[1, 2, 3],
+            n_max=3,
+            call_expert=call,
+            expert_ids=["e1", "e2", "e3"],
+            stopping=StoppingPolicy(quorum=0.6),
+        )
+    )
+
+    assert cancelled == ["e3"]
+    item = result["item_results"][0]
+    assert [item["final_category"], item["stop_reason"], item["rounds_run"]] == [
+        "include",
+        "quorum_reached",
+        1,
+    ]
+    assert [e["expert_id"] for e in result["event_log"][:-1]] == ["e1", "e2"]
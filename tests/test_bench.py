@@ -0,0 +1,58 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from delphi_llms.bench import (
+    _git_commit,
+    compare_to_baseline,
+    run_benchmarks,
+    synthetic_dataset_sheet,
+    synthetic_run_dir,
+)
+from delphi_llms.cli import app
+from delphi_llms.data.loader import parse_dataset_sheet
+from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite
+
+
+def test_synthetic_inputs_match_the_real_parsers(tmp_path: Path) -> None:
+    sheet = synthetic_dataset_sheet(experts=4, items=12)
+    ratings, summary = parse_dataset_sheet(sheet, round_number=1)
+    assert len(ratings) == 4 * 12
+    assert summary["item_domain"].tolist()[9:11] == ["Domain 0", "Domain 1"]
+
+    synthetic_run_dir(tmp_path / "runs", events=60)
+    sqlite_path = export_latest_run_to_sqlite(
+        base_run_dir=tmp_path / "runs", sqlite_path=tmp_path / "bench.sqlite"
+    )
+    with sqlite3.connect(sqlite_path) as conn:
+        assert conn.execute("select count(*) from run_events").fetchone()[0] == 60
+
+
+def test_run_benchmarks_rejects_unknown_names_and_compares_baselines() -> None:
+    with pytest.raises(ValueError, match="Unknown benchmark"):
+        run_benchmarks(names=["nope"])
+    current = {"results": {"a": {"median_seconds": 2.0}, "b": {"median_seconds": 1.0}}}
+    baseline = {"results": {"a": {"median_seconds": 1.0}}}
+    assert compare_to_baseline(current, baseline) == {"a": 2.0}
+
+
+def test_bench_command_writes_json(tmp_path: Path) -> None:
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(app, ["bench", "--only", "aggregation", "--output", str(output)])
+
+    assert result.exit_code == 0, result.stdout
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["meta"]["scale"] == "quick"
+    assert set(report["results"]) == {"aggregation"}
+    assert report["results"]["aggregation"]["repeats"] == 3
+
+
+def test_git_commit_comes_from_the_package_checkout_not_the_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    commit = _git_commit()
+    assert commit is not None and len(commit) == 40
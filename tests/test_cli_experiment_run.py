@@ -0,0 +1,224 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from delphi_llms.cli import app
+
+
+def _write_config(tmp_path: Path, extra: list[str] | None = None) -> Path:
+    round1 = tmp_path / "round1.xlsx"
+    round1.write_text("x", encoding="utf-8")
+    config = tmp_path / "experiment.yaml"
+    config.write_text(
+        "\n".join(
+            [
+                "model: qwen3-4b",
+                "n_max: 3",
+                "experts:",
+                "  seeds: [11, 22, 33]",
+                "dataset_paths:",
+                f"  round1_results: {round1}",
+                "outputs:",
+                f"  run_dir: {tmp_path / 'runs'}",
+                *(extra or []),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return config
+
+
+def _fake_parse(path: Path, round_number: int):  # type: ignore[no-untyped-def]
+    import pandas as pd
+
+    summary = pd.DataFrame({"item_col": [1, 2], "item_text": ["Q1", "Q2"]})
+    return pd.DataFrame(), summary
+
+
+def test_experiment_run_shares_one_client_across_calls(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    clients: list[object] = []
+
+    def fake_ensure(*, ollama_host: str, model: str, client=None) -> None:  # type: ignore[no-untyped-def]
+        clients.append(client)
+
+    def fake_expert(*, model: str, ollama_host: str, client=None, **kwargs):  # type: ignore[no-untyped-def]
+        clients.append(client)
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    monkeypatch.setattr("delphi_llms.cli.parse_round_results_xlsx", _fake_parse)
+    monkeypatch.setattr("delphi_llms.cli.prewarm_model", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.ensure_model_available", fake_ensure)
+    monkeypatch.setattr("delphi_llms.cli.call_ollama_expert", fake_expert)
+
+    config = _write_config(tmp_path)
+    result = CliRunner().invoke(app, ["experiment", "run", "--config", str(config)])
+
+    assert result.exit_code == 0, result.stdout
+    assert len(clients) == 1 + 2 * 3
+    assert clients[0] is not None
+    assert all(client is clients[0] for client in clients)
+
+    run_dir = next((tmp_path / "runs").iterdir())
+    summary = json.loads((run_dir / "summary.json").read_text(encoding="utf-8"))
+    assert [row["final_category"] for row in summary] == ["include", "include"]
+    snapshot = json.loads((run_dir / "config.json").read_text(encoding="utf-8"))
+    assert snapshot["model"] == "qwen3-4b"
+    assert not (run_dir / "results.sqlite").exists()
+
+
+def test_experiment_run_resume_continues_outstanding_items(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    calls: list[str] = []
+
+    def fake_expert(*, model: str, ollama_host: str, item_id: str, **kwargs):  # type: ignore[no-untyped-def]
+        calls.append(item_id)
+        return {"rating": 2, "category": "exclude", "rationale": "no", "confidence": 0.9}
+
+    monkeypatch.setattr("delphi_llms.cli.parse_round_results_xlsx", _fake_parse)
+    monkeypatch.setattr("delphi_llms.cli.prewarm_model", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.ensure_model_available", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.call_ollama_expert", fake_expert)
+
+    run_dir = tmp_path / "runs" / "run-20260101T000000Z"
+    run_dir.mkdir(parents=True)
+    done = [
+        {
+            "type": "expert_response",
+            "item_id": "1",
+            "round": 1,
+            "expert_id": f"expert_{idx}",
+            "clarification_question": None,
+            "facilitator_answer": None,
+            "rating": 2,
+            "category": "exclude",
+            "rationale": "no",
+            "confidence": 0.9,
+        }
+        for idx in (1, 2, 3)
+    ]
+    done.append(
+        {
+            "type": "round_summary",
+            "item_id": "1",
+            "round": 1,
+            "categories": ["exclude"] * 3,
+            "stop": True,
+            "reason": "converged",
+            "median": 2.0,
+            "agreement_inclusion": 0.0,
+            "agreement_exclusion": 1.0,
+        }
+    )
+    (run_dir / "events.jsonl").write_text(
+        "".join(json.dumps(event) + "\n" for event in done), encoding="utf-8"
+    )
+
+    import sqlite3
+
+    with sqlite3.connect(run_dir / "results.sqlite") as stale:
+        stale.execute("create table run_events (type text)")
+        stale.execute("insert into run_events values ('expert_response')")
+
+    config = _write_config(tmp_path)
+    result = CliRunner().invoke(
+        app,
+        ["experiment", "run", "--config", str(config), "--resume", str(run_dir), "--live-sqlite"],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert calls == ["2", "2", "2"]
+    summary = json.loads((run_dir / "summary.json").read_text(encoding="utf-8"))
+    assert [row["item_id"] for row in summary] == ["1", "2"]
+    lines = (run_dir / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 8
+    with sqlite3.connect(run_dir / "results.sqlite") as conn:
+        assert conn.execute("select count(*) from run_events").fetchone()[0] == 8
+        assert conn.execute("select item_id from run_summary").fetchall() == [("1",), ("2",)]
+
+
+def test_experiment_run_skips_unreachable_host(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    import httpx
+
+    hosts: list[str] = []
+
+    def fake_ensure(*, ollama_host: str, model: str, client=None) -> None:  # type: ignore[no-untyped-def]
+        if ollama_host == "http://down:11434":
+            raise httpx.ConnectError("refused")
+
+    def fake_expert(*, model: str, ollama_host: str, client=None, **kwargs):  # type: ignore[no-untyped-def]
+        hosts.append(ollama_host)
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    monkeypatch.setattr("delphi_llms.cli.parse_round_results_xlsx", _fake_parse)
+    monkeypatch.setattr("delphi_llms.cli.prewarm_model", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.ensure_model_available", fake_ensure)
+    monkeypatch.setattr("delphi_llms.cli.call_ollama_expert", fake_expert)
+
+    config = _write_config(
+        tmp_path,
+        [
+            "ollama:",
+            "  host_cooldown_seconds: 60",
+            "  hosts:",
+            "    - url: http://down:11434",
+            "    - url: http://up:11434",
+            "      max_concurrency: 2",
+        ],
+    )
+    result = CliRunner().invoke(app, ["experiment", "run", "--config", str(config)])
+
+    assert result.exit_code == 0, result.stdout
+    assert "unreachable: http://down:11434" in result.stdout
+    assert hosts == ["http://up:11434"] * 6
+
+
+def test_experiment_sweep_shares_budget_and_groups_runs_by_model(  # type: ignore[no-untyped-def]
+    tmp_path: Path, monkeypatch
+) -> None:
+    import threading
+    import time
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    models: list[str] = []
+
+    def fake_expert(*, model: str, ollama_host: str, **kwargs):  # type: ignore[no-untyped-def]
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            models.append(model)
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    monkeypatch.setattr("delphi_llms.cli.parse_round_results_xlsx", _fake_parse)
+    monkeypatch.setattr("delphi_llms.cli.prewarm_model", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.ensure_model_available", lambda **kwargs: None)
+    monkeypatch.setattr("delphi_llms.cli.call_ollama_expert", fake_expert)
+
+    config = _write_config(tmp_path)
+    grid = tmp_path / "sweep.yaml"
+    grid.write_text(
+        "models: [model-a, model-b]\n"
+        "seed_sets: [[1, 2, 3], [4, 5, 6]]\n"
+        "n_max: [2]\n"
+        "max_workers: 2\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(
+        app, ["experiment", "sweep", "--config", str(config), "--grid", str(grid)]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert active["peak"] <= 2
+    assert models == ["model-a"] * 12 + ["model-b"] * 12
+
+    sweep_dir = next((tmp_path / "runs").iterdir())
+    manifest = json.loads((sweep_dir / "sweep.json").read_text(encoding="utf-8"))
+    assert [run["status"] for run in manifest["runs"]] == ["completed"] * 4
+    for run in manifest["runs"]:
+        snapshot = json.loads((Path(run["run_dir"]) / "config.json").read_text(encoding="utf-8"))
+        assert [snapshot["model"], snapshot["experts"]["seeds"]] == [run["model"], run["seeds"]]
+        assert snapshot["concurrency"]["max_workers"] == 2
+        assert (Path(run["run_dir"]) / "summary.json").exists()
@@ -1,7 +1,19 @@
+import itertools
 import json
 from pathlib import Path
 
-from delphi_llms.eval.compare import classify_human_category, evaluate_run_against_human
+import pandas as pd
+import pytest
+
+from delphi_llms.data.loader import parse_dataset_sheet
+from delphi_llms.eval.compare import (
+    ConsensusThresholds,
+    classify_human_categories,
+    classify_human_category,
+    evaluate_run_against_human,
+    evaluate_runs_against_human,
+    load_consensus_thresholds,
+)
 
 
 def test_classify_human_category() -> None:
@@ -49,3 +61,62 @@ def test_evaluate_run_against_human(tmp_path: Path) -> None:
     result = evaluate_run_against_human(run_dir=run_dir, round2_results_path=round2)
     assert result["summary"]["items_evaluated"] == 1
     assert result["summary"]["decision_matches"] == 1
+
+
+def test_classify_human_categories_matches_scalar_rule(tmp_path: Path) -> None:
+    grid = [0.0, 0.5, 0.6, 0.74, 0.75, 0.9, 1.0, float("nan")]
+    pairs = list(itertools.product(grid, grid))
+    thresholds_path = tmp_path / "categories.yaml"
+    thresholds_path.write_text("human_consensus:\n  include: 0.6\n", encoding="utf-8")
+    thresholds = load_consensus_thresholds(thresholds_path)
+    assert thresholds == ConsensusThresholds(include=0.6, exclude=0.75)
+
+    for rule in (ConsensusThresholds(), thresholds):
+        vectorised = classify_human_categories(*zip(*pairs), rule)
+        assert vectorised.tolist() == [classify_human_category(i, e, rule) for i, e in pairs]
+
+
+def test_evaluate_runs_loads_baseline_once_and_joins_on_item_key(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sheet = pd.DataFrame(
+        [
+            ["Experts", "Domain", None],
+            [None, "Is the  item\nrelevant?", "Q2"],
+            ["Anonymised expert", 8, 2],
+            ["Min", 8, 2],
+            ["Max", 8, 2],
+            ["Median", 8, 2],
+            ["AGREEMENT_INCLUSION", 1.0, 0.0],
+            ["AGREEMENT_EXCLUSION", 0.0, 1.0],
+        ]
+    )
+    parsed: list[Path] = []
+
+    def parse(path: Path, round_number: int):  # type: ignore[no-untyped-def]
+        parsed.append(path)
+        return parse_dataset_sheet(sheet, round_number=round_number)
+
+    monkeypatch.setattr("delphi_llms.eval.compare.parse_round_results_xlsx", parse)
+    run_dirs = []
+    for idx, category in enumerate(["include", "maybe"]):
+        run_dir = tmp_path / f"run-{idx}"
+        run_dir.mkdir()
+        summary = [
+            {
+                "item_id": "1",
+                "item_text": "is the item relevant?",
+                "final_category": category,
+                "final_median": 7.0,
+                "final_agreement_inclusion": 0.8,
+                "final_agreement_exclusion": 0.0,
+            }
+        ]
+        (run_dir / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
+        run_dirs.append(run_dir)
+
+    results = evaluate_runs_against_human(run_dirs=run_dirs, round2_results_path=tmp_path / "r2")
+
+    assert len(parsed) == 1
+    assert [results[d]["summary"]["decision_matches"] for d in run_dirs] == [1, 0]
+    assert results[run_dirs[0]]["items"]["abs_median_error"].tolist() == [1.0]
@@ -1,4 +1,12 @@
+import threading
+import time
+
+import pytest
+
 from delphi_llms.delphi.engine import run_recursive_delphi, run_standard_delphi
+from delphi_llms.delphi.events import JsonlEventSink, load_checkpoint
+from delphi_llms.delphi.executors import InlineBackend
+from delphi_llms.delphi.stopping import StoppingPolicy
 
 
 def test_run_standard_delphi_stops_on_first_round_convergence() -> None:
@@ -53,7 +61,12 @@ def test_run_recursive_delphi_includes_clarification_fields() -> None:
         return f"q-{expert_id}"
 
     def fac(  # type: ignore[no-untyped-def]
-        *, item_id: str, item_text: str, round_number: int, expert_id: str, clarification_question: str
+        *,
+        item_id: str,
+        item_text: str,
+        round_number: int,
+        expert_id: str,
+        clarification_question: str,
     ) -> str:
         return f"a-{clarification_question}"
 
@@ -83,3 +96,125 @@ def test_run_recursive_delphi_includes_clarification_fields() -> None:
     assert responses
     assert all(r.get("clarification_question") for r in responses)
     assert all(r.get("facilitator_answer") for r in responses)
+
+
+def test_run_standard_delphi_overlaps_items_and_keeps_item_order() -> None:
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(4)]
+    expert_ids = ["e1", "e2", "e3"]
+    lock = threading.Lock()
+    active_items: set[str] = set()
+    max_active_items = 0
+
+    def fake_call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        nonlocal max_active_items
+        with lock:
+            active_items.add(item_id)
+            max_active_items = max(max_active_items, len(active_items))
+        time.sleep(0.01)
+        with lock:
+            active_items.discard(item_id)
+        # Item i0 disagrees on round 1 and converges on round 2; others converge immediately.
+        if item_id == "i0" and round_number == 1 and expert_id == "e1":
+            return {"rating": 2, "category": "exclude", "rationale": "no", "confidence": 0.6}
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    result = run_standard_delphi(
+        items=items,
+        expert_seeds=[11, 22, 33],
+        n_max=10,
+        call_expert=fake_call,
+        expert_ids=expert_ids,
+        max_in_flight=12,
+    )
+
+    assert max_active_items > 1
+    assert [r["item_id"] for r in result["item_results"]] == ["i0", "i1", "i2", "i3"]
+    assert [r["rounds_run"] for r in result["item_results"]] == [2, 1, 1, 1]
+    keys = [(e["item_id"], e["round"], e["type"], e.get("expert_id")) for e in result["event_log"]]
+    expected = []
+    for item in items:
+        rounds = 2 if item["item_id"] == "i0" else 1
+        for round_number in range(1, rounds + 1):
+            expected.extend(
+                (item["item_id"], round_number, "expert_response", e) for e in expert_ids
+            )
+            expected.append((item["item_id"], round_number, "round_summary", None))
+    assert keys == expected
+
+
+def test_run_standard_delphi_resumes_from_checkpoint(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(3)]
+    calls: list[tuple[str, int, str]] = []
+    fail_on = {("i2", 1, "e2")}
+
+    def fake_call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        if (item_id, round_number, expert_id) in fail_on:
+            raise RuntimeError("ollama down")
+        calls.append((item_id, round_number, expert_id))
+        if item_id == "i0" and round_number == 1 and expert_id == "e1":
+            return {"rating": 5, "category": "maybe", "rationale": "?", "confidence": 0.5}
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    kwargs = {
+        "items": items,
+        "expert_seeds": [1, 2],
+        "n_max": 4,
+        "call_expert": fake_call,
+        "expert_ids": ["e1", "e2"],
+        "backend": InlineBackend(),
+    }
+    events_path = tmp_path / "events.jsonl"
+    with pytest.raises(RuntimeError), JsonlEventSink(events_path) as sink:
+        run_standard_delphi(event_sink=sink, **kwargs)
+    with events_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"type": "expert_resp')
+
+    completed = load_checkpoint(events_path)
+    fail_on.clear()
+    calls.clear()
+    with JsonlEventSink(events_path, append=True) as sink:
+        resumed = run_standard_delphi(event_sink=sink, completed_events=completed, **kwargs)
+
+    assert calls == [("i2", 1, "e1"), ("i2", 1, "e2")]
+    expected = run_standard_delphi(**kwargs)
+    assert resumed["item_results"] == expected["item_results"]
+    assert resumed["event_log"] == []
+    events = load_checkpoint(events_path)
+    assert sorted(events, key=repr) == sorted(expected["event_log"], key=repr)
+
+
+def test_run_standard_delphi_early_continue_skips_calls_and_resumes() -> None:
+    items = [{"item_id": "i1", "item_text": "Item 1"}]
+    calls: list[tuple[int, str]] = []
+
+    def fake_call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        calls.append((round_number, expert_id))
+        if round_number == 1 and expert_id == "e2":
+            return {"rating": 2, "category": "exclude"}
+        return {"rating": 8, "category": "include"}
+
+    kwargs = {
+        "items": items,
+        "expert_seeds": [1, 2, 3],
+        "n_max": 3,
+        "expert_ids": ["e1", "e2", "e3"],
+        "max_in_flight": 2,
+        "backend": InlineBackend(),
+        "stopping": StoppingPolicy(early_continue=True),
+    }
+    result = run_standard_delphi(call_expert=fake_call, **kwargs)
+
+    # Two categories after e1 and e2 settle round 1, so e3 is never asked.
+    assert calls == [(1, "e1"), (1, "e2"), (2, "e1"), (2, "e2"), (2, "e3")]
+    first_summary = next(e for e in result["event_log"] if e["type"] == "round_summary")
+    assert first_summary["categories"] == ["include", "exclude"]
+    assert first_summary["reason"] == "continue"
+    assert result["item_results"][0]["rounds_run"] == 2
+
+    def unused_call(**kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("resumed run should not call experts")
+
+    resumed = run_standard_delphi(
+        call_expert=unused_call, completed_events=result["event_log"], **kwargs
+    )
+    assert resumed == result
@@ -0,0 +1,103 @@
+import json
+import sqlite3
+from pathlib import Path
+
+from delphi_llms.delphi.engine import run_standard_delphi
+from delphi_llms.delphi.events import (
+    FanoutEventSink,
+    JsonlEventSink,
+    MemoryEventSink,
+    SqliteEventSink,
+    completed_round_events,
+    read_events,
+    sort_events_file,
+)
+
+
+def _call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+    return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+
+def test_engine_streams_to_sinks_without_accumulating_event_log(tmp_path: Path) -> None:
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(3)]
+    memory = MemoryEventSink()
+    jsonl = JsonlEventSink(tmp_path / "events.jsonl", buffer_size=2, flush_interval=3600)
+    sqlite = SqliteEventSink(tmp_path / "events.sqlite", buffer_size=100, flush_interval=3600)
+
+    with FanoutEventSink(memory, jsonl, sqlite) as sink:
+        result = run_standard_delphi(
+            items=items, expert_seeds=[1, 2, 3], n_max=2, call_expert=_call, event_sink=sink
+        )
+
+    assert result["event_log"] == []
+    assert len(result["item_results"]) == 3
+    assert len(memory.events) == 3 * 4
+    assert read_events(tmp_path / "events.jsonl") == memory.events
+    conn = sqlite3.connect(tmp_path / "events.sqlite")
+    try:
+        assert conn.execute("select count(*) from run_events").fetchone()[0] == 12
+    finally:
+        conn.close()
+
+
+def test_jsonl_sink_buffers_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = JsonlEventSink(path, buffer_size=3, flush_interval=3600)
+    sink.emit({"type": "a"})
+    sink.emit({"type": "b"})
+    assert path.read_text(encoding="utf-8") == ""
+    sink.emit({"type": "c"})
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    sink.emit({"type": "d"})
+    sink.close()
+    assert [e["type"] for e in read_events(path)] == ["a", "b", "c", "d"]
+
+
+def test_completed_round_events_drops_rounds_without_summary(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    events = [
+        {"type": "expert_response", "item_id": "i1", "round": 1},
+        {"type": "round_summary", "item_id": "i1", "round": 1},
+        {"type": "expert_response", "item_id": "i1", "round": 2},
+    ]
+    path.write_text(
+        "".join(json.dumps(e) + "\n" for e in events) + '{"type": "exp', encoding="utf-8"
+    )
+
+    assert completed_round_events(read_events(path)) == events[:2]
+
+
+def test_sqlite_sink_commits_from_writer_thread_while_open(tmp_path: Path) -> None:
+    path = tmp_path / "events.sqlite"
+    sink = SqliteEventSink(path, buffer_size=1000, flush_interval=3600)
+    try:
+        for round_number in (1, 2):
+            sink.emit({"type": "round_summary", "item_id": "i1", "round": round_number})
+        sink.write_item_results([{"item_id": "i1", "final_category": "include"}])
+        sink.flush()
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("select count(*) from run_events").fetchone()[0] == 2
+            assert conn.execute("select item_id, final_category from run_summary").fetchall() == [
+                ("i1", "include")
+            ]
+    finally:
+        sink.close()
+    assert not sink._thread.is_alive()
+
+
+def test_sort_events_file_restores_item_and_round_order(tmp_path: Path) -> None:
+    def block(item_id: str, round_number: int) -> list[dict]:
+        responses = [
+            {"type": "expert_response", "item_id": item_id, "round": round_number, "expert_id": e}
+            for e in ("expert_2", "expert_1")
+        ]
+        return [*responses, {"type": "round_summary", "item_id": item_id, "round": round_number}]
+
+    completion_order = [*block("b", 1), *block("a", 1), *block("b", 2), *block("a", 2)]
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps(e) + "\n" for e in completion_order), encoding="utf-8")
+
+    sort_events_file(path, ["a", "b"])
+
+    assert read_events(path) == [*block("a", 1), *block("a", 2), *block("b", 1), *block("b", 2)]
+    assert not path.with_suffix(".jsonl.tmp").exists()
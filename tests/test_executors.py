@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+from delphi_llms.delphi.engine import run_standard_delphi
+from delphi_llms.delphi.executors import (
+    InlineBackend,
+    ProcessBackend,
+    ThreadBackend,
+    create_backend,
+)
+
+
+def test_inline_backend_runs_calls_in_submit_order_on_caller_thread() -> None:
+    items = [{"item_id": f"i{idx}", "item_text": f"Item {idx}"} for idx in range(3)]
+    calls: list[tuple[str, str]] = []
+    threads: set[int] = set()
+
+    def fake_call(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        calls.append((item_id, expert_id))
+        threads.add(threading.get_ident())
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.8}
+
+    with InlineBackend() as backend:
+        result = run_standard_delphi(
+            items=items,
+            expert_seeds=[1, 2],
+            n_max=3,
+            call_expert=fake_call,
+            expert_ids=["e1", "e2"],
+            backend=backend,
+        )
+
+    assert threads == {threading.get_ident()}
+    assert calls == [(f"i{idx}", e) for idx in range(3) for e in ("e1", "e2")]
+    assert len(result["item_results"]) == 3
+
+
+def test_inline_backend_surfaces_exceptions_through_future() -> None:
+    def boom() -> None:
+        raise RuntimeError("boom")
+
+    future = InlineBackend().submit(boom)
+    with pytest.raises(RuntimeError):
+        future.result()
+
+
+def test_pool_backends_run_submitted_calls() -> None:
+    with ThreadBackend(max_workers=2) as threads, ProcessBackend(max_workers=1) as processes:
+        assert threads.submit(pow, 2, 5).result() == 32
+        assert processes.submit(pow, 3, 2).result() == 9
+
+
+def test_create_backend_rejects_unknown_kind() -> None:
+    assert isinstance(create_backend("inline", max_workers=4), InlineBackend)
+    with pytest.raises(ValueError):
+        create_backend("gpu", max_workers=4)
@@ -2,7 +2,11 @@ import json
 import sqlite3
 from pathlib import Path
 
-from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite
+import pytest
+
+from delphi_llms.bench import synthetic_run_dir
+from delphi_llms.eval import export_sqlite
+from delphi_llms.eval.export_sqlite import export_latest_run_to_sqlite, export_runs_to_warehouse
 
 
 def test_export_latest_run_to_sqlite(tmp_path: Path) -> None:
@@ -53,8 +57,86 @@ def test_export_latest_run_to_sqlite(tmp_path: Path) -> None:
 
     conn = sqlite3.connect(sqlite_path)
     try:
-        tables = {row[0] for row in conn.execute("select name from sqlite_master where type='table'")}
+        tables = {
+            row[0] for row in conn.execute("select name from sqlite_master where type='table'")
+        }
         assert "run_events" in tables
         assert "run_summary" in tables
     finally:
         conn.close()
+
+
+def test_export_loads_events_in_chunks_and_indexes_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(export_sqlite, "EXPORT_CHUNK_SIZE", 7)
+    run_dir = synthetic_run_dir(tmp_path / "runs", events=60, experts=5)
+    lines = (run_dir / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    sqlite_path = tmp_path / "results.sqlite"
+
+    for _ in range(2):
+        export_latest_run_to_sqlite(base_run_dir=tmp_path / "runs", sqlite_path=sqlite_path)
+
+    conn = sqlite3.connect(sqlite_path)
+    try:
+        assert conn.execute("select count(*) from run_events").fetchone()[0] == len(lines)
+        indexes = {
+            row[0] for row in conn.execute("select name from sqlite_master where type='index'")
+        }
+        assert {"run_events_item_round", "run_events_type", "run_events_expert"} <= indexes
+        assert conn.execute("pragma journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_warehouse_appends_new_runs_and_skips_ingested_ones(tmp_path: Path) -> None:
+    base = tmp_path / "runs"
+    base.mkdir()
+    first = synthetic_run_dir(tmp_path / "a", events=12, experts=2).rename(base / "run-1")
+    (first / "config.json").write_text(json.dumps({"model": "m1"}), encoding="utf-8")
+    warehouse = tmp_path / "warehouse.sqlite"
+
+    assert export_runs_to_warehouse(base_run_dir=base, sqlite_path=warehouse)["ingested"] == [
+        "run-1"
+    ]
+    synthetic_run_dir(tmp_path / "b", events=12, experts=2).rename(base / "run-2")
+    (base / "run-3").mkdir()
+    result = export_runs_to_warehouse(base_run_dir=base, sqlite_path=warehouse)
+    assert result == {"ingested": ["run-2"], "skipped": ["run-1"], "incomplete": ["run-3"]}
+
+    (first / "evaluation_items.csv").write_text("item_id,decision_match\n0,1\n", encoding="utf-8")
+    result = export_runs_to_warehouse(base_run_dir=base, sqlite_path=warehouse)
+    assert result["ingested"] == ["run-1"]
+
+    conn = sqlite3.connect(warehouse)
+    try:
+        counts = dict(conn.execute("select run_id, count(*) from run_events group by run_id"))
+        assert counts == {"run-1": 12, "run-2": 12}
+        config_json = conn.execute("select config_json from runs where run_id = 'run-1'")
+        assert json.loads(config_json.fetchone()[0]) == {"model": "m1"}
+        assert conn.execute("select run_id, decision_match from eval_items").fetchall() == [
+            ("run-1", 1)
+        ]
+    finally:
+        conn.close()
+
+
+def test_warehouse_keeps_runs_of_different_sweeps_apart(tmp_path: Path) -> None:
+    base = tmp_path / "runs"
+    for index, sweep in enumerate(["sweep-20260101T000000Z", "sweep-20260102T000000Z"]):
+        (base / sweep).mkdir(parents=True)
+        synthetic_run_dir(tmp_path / str(index), events=6 * (index + 1), experts=2).rename(
+            base / sweep / "run-001-qwen3-4b-standard-n10-s1"
+        )
+
+    result = export_runs_to_warehouse(base_run_dir=base, sqlite_path=tmp_path / "w.sqlite")
+    assert result["ingested"] == [
+        "sweep-20260101T000000Z/run-001-qwen3-4b-standard-n10-s1",
+        "sweep-20260102T000000Z/run-001-qwen3-4b-standard-n10-s1",
+    ]
+    conn = sqlite3.connect(tmp_path / "w.sqlite")
+    try:
+        counts = conn.execute("select run_id, count(*) from run_events group by run_id")
+        assert [count for _, count in counts] == [6, 12]
+    finally:
+        conn.close()
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from functools import partial
+
+import httpx
+import pytest
+
+from delphi_llms.agents.hosts import NoHealthyHostError, OllamaHost, OllamaHostPool
+from delphi_llms.agents.retry import RetryPolicy, call_with_retry
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://ollama/api/generate")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+def test_pool_routes_to_least_outstanding_host_within_caps() -> None:
+    pool = OllamaHostPool(
+        [OllamaHost(url="a", max_concurrency=1), OllamaHost(url="b", max_concurrency=2)]
+    )
+    first = pool.acquire()
+    second = pool.acquire()
+    third = pool.acquire()
+    assert sorted([first.url, second.url, third.url]) == ["a", "b", "b"]
+
+    acquired: list[str] = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire().url))
+    waiter.start()
+    time.sleep(0.05)
+    assert acquired == []
+    pool.release(first)
+    waiter.join(timeout=2)
+    assert acquired == ["a"]
+
+
+def test_pool_fails_over_on_server_and_transport_errors() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a"), OllamaHost(url="b"), OllamaHost(url="c")])
+    seen: list[str] = []
+
+    def call(*, ollama_host: str, item_id: str) -> str:
+        seen.append(ollama_host)
+        if ollama_host == "a":
+            raise _status_error(503)
+        if ollama_host == "b":
+            raise httpx.ConnectError("refused")
+        return f"{item_id}@{ollama_host}"
+
+    assert pool.call(call, item_id="i1") == "i1@c"
+    assert sorted(seen) == ["a", "b", "c"]
+    assert all(host.outstanding == 0 for host in pool.hosts)
+    assert pool.hosts[0].failures == 1
+    assert pool.hosts[0].down_until > time.monotonic()
+
+
+def test_pool_does_not_fail_over_on_client_errors() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a"), OllamaHost(url="b")])
+    calls: list[str] = []
+
+    def call(*, ollama_host: str) -> str:
+        calls.append(ollama_host)
+        raise _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        pool.call(call)
+    assert len(calls) == 1
+    assert all(host.down_until == 0.0 for host in pool.hosts)
+
+
+def test_pool_raises_last_error_when_every_host_fails() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a"), OllamaHost(url="b")])
+
+    def call(*, ollama_host: str) -> str:
+        raise httpx.ReadTimeout(ollama_host)
+
+    with pytest.raises(httpx.ReadTimeout):
+        pool.call(call)
+    with pytest.raises(NoHealthyHostError):
+        pool.acquire({"a", "b"})
+
+
+def test_pool_brings_host_back_after_cooldown() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a"), OllamaHost(url="b")], cooldown_seconds=0.05)
+
+    async def call(*, ollama_host: str) -> str:
+        return ollama_host
+
+    pool.mark_down("a")
+    assert asyncio.run(pool.call_async(call)) == "b"
+    time.sleep(0.06)
+    held = pool.acquire({"a"})
+    assert asyncio.run(pool.call_async(call)) == "a"
+    pool.release(held)
+    assert pool.hosts[0].failures == 0
+
+
+def test_pool_never_benches_its_last_healthy_host() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a")], cooldown_seconds=30.0)
+    attempts: list[float] = []
+
+    def call(*, ollama_host: str, model: str) -> str:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise _status_error(500)
+        return ollama_host
+
+    # The 500 goes back to the retry policy instead of parking every call for 30 s.
+    started = time.monotonic()
+    routed = partial(pool.call, call)
+    result = call_with_retry(routed, policy=RetryPolicy(base_delay=0.0), model="m")
+    assert result == "a"
+    assert len(attempts) == 2
+    assert time.monotonic() - started < 1.0
+    assert pool.hosts[0].down_until == 0.0
+
+
+def test_pool_does_not_wait_out_a_cooldown_after_a_failover() -> None:
+    pool = OllamaHostPool([OllamaHost(url="a"), OllamaHost(url="b")], cooldown_seconds=30.0)
+    pool.mark_down("a")
+    attempts: list[str] = []
+
+    def call(*, ollama_host: str, model: str) -> str:
+        attempts.append(ollama_host)
+        if len(attempts) == 1:
+            raise _status_error(500)
+        return ollama_host
+
+    # b fails while a is benched: the 500 goes back to the retry policy right away.
+    started = time.monotonic()
+    with pytest.raises(httpx.HTTPStatusError):
+        pool.call(call, model="m")
+    assert time.monotonic() - started < 1.0
+    result = call_with_retry(
+        partial(pool.call, call), policy=RetryPolicy(base_delay=0.0), model="m"
+    )
+    assert result == "b"
+    assert attempts == ["b", "b"]
@@ -0,0 +1,92 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from delphi_llms.agents import ollama
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
+from delphi_llms.delphi.engine import run_standard_delphi
+from delphi_llms.delphi.events import SqliteEventSink
+from delphi_llms.instrumentation import CallRecorder, percentile, record_call, summarize_calls
+
+
+def test_call_recorder_captures_ollama_timings_from_generate() -> None:
+    with (
+        MockOllamaServer(MockProfile(latency_ms=5.0)) as server,
+        CallRecorder(submitted_at=0.0) as recorder,
+    ):
+        ollama.call_ollama_expert(
+            model="qwen3-4b",
+            ollama_host=server.url,
+            item_id="1",
+            item_text="Item",
+            round_number=1,
+            expert_id="expert_1",
+            seed=11,
+        )
+    record_call({"kind": "ignored"})
+
+    metrics = recorder.metrics()
+    assert metrics is not None
+    [call] = metrics["calls"]
+    assert call["kind"] == "expert"
+    assert call["model"] == "qwen3-4b"
+    assert call["cached"] is False
+    assert (call["seed"], call["attempt"]) == (11, 1)
+    assert call["latency_ms"] >= 5.0
+    assert call["prompt_eval_count"] > 0 and call["eval_count"] > 0
+    assert call["total_ms"] >= 5.0
+    assert metrics["queue_wait_ms"] > 0
+
+
+def test_engine_attaches_call_metrics_to_expert_events(tmp_path: Path) -> None:
+    def call_expert(*, item_id: str, item_text: str, round_number: int, expert_id: str, seed: int):  # type: ignore[no-untyped-def]
+        record_call(
+            {
+                "kind": "expert",
+                "model": "m",
+                "latency_ms": float(seed),
+                "cached": False,
+                "prompt_eval_count": 100,
+                "prompt_eval_ms": 50.0,
+                "eval_count": 20,
+                "eval_ms": 400.0,
+            }
+        )
+        return {"rating": 8, "category": "include", "rationale": "ok", "confidence": 0.9}
+
+    sink = SqliteEventSink(tmp_path / "events.sqlite")
+    with sink:
+        run_standard_delphi(
+            items=[{"item_id": "1", "item_text": "Q1"}],
+            expert_seeds=[10, 20, 30],
+            n_max=2,
+            call_expert=call_expert,
+            event_sink=sink,
+        )
+    with sqlite3.connect(tmp_path / "events.sqlite") as conn:
+        rows = conn.execute(
+            "select expert_id, latency_ms, queue_wait_ms is not null from run_calls "
+            "order by expert_id"
+        ).fetchall()
+    assert rows == [("expert_1", 10.0, 1), ("expert_2", 20.0, 1), ("expert_3", 30.0, 1)]
+
+    result = run_standard_delphi(
+        items=[{"item_id": "1", "item_text": "Q1"}],
+        expert_seeds=[10, 20, 30],
+        n_max=2,
+        call_expert=call_expert,
+    )
+    report = summarize_calls(result["event_log"], wall_time_seconds=1.5)
+    assert report["wall_time_seconds"] == 1.5
+    assert report["overall"]["calls"] == 3
+    assert report["overall"]["latency_ms"]["p50"] == 20.0
+    assert report["by_model"]["m"]["tokens_per_second"] == pytest.approx(50.0)
+    assert report["by_model"]["m"]["prompt_tokens_per_second"] == pytest.approx(2000.0)
+    assert report["by_round"]["1"]["queue_wait_ms"]["p50"] is not None
+
+
+def test_percentile_interpolates() -> None:
+    assert percentile([], 50) is None
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
@@ -0,0 +1,127 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from delphi_llms.data.loader import parse_dataset_sheet
+from delphi_llms.eval.compare import ConsensusThresholds
+from delphi_llms.eval.leaderboard import evaluate_all_runs
+
+SHEET = pd.DataFrame(
+    [
+        ["Experts", "Domain", None],
+        [None, "Q1", "Q2"],
+        ["Anonymised expert", 8, 2],
+        ["Min", 8, 2],
+        ["Max", 8, 2],
+        ["Median", 8, 2],
+        ["AGREEMENT_INCLUSION", 1.0, 0.0],
+        ["AGREEMENT_EXCLUSION", 0.0, 1.0],
+    ]
+)
+
+
+def _write_run(base: Path, name: str, categories: list[str], *, model: str) -> Path:
+    run_dir = base / name
+    run_dir.mkdir(parents=True)
+    summary = [
+        {
+            "item_id": str(idx),
+            "item_text": f"Q{idx}",
+            "final_category": category,
+            "stop_reason": "converged",
+            "rounds_run": idx,
+            "final_median": 8.0 if category == "include" else 2.0,
+            "final_agreement_inclusion": 1.0,
+            "final_agreement_exclusion": 0.0,
+        }
+        for idx, category in enumerate(categories, start=1)
+    ]
+    (run_dir / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
+    (run_dir / "config.json").write_text(json.dumps({"model": model}), encoding="utf-8")
+    report = {"wall_time_seconds": 3.5, "overall": {"prompt_tokens": 100, "eval_tokens": 20}}
+    (run_dir / "run_report.json").write_text(json.dumps(report), encoding="utf-8")
+    return run_dir
+
+
+def test_evaluate_all_runs_ranks_runs_and_reuses_current_evaluations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parsed: list[int] = []
+
+    def parse(path: Path, round_number: int):  # type: ignore[no-untyped-def]
+        parsed.append(round_number)
+        return parse_dataset_sheet(SHEET, round_number=round_number)
+
+    monkeypatch.setattr("delphi_llms.eval.compare.parse_round_results_xlsx", parse)
+    _write_run(tmp_path / "a", "run-1", ["maybe", "exclude"], model="small")
+    best = _write_run(tmp_path / "b", "run-2", ["include", "exclude"], model="large")
+    (tmp_path / "a" / "run-3").mkdir()
+
+    kwargs = {
+        "bases": [tmp_path / "a", tmp_path / "b"],
+        "round2_results_path": tmp_path / "r2.xlsx",
+        "max_workers": 2,
+    }
+    first = evaluate_all_runs(**kwargs)
+    board = first["leaderboard"]
+    assert sorted(first["evaluated"]) == ["run-1", "run-2"]
+    assert board["run_id"].tolist() == ["run-2", "run-1"]
+    assert board["rank"].tolist() == [1, 2]
+    assert board["decision_match_ratio"].tolist() == [1.0, 0.5]
+    top = board.iloc[0]
+    assert [top["model"], top["mean_rounds_run"], top["wall_time_seconds"]] == ["large", 1.5, 3.5]
+    assert top["eval_tokens"] == 20
+    assert (best / "evaluation_items.csv").exists()
+
+    assert evaluate_all_runs(**kwargs)["reused"] == ["run-1", "run-2"]
+    later = (best / "evaluation_summary.json").stat().st_mtime_ns + 10**9
+    os.utime(best / "summary.json", ns=(later, later))
+    again = evaluate_all_runs(**kwargs)
+    assert again["evaluated"] == ["run-2"]
+    pd.testing.assert_frame_equal(again["leaderboard"], board)
+    assert parsed == [2, 2]
+
+
+def test_evaluate_all_runs_rescores_runs_when_thresholds_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "delphi_llms.eval.compare.parse_round_results_xlsx",
+        lambda path, round_number: parse_dataset_sheet(SHEET, round_number=round_number),
+    )
+    run_dir = _write_run(tmp_path, "run-1", ["include", "exclude"], model="m")
+    kwargs = {"bases": [tmp_path], "round2_results_path": tmp_path / "r2.xlsx", "backend": "thread"}
+
+    assert evaluate_all_runs(**kwargs)["evaluated"] == ["run-1"]
+    assert evaluate_all_runs(**kwargs)["reused"] == ["run-1"]
+    strict = ConsensusThresholds(include=1.01, exclude=1.01)
+    rescored = evaluate_all_runs(**kwargs, thresholds=strict)
+    assert rescored["evaluated"] == ["run-1"]
+    assert rescored["leaderboard"]["decision_match_ratio"].tolist() == [0.0]
+    summary = json.loads((run_dir / "evaluation_summary.json").read_text(encoding="utf-8"))
+    assert summary["thresholds"] == {"include": 1.01, "exclude": 1.01}
+    assert evaluate_all_runs(**kwargs, thresholds=strict)["reused"] == ["run-1"]
+
+
+def test_evaluate_all_runs_finds_sweep_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "delphi_llms.eval.compare.parse_round_results_xlsx",
+        lambda path, round_number: parse_dataset_sheet(SHEET, round_number=round_number),
+    )
+    _write_run(tmp_path, "run-1", ["include", "exclude"], model="m")
+    _write_run(tmp_path / "sweep-20260101T000000Z", "run-001-m", ["maybe", "exclude"], model="m")
+    _write_run(tmp_path / "sweep-20260102T000000Z", "run-001-m", ["maybe", "maybe"], model="m")
+
+    result = evaluate_all_runs(
+        bases=[tmp_path], round2_results_path=tmp_path / "r2.xlsx", backend="thread"
+    )
+    assert result["leaderboard"]["run_id"].tolist() == [
+        "run-1",
+        "sweep-20260101T000000Z/run-001-m",
+        "sweep-20260102T000000Z/run-001-m",
+    ]
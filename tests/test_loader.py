@@ -1,8 +1,14 @@
 import math
+from pathlib import Path
 
 import pandas as pd
 
-from delphi_llms.data.loader import parse_dataset_sheet
+from delphi_llms.data.loader import (
+    load_round_results,
+    parse_dataset_sheet,
+    parse_round_results_xlsx,
+    read_dataset_sheet,
+)
 
 
 def test_parse_dataset_sheet_builds_ratings_and_summary() -> None:
@@ -57,3 +63,124 @@ def test_parse_dataset_sheet_requires_expected_stat_rows() -> None:
         assert False, "expected ValueError"
     except ValueError as exc:
         assert "Missing required summary row" in str(exc)
+
+
+def test_parse_dataset_sheet_skips_missing_cells_in_expert_major_order() -> None:
+    df = pd.DataFrame(
+        [
+            ["Experts", "Safety", math.nan, math.nan],
+            [math.nan, "Q1", math.nan, "Q3"],
+            ["Anonymised expert", "9", 1, math.nan],
+            ["Anonymised expert", "n/a", 2, 7.9],
+            ["Anonymised expert", 4, 3, 6],
+            ["Min", 4, 1, "6"],
+            ["Max", 9, 3, 7.9],
+            ["Median", 4, 2, math.nan],
+            ["AGREEMENT_INCLUSION", 0.5, 0.0, 0.5],
+            ["AGREEMENT_EXCLUSION", 0.0, 1.0, 0.0],
+        ]
+    )
+
+    ratings_long, item_summary = parse_dataset_sheet(df, round_number=2)
+
+    cells = ratings_long[["expert_seq", "item_col", "rating"]].to_records(index=False).tolist()
+    assert cells == [(1, 1, 9), (2, 3, 7), (3, 1, 4), (3, 3, 6)]
+    assert ratings_long["row_idx"].tolist() == [2, 3, 4, 4]
+    assert ratings_long["item_domain"].tolist() == ["Safety"] * 4
+    assert item_summary["item_col"].tolist() == [1, 3]
+    assert item_summary["min"].tolist() == [4, 6]
+    assert item_summary["median"].isna().tolist() == [False, True]
+    assert item_summary["comments_summary"].tolist() == [None, None]
+
+
+def test_load_round_results_reuses_cached_frames_until_workbook_changes(tmp_path: Path) -> None:
+    workbook = tmp_path / "round1.xlsx"
+    workbook.write_bytes(b"v1")
+    sheet = pd.DataFrame(
+        [
+            ["Experts", "Safety"],
+            [math.nan, "Q1"],
+            ["Anonymised expert", 9],
+            ["Min", 9],
+            ["Max", 9],
+            ["Median", 9],
+            ["AGREEMENT_INCLUSION", 1.0],
+            ["AGREEMENT_EXCLUSION", 0.0],
+        ]
+    )
+    parsed: list[int] = []
+
+    def parse(path: Path, round_number: int):  # type: ignore[no-untyped-def]
+        parsed.append(round_number)
+        return parse_dataset_sheet(sheet, round_number=round_number)
+
+    cache_dir = tmp_path / "cache"
+    first = load_round_results(workbook, round_number=1, cache_dir=cache_dir, parse=parse)
+    second = load_round_results(workbook, round_number=1, cache_dir=cache_dir, parse=parse)
+    assert parsed == [1]
+    for expected, cached in zip(first, second):
+        pd.testing.assert_frame_equal(expected, cached)
+
+    load_round_results(workbook, round_number=2, cache_dir=cache_dir, parse=parse)
+    workbook.write_bytes(b"v2, edited")
+    load_round_results(workbook, round_number=1, cache_dir=cache_dir, parse=parse)
+    assert parsed == [1, 2, 1]
+    assert len(list(cache_dir.glob("round1-*-round1-*.parquet"))) == 2
+
+
+def test_streamed_dataset_sheet_matches_full_read(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        [
+            ["Experts", "Safety", math.nan, "Recognition"],
+            [math.nan, "Q1", "  ", "Q3"],
+            ["Notes", "ignored", math.nan, math.nan],
+            ["Anonymised expert", 9, 8.0, "n/a"],
+            ["Anonymised expert", "7", 6, 5.5],
+            ["Min", 7, 6, 5],
+            ["Max", 9, 8, 7],
+            ["Median", 8, 7, 6],
+            ["AGREEMENT_INCLUSION", 1.0, 0.5, 0.0],
+            ["AGREEMENT_EXCLUSION", 0.0, 0.0, 0.5],
+            [math.nan, math.nan, math.nan, math.nan],
+            ["Comments summary", "c1", math.nan, "NA"],
+            *[["Appendix", idx, idx, idx] for idx in range(50)],
+        ]
+    )
+    workbook = tmp_path / "round.xlsx"
+    with pd.ExcelWriter(workbook, engine="openpyxl") as writer:
+        df.to_excel(writer, sheet_name="Dataset", index=False, header=False)
+
+    streamed = read_dataset_sheet(workbook)
+    assert streamed.index.tolist() == [0, 1, 3, 4, 5, 6, 7, 8, 9, 11]
+
+    full_sheet = pd.read_excel(workbook, sheet_name="Dataset", header=None)
+    expected = parse_dataset_sheet(full_sheet, round_number=1)
+    for frame, other in zip(expected, parse_round_results_xlsx(workbook, round_number=1)):
+        pd.testing.assert_frame_equal(frame, other)
+
+
+def test_streamed_dataset_sheet_stops_after_summary_rows_without_comments(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        [
+            ["Experts", "Safety", "Recognition"],
+            [math.nan, "Q1", "Q2"],
+            ["Anonymised expert", 9, 2],
+            ["Min", 9, 2],
+            ["Max", 9, 2],
+            ["Median", 9, 2],
+            ["AGREEMENT_INCLUSION", 1.0, 0.0],
+            ["AGREEMENT_EXCLUSION", 0.0, 1.0],
+            [math.nan, math.nan, math.nan],
+            *[["Appendix", idx, idx] for idx in range(50)],
+            # Past the summary block, so it must never be read.
+            ["Comments summary", "late", "late"],
+        ]
+    )
+    workbook = tmp_path / "round.xlsx"
+    with pd.ExcelWriter(workbook, engine="openpyxl") as writer:
+        df.to_excel(writer, sheet_name="Dataset", index=False, header=False)
+
+    streamed = read_dataset_sheet(workbook)
+    assert streamed.index.tolist() == [0, 1, 2, 3, 4, 5, 6, 7]
+    _, summary = parse_dataset_sheet(streamed, round_number=1)
+    assert summary["comments_summary"].isna().all()
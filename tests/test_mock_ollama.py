@@ -0,0 +1,110 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from delphi_llms.agents import ollama
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
+from delphi_llms.cli import app
+
+
+def _expert_kwargs(server: MockOllamaServer, seed: int) -> dict:
+    return {
+        "model": "qwen3-4b",
+        "ollama_host": server.url,
+        "item_id": "1",
+        "item_text": "Item",
+        "round_number": 1,
+        "expert_id": "expert_1",
+        "seed": seed,
+    }
+
+
+def test_mock_server_serves_tags_and_seeded_answers() -> None:
+    profile = MockProfile(latency_ms=0.0, seed=3)
+    with MockOllamaServer(profile) as first, MockOllamaServer(profile) as second:
+        ollama.ensure_model_available(ollama_host=first.url, model="qwen3-4b")
+        with pytest.raises(ValueError):
+            ollama.ensure_model_available(ollama_host=first.url, model="llama3")
+
+        answer = ollama.call_ollama_expert(**_expert_kwargs(first, 11))
+        assert answer == ollama.call_ollama_expert(**_expert_kwargs(second, 11))
+        assert 1 <= answer["rating"] <= 9
+        assert answer["category"] in {"include", "maybe", "exclude"}
+        assert first.requests == 1
+
+
+def test_mock_server_injects_errors_and_malformed_output() -> None:
+    with (
+        MockOllamaServer(MockProfile(latency_ms=0.0, error_rate=1.0)) as server,
+        pytest.raises(httpx.HTTPStatusError),
+    ):
+        ollama.call_ollama_expert(**_expert_kwargs(server, 11))
+    with (
+        MockOllamaServer(MockProfile(latency_ms=0.0, malformed_rate=1.0)) as server,
+        pytest.raises(ollama.InvalidGenerationError),
+    ):
+        ollama.call_ollama_expert(**_expert_kwargs(server, 11))
+
+
+def test_mock_run_drives_full_experiment(tmp_path: Path) -> None:
+    config = tmp_path / "experiment.yaml"
+    config.write_text(
+        "\n".join(
+            [
+                "model: qwen3-4b",
+                "n_max: 3",
+                "experts:",
+                "  seeds: [11, 22, 33]",
+                "ollama:",
+                "  host_cooldown_seconds: 0.01",
+                "retry:",
+                "  base_delay_seconds: 0",
+                "  max_attempts: 10",
+                "mock:",
+                "  latency: uniform",
+                "  latency_ms: 2",
+                "  jitter_ms: 1",
+                "  error_rate: 0.2",
+                "outputs:",
+                f"  run_dir: {tmp_path / 'runs'}",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(
+        app, ["mock", "run", "--config", str(config), "--items", "4", "--hosts", "2"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "mock requests:" in result.stdout
+    run_dir = next((tmp_path / "runs").iterdir())
+    summary = json.loads((run_dir / "summary.json").read_text(encoding="utf-8"))
+    assert [row["item_id"] for row in summary] == ["1", "2", "3", "4"]
+    report = json.loads((run_dir / "run_report.json").read_text(encoding="utf-8"))
+    assert report["overall"]["calls"] >= 4 * 3
+    assert report["by_model"]["qwen3-4b"]["tokens_per_second"] > 0
+
+
+def test_mock_server_accepts_a_burst_of_connections_without_stalling() -> None:
+    import http.client
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    def timed_get(address: tuple[str, int]) -> float:
+        started = time.perf_counter()
+        conn = http.client.HTTPConnection(*address, timeout=10)
+        conn.request("GET", "/api/tags")
+        assert conn.getresponse().status == 200
+        conn.close()
+        return time.perf_counter() - started
+
+    with MockOllamaServer(MockProfile(latency_ms=0.0)) as server:
+        url = httpx.URL(server.url)
+        address = (url.host, url.port)
+        with ThreadPoolExecutor(max_workers=64) as pool:
+            latencies = list(pool.map(timed_get, [address] * 256))
+    # An overflowing listen backlog shows up as SYN retransmits of a second or more.
+    assert max(latencies) < 0.9
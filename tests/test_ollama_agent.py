@@ -7,7 +7,7 @@ def test_ensure_model_available_accepts_exact_match(monkeypatch) -> None:  # typ
     monkeypatch.setattr(
         ollama,
         "list_ollama_models",
-        lambda *, ollama_host: ["qwen3-4b", "llama3.2:latest"],
+        lambda *, ollama_host, client=None: ["qwen3-4b", "llama3.2:latest"],
     )
     ollama.ensure_model_available(ollama_host="http://ollama:11434", model="qwen3-4b")
 
@@ -16,8 +16,71 @@ def test_ensure_model_available_raises_for_missing_model(monkeypatch) -> None:
     monkeypatch.setattr(
         ollama,
         "list_ollama_models",
-        lambda *, ollama_host: ["llama3.2:latest"],
+        lambda *, ollama_host, client=None: ["llama3.2:latest"],
     )
     with pytest.raises(ValueError) as exc:
         ollama.ensure_model_available(ollama_host="http://ollama:11434", model="qwen3-4b")
     assert "Model 'qwen3-4b' not found" in str(exc.value)
+
+
+def test_call_ollama_expert_async_uses_given_client() -> None:
+    import asyncio
+    import json
+
+    import httpx
+
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        answer = {"rating": 7, "category": "include", "rationale": "ok", "confidence": 0.9}
+        return httpx.Response(200, json={"response": json.dumps(answer)})
+
+    async def run() -> dict:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await ollama.call_ollama_expert_async(
+                model="qwen3-4b",
+                ollama_host="http://ollama:11434/",
+                item_id="i1",
+                item_text="Item 1",
+                round_number=1,
+                expert_id="e1",
+                seed=11,
+                client=client,
+            )
+
+    result = asyncio.run(run())
+    assert result == {"rating": 7, "category": "include", "rationale": "ok", "confidence": 0.9}
+    assert seen[0]["options"]["seed"] == 11
+
+
+def test_sync_calls_reuse_given_client() -> None:
+    import json
+
+    import httpx
+
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "qwen3-4b:latest"}]})
+        return httpx.Response(200, json={"response": json.dumps({"facilitator_answer": " ok "})})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        ollama.ensure_model_available(
+            ollama_host="http://ollama:11434", model="qwen3-4b", client=client
+        )
+        answer = ollama.call_ollama_facilitator(
+            model="qwen3-4b",
+            ollama_host="http://ollama:11434",
+            item_id="i1",
+            item_text="Item 1",
+            round_number=1,
+            expert_id="e1",
+            clarification_question="q?",
+            client=client,
+        )
+
+    assert answer == "ok"
+    assert paths == ["/api/tags", "/api/generate"]
@@ -0,0 +1,63 @@
+import pytest
+
+from delphi_llms.agents import ollama
+from delphi_llms.agents.prompts import DEFAULT_PROMPTS, PROMPT_FIELDS, load_prompt_templates
+
+
+def test_expert_prompts_share_prefix_up_to_round_and_expert() -> None:
+    item = "A long item text " * 50
+    payloads = [
+        ollama._expert_payload(
+            model="qwen3-4b",
+            item_id="7",
+            item_text=item,
+            round_number=round_number,
+            expert_id=expert_id,
+            seed=11,
+        )
+        for round_number, expert_id in [(1, "expert_1"), (1, "expert_2"), (2, "expert_1")]
+    ]
+    shared = DEFAULT_PROMPTS["expert"].prefix + f"Item ID: 7. Item: {item}. Round: "
+    assert all(payload["prompt"].startswith(shared) for payload in payloads)
+    assert payloads[0]["prompt"].endswith("Round: 1. Expert: expert_1.")
+    assert "keep_alive" not in payloads[0]
+    assert "num_ctx" not in payloads[0]["options"]
+
+
+def test_generation_settings_add_keep_alive_and_num_ctx() -> None:
+    settings = ollama.GenerationSettings(
+        prompts=load_prompt_templates({"facilitator": {"suffix": "Q: {clarification_question}"}}),
+        keep_alive="30m",
+        num_ctx=8192,
+    )
+    payload = ollama._facilitator_payload(
+        model="qwen3-4b",
+        item_id="7",
+        item_text="Item",
+        round_number=1,
+        expert_id="expert_1",
+        clarification_question="Why?",
+        settings=settings,
+    )
+    assert payload["keep_alive"] == "30m"
+    assert payload["options"] == {"temperature": 0.1, "num_ctx": 8192}
+    assert payload["prompt"] == DEFAULT_PROMPTS["facilitator"].prefix + "Q: Why?"
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"judge": {"suffix": ""}}, "Unknown prompt template"),
+        ({"expert": {"suffix": "{facilitator_answer}"}}, "unknown field"),
+    ],
+)
+def test_load_prompt_templates_rejects_invalid_overrides(overrides: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        load_prompt_templates(overrides)
+
+
+def test_prompt_prefix_is_literal_text() -> None:
+    prefix = 'Return only JSON like {"rating": 7}.\n'
+    templates = load_prompt_templates({"expert": {"prefix": prefix}})
+    fields = {name: "x" for name in PROMPT_FIELDS["expert"]}
+    assert templates["expert"].render(**fields).startswith(prefix)
@@ -0,0 +1,123 @@
+import json
+import pickle
+from pathlib import Path
+
+import httpx
+import pytest
+
+from delphi_llms.agents import ollama
+from delphi_llms.agents.cache import CacheMissError, ResponseCache, request_key
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
+from delphi_llms.agents.retry import InvalidGenerationError, RetryPolicy, call_with_retry
+
+
+def _payload(seed: int) -> dict:
+    return {"model": "qwen3-4b", "prompt": "p", "stream": False, "options": {"seed": seed}}
+
+
+def test_response_cache_counts_hits_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    with ResponseCache(tmp_path / "cache.sqlite", max_entries=2) as cache:
+        assert cache.get(_payload(1)) is None
+        for seed in (1, 2, 3):
+            cache.put(_payload(seed), {"response": str(seed)})
+        assert cache.get(_payload(1)) == {"response": "1"}
+        assert cache.evict() == 1
+        assert cache.get(_payload(2)) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    assert request_key({**_payload(1), "keep_alive": "30m"}) == request_key(_payload(1))
+    assert request_key(_payload(1)) != request_key(_payload(2))
+
+
+def test_replay_mode_never_writes_and_raises_on_miss(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    with ResponseCache(path) as cache:
+        cache.put(_payload(1), {"response": "1"})
+
+    replay = pickle.loads(pickle.dumps(ResponseCache(path, read_only=True)))
+    assert replay.get(_payload(1)) == {"response": "1"}
+    replay.put(_payload(2), {"response": "2"})
+    with pytest.raises(CacheMissError):
+        replay.get(_payload(2))
+    replay.close()
+
+
+def test_call_ollama_expert_serves_repeats_from_cache_and_skips_bad_output(tmp_path: Path) -> None:
+    bodies = iter(
+        [
+            {"response": "not json"},
+            {"response": json.dumps({"rating": 8, "category": "include"})},
+        ]
+    )
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=next(bodies))
+
+    kwargs = {
+        "model": "qwen3-4b",
+        "ollama_host": "http://ollama:11434",
+        "item_id": "i1",
+        "item_text": "Item 1",
+        "round_number": 1,
+        "expert_id": "e1",
+        "seed": 11,
+    }
+    with (
+        ResponseCache(tmp_path / "cache.sqlite") as cache,
+        httpx.Client(transport=httpx.MockTransport(handler)) as client,
+    ):
+        with pytest.raises(InvalidGenerationError):
+            ollama.call_ollama_expert(client=client, cache=cache, **kwargs)
+        first = ollama.call_ollama_expert(client=client, cache=cache, **kwargs)
+        second = ollama.call_ollama_expert(client=client, cache=cache, **kwargs)
+
+    assert first == second
+    assert len(requests) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_replay_serves_requests_that_were_reseeded_while_recording(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    policy = RetryPolicy(max_attempts=20, base_delay=0.0)
+    requests = [
+        {
+            "model": "qwen3-4b",
+            "item_id": str(idx),
+            "item_text": f"Item {idx}",
+            "round_number": 1,
+            "expert_id": "expert_1",
+            "seed": 11,
+        }
+        for idx in range(10)
+    ]
+    with (
+        MockOllamaServer(MockProfile(latency_ms=0.0, malformed_rate=0.5, seed=3)) as server,
+        ResponseCache(path) as cache,
+    ):
+        recorded = [
+            call_with_retry(
+                ollama.call_ollama_expert,
+                policy=policy,
+                ollama_host=server.url,
+                cache=cache,
+                **request,
+            )
+            for request in requests
+        ]
+        assert server.requests > len(requests)
+
+    with ResponseCache(path, read_only=True) as replay:
+        replayed = [
+            call_with_retry(
+                ollama.call_ollama_expert,
+                policy=policy,
+                ollama_host="http://unreachable.invalid",
+                cache=replay,
+                **request,
+            )
+            for request in requests
+        ]
+    assert replayed == recorded
@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+from delphi_llms.agents.retry import (
+    InvalidGenerationError,
+    RetryPolicy,
+    RetryStats,
+    call_with_retry,
+    call_with_retry_async,
+)
+from delphi_llms.instrumentation import CallRecorder, ollama_call_metrics, record_call
+
+NO_WAIT = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0)
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://ollama/api/generate")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+def test_call_with_retry_recovers_from_transient_errors() -> None:
+    failures = [_status_error(503), httpx.ReadTimeout("slow")]
+    stats = RetryStats()
+
+    def call(*, model: str, seed: int) -> dict:
+        if failures:
+            raise failures.pop(0)
+        return {"seed": seed}
+
+    assert call_with_retry(call, policy=NO_WAIT, stats=stats, model="m", seed=11) == {"seed": 11}
+    assert stats.snapshot() == {"m": {"retries": 2, "exhausted": 0}}
+
+
+def test_call_with_retry_reseeds_invalid_generations() -> None:
+    seeds: list[int] = []
+
+    def call(*, model: str, seed: int) -> dict:
+        seeds.append(seed)
+        if len(seeds) < 3:
+            raise InvalidGenerationError("missing rating")
+        return {"rating": 7}
+
+    assert call_with_retry(call, policy=NO_WAIT, model="m", seed=11) == {"rating": 7}
+    assert seeds == [11, 12, 13]
+
+
+def test_call_metrics_record_the_seed_and_attempt_that_succeeded() -> None:
+    def call(*, model: str, seed: int) -> dict:
+        if seed < 13:
+            raise InvalidGenerationError("missing rating")
+        metrics = ollama_call_metrics(
+            kind="expert", model=model, body={}, latency_ms=1.0, cached=False, seed=seed
+        )
+        record_call(metrics)
+        return {"rating": 7}
+
+    with CallRecorder() as recorder:
+        call_with_retry(call, policy=NO_WAIT, model="m", seed=11)
+
+    [call_metrics] = recorder.calls
+    assert (call_metrics["seed"], call_metrics["attempt"]) == (13, 3)
+
+
+def test_call_with_retry_gives_up_on_client_errors_and_exhaustion() -> None:
+    calls: list[int] = []
+    stats = RetryStats()
+
+    def rejected(*, model: str) -> None:
+        calls.append(1)
+        raise _status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry(rejected, policy=NO_WAIT, stats=stats, model="m")
+    assert len(calls) == 1
+
+    def broken(*, model: str) -> None:
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        call_with_retry(broken, policy=NO_WAIT, stats=stats, model="m")
+    assert stats.snapshot() == {"m": {"retries": 2, "exhausted": 1}}
+
+
+def test_call_with_retry_async_respects_deadline() -> None:
+    calls: list[int] = []
+    policy = RetryPolicy(max_attempts=10, base_delay=5.0, max_delay=5.0, deadline=0.0)
+
+    async def call(*, model: str) -> None:
+        calls.append(1)
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(call_with_retry_async(call, policy=policy, model="m"))
+    assert len(calls) == 1
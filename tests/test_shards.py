@@ -0,0 +1,127 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
+from delphi_llms.cli import app
+from delphi_llms.delphi.engine import run_standard_delphi
+from delphi_llms.delphi.events import read_events
+from delphi_llms.delphi.shards import canonical_events, merge_shards, shard_dir, shard_items
+
+ITEMS = [{"item_id": str(idx), "item_text": f"Q{idx}"} for idx in range(1, 8)]
+
+
+def _call_expert(*, item_id: str, round_number: int, seed: int, **kwargs) -> dict:
+    rating = 8 if int(item_id) % 3 == 0 or round_number > 1 else seed % 9 + 1
+    return {"rating": rating, "category": "include" if rating >= 7 else "maybe"}
+
+
+def _without_metrics(events: list[dict]) -> list[dict]:
+    return [{k: v for k, v in event.items() if k != "metrics"} for event in events]
+
+
+def _write_run(run_dir: Path, items: list[dict]) -> dict:
+    result = run_standard_delphi(
+        items=items, expert_seeds=[1, 5, 8], n_max=3, call_expert=_call_expert
+    )
+    run_dir.mkdir(parents=True)
+    # Round blocks in reverse, as a run that finished its rounds out of order wrote them.
+    blocks: dict[tuple[str, int], list[dict]] = {}
+    for event in result["event_log"]:
+        blocks.setdefault((event["item_id"], event["round"]), []).append(event)
+    (run_dir / "events.jsonl").write_text(
+        "".join(json.dumps(e) + "\n" for block in reversed(blocks.values()) for e in block),
+        encoding="utf-8",
+    )
+    (run_dir / "summary.json").write_text(
+        json.dumps(result["item_results"], indent=2), encoding="utf-8"
+    )
+    (run_dir / "config.json").write_text(json.dumps({"model": "m"}), encoding="utf-8")
+    return result
+
+
+def test_merge_shards_rebuilds_the_single_process_run(tmp_path: Path) -> None:
+    assert [item["item_id"] for item in shard_items(ITEMS, index=1, count=3)] == ["2", "5"]
+    single = run_standard_delphi(
+        items=ITEMS, expert_seeds=[1, 5, 8], n_max=3, call_expert=_call_expert
+    )
+    run_dir = tmp_path / "run-1"
+    for index in range(3):
+        items = shard_items(ITEMS, index=index, count=3)
+        _write_run(shard_dir(run_dir, index=index, count=3), items)
+
+    paths = merge_shards(run_dir, count=3)
+
+    merged_summary = json.loads(paths["summary"].read_text(encoding="utf-8"))
+    assert merged_summary == single["item_results"]
+    merged_events = read_events(paths["events"])
+    assert _without_metrics(merged_events) == _without_metrics(single["event_log"])
+    assert json.loads(paths["config"].read_text(encoding="utf-8")) == {"model": "m", "shards": 3}
+
+    (shard_dir(run_dir, index=2, count=3) / "summary.json").unlink()
+    with pytest.raises(FileNotFoundError, match="shard-2-of-3"):
+        merge_shards(run_dir, count=3)
+
+
+def test_sharded_cli_run_matches_a_single_process_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    summary = pd.DataFrame(
+        {
+            "item_col": [item["item_id"] for item in ITEMS],
+            "item_text": [item["item_text"] for item in ITEMS],
+        }
+    )
+    monkeypatch.setattr(
+        "delphi_llms.cli.parse_round_results_xlsx", lambda path, round_number: (None, summary)
+    )
+    round1 = tmp_path / "round1.xlsx"
+    round1.write_text("x", encoding="utf-8")
+
+    server = MockOllamaServer(MockProfile(latency_ms=1.0, agreement=0.6)).start()
+    try:
+        run_dirs = {}
+        for shards in (1, 3):
+            config = tmp_path / f"experiment-{shards}.yaml"
+            config.write_text(
+                "\n".join(
+                    [
+                        "model: qwen3-4b",
+                        "n_max: 3",
+                        "experts:",
+                        "  seeds: [11, 22, 33]",
+                        "ollama:",
+                        f"  hosts: [{server.url}]",
+                        "  prewarm: false",
+                        "cache:",
+                        '  mode: "off"',
+                        "dataset_paths:",
+                        f"  round1_results: {round1}",
+                        "dataset_cache:",
+                        "  enabled: false",
+                        "outputs:",
+                        f"  run_dir: {tmp_path / f'runs-{shards}'}",
+                        "smoke:",
+                        f"  limit: {len(ITEMS)}",
+                    ]
+                ),
+                encoding="utf-8",
+            )
+            result = CliRunner().invoke(
+                app, ["experiment", "run", "--config", str(config), "--shards", str(shards)]
+            )
+            assert result.exit_code == 0, result.stdout
+            run_dirs[shards] = next((tmp_path / f"runs-{shards}").iterdir())
+    finally:
+        server.stop()
+
+    single, sharded = run_dirs[1], run_dirs[3]
+    assert (sharded / "summary.json").read_bytes() == (single / "summary.json").read_bytes()
+    item_ids = [item["item_id"] for item in ITEMS]
+    assert _without_metrics(read_events(sharded / "events.jsonl")) == _without_metrics(
+        canonical_events(read_events(single / "events.jsonl"), item_ids)
+    )
+    assert len(list((sharded / "shards").iterdir())) == 3
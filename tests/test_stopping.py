@@ -1,4 +1,12 @@
-from delphi_llms.delphi.stopping import has_full_convergence, should_stop
+import pytest
+
+from delphi_llms.delphi.stopping import (
+    StopDecision,
+    StoppingPolicy,
+    decide_round,
+    has_full_convergence,
+    should_stop,
+)
 
 
 def test_has_full_convergence_when_all_categories_match() -> None:
@@ -11,3 +19,33 @@ def test_should_stop_when_max_round_reached_without_convergence() -> None:
     decision = should_stop(categories=categories, current_round=10, n_max=10)
     assert decision.stop is True
     assert decision.reason == "max_rounds_reached"
+
+
+def test_decide_round_waits_for_the_panel_under_the_default_policy() -> None:
+    kwargs = {"panel_size": 5, "current_round": 1, "n_max": 10}
+    assert decide_round(["include", "exclude"], **kwargs) is None
+    assert decide_round(["include"] * 5, **kwargs) == StopDecision(stop=True, reason="converged")
+
+
+def test_decide_round_early_continue_and_quorum() -> None:
+    early = StoppingPolicy(early_continue=True)
+    partial = ["include", "exclude"]
+    assert decide_round(partial, panel_size=5, current_round=1, n_max=3, policy=early) == (
+        StopDecision(stop=False, reason="continue")
+    )
+    # The last round needs every vote for the majority fallback.
+    assert decide_round(partial, panel_size=5, current_round=3, n_max=3, policy=early) is None
+
+    quorum = StoppingPolicy(early_continue=True, quorum=0.6)
+    kwargs = {"panel_size": 5, "current_round": 1, "n_max": 3, "policy": quorum}
+    # Three of five can still agree, so the round keeps waiting.
+    assert decide_round(["include", "include", "exclude"], **kwargs) is None
+    assert decide_round(["include", "exclude", "include", "include"], **kwargs) == StopDecision(
+        stop=True, reason="quorum_reached"
+    )
+    strict = StoppingPolicy(early_continue=True, quorum=0.8)
+    assert decide_round(
+        ["include", "exclude", "maybe"], panel_size=5, current_round=1, n_max=3, policy=strict
+    ) == StopDecision(stop=False, reason="continue")
+    with pytest.raises(ValueError, match="quorum"):
+        StoppingPolicy(quorum=0.5)
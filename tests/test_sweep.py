@@ -0,0 +1,48 @@
+import pytest
+
+from delphi_llms.sweep import expand_grid, group_by_model, resolve_config
+
+BASE = {
+    "model": "base-model",
+    "mode": "standard",
+    "n_max": 10,
+    "experts": {"count": 3, "seeds": [1, 2, 3]},
+    "facilitator": {"model": "base-model"},
+    "concurrency": {"backend": "process", "max_workers": 2, "max_in_flight": 4},
+}
+
+
+def test_expand_grid_keeps_each_model_contiguous_and_resolves_configs() -> None:
+    grid = {
+        "models": ["qwen3:4b", "llama3.2:3b"],
+        "seed_sets": [[11, 22], [33, 44, 55]],
+        "n_max": [3, 5],
+        "modes": ["standard", "recursive"],
+    }
+    runs = expand_grid(grid, BASE)
+
+    assert len(runs) == 16
+    assert [run.index for run in runs] == list(range(1, 17))
+    assert [model for model, _ in group_by_model(runs)] == ["qwen3:4b", "llama3.2:3b"]
+    assert [run.model for run in runs] == ["qwen3:4b"] * 8 + ["llama3.2:3b"] * 8
+    assert len({run.name for run in runs}) == 16
+    assert runs[0].name == "run-001-qwen3-4b-standard-n3-s1"
+
+    resolved = resolve_config(BASE, runs[-1], max_workers=6, facilitator_model=None)
+    assert resolved["model"] == resolved["facilitator"]["model"] == "llama3.2:3b"
+    assert [resolved["mode"], resolved["n_max"]] == ["recursive", 5]
+    assert resolved["experts"] == {"count": 3, "seeds": [33, 44, 55]}
+    assert resolved["concurrency"] == {"backend": "thread", "max_workers": 6, "max_in_flight": 4}
+    assert BASE["model"] == "base-model"
+
+
+def test_expand_grid_falls_back_to_base_config_and_rejects_bad_modes() -> None:
+    runs = expand_grid({"n_max": [2, 4]}, BASE)
+    assert [(run.model, run.mode, run.n_max, run.seeds) for run in runs] == [
+        ("base-model", "standard", 2, (1, 2, 3)),
+        ("base-model", "standard", 4, (1, 2, 3)),
+    ]
+    with pytest.raises(ValueError, match="modes"):
+        expand_grid({"modes": ["parallel"]}, BASE)
+    with pytest.raises(ValueError, match="must not be empty"):
+        expand_grid({"models": []}, BASE)
@@ -0,0 +1,45 @@
+from functools import partial
+from pathlib import Path
+
+from delphi_llms.agents.cache import ResponseCache
+from delphi_llms.agents.mock_ollama import MockOllamaServer, MockProfile
+from delphi_llms.agents.ollama import call_ollama_expert
+from delphi_llms.agents.retry import RetryPolicy, RetryStats, call_with_retry
+from delphi_llms.agents.workers import OllamaWorkerBackend, WorkerRetryStats, worker_call
+
+
+def _client_id(*, client, cache) -> int:  # type: ignore[no-untyped-def]
+    return id(client)
+
+
+def test_worker_backend_pools_one_client_and_reports_counters(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "responses.sqlite")
+    stats = RetryStats()
+    with MockOllamaServer(MockProfile(latency_ms=0.0, error_rate=0.3)) as server:
+        call = partial(
+            call_with_retry,
+            partial(worker_call, call_ollama_expert),
+            policy=RetryPolicy(max_attempts=20, base_delay=0.0),
+            stats=WorkerRetryStats(),
+            model="qwen3-4b",
+            ollama_host=server.url,
+        )
+        kwargs = [
+            {"item_id": str(i), "item_text": "Item", "round_number": 1, "expert_id": "e", "seed": i}
+            for i in range(6)
+        ]
+        with OllamaWorkerBackend(1, client_settings={}, cache=cache, retry_stats=stats) as backend:
+            clients = {backend.submit(worker_call, _client_id).result() for _ in range(3)}
+            first = [backend.submit(call, **kw).result() for kw in kwargs]
+            again = [backend.submit(call, **kw).result() for kw in kwargs]
+        requests = server.requests
+
+    assert len(clients) == 1
+    assert again == first
+    retries = stats.snapshot().get("qwen3-4b", {}).get("retries", 0)
+    assert requests == len(kwargs) + retries
+    # The cache is consulted before every attempt, retries included.
+    assert cache.stats()["misses"] == requests
+    assert cache.stats()["hits"] == len(kwargs)
+    assert cache.stats()["stores"] == len(kwargs)
+    cache.close()